@@ -57,8 +57,12 @@ echo "Version bumped from $CURRENT_VERSION to $NEW_VERSION"
 echo "Generating tools README for src/universal_mcp_trello/app.py..."
 universal_mcp readme src/universal_mcp_trello/app.py
 
+# Regenerate the tool manifest (tools.json) the server registers tools from
+echo "Generating tool manifest..."
+python -m universal_mcp_trello.manifest
+
 # Stage the changed file
-git add pyproject.toml src/universal_mcp_trello/README.md
+git add pyproject.toml src/universal_mcp_trello/README.md src/universal_mcp_trello/tools.json
 
 # Commit the change
 git commit -m "bump: version $CURRENT_VERSION → $NEW_VERSION"
@@ -0,0 +1,86 @@
+import asyncio
+import contextvars
+import functools
+import importlib.util
+import inspect
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+from universal_mcp.integrations import Integration
+
+from universal_mcp_trello.app import TrelloApp
+
+
+class AsyncTrelloApp(TrelloApp):
+    """TrelloApp whose tools are coroutines sharing one pooled HTTP/2 client.
+
+    Each tool call is dispatched to a bounded worker pool, so an MCP server
+    running a single event loop can keep many Trello round-trips in flight at
+    once. All workers share one keep-alive connection pool; when the optional
+    ``h2`` package is installed the pool negotiates HTTP/2 and multiplexes
+    concurrent requests over a handful of connections.
+    """
+
+    def __init__(
+        self,
+        integration: Integration = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        max_concurrency: int = 32,
+        **kwargs,
+    ) -> None:
+        super().__init__(integration=integration, **kwargs)
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="trello"
+        )
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        # Workers reach for the client concurrently; only one may create it.
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        headers=self._get_headers(),
+                        timeout=self.default_timeout,
+                        limits=self.limits,
+                        http2=self.http2,
+                    )
+        return self._client
+
+    def _to_async(self, tool: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(tool)
+        async def run(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            # Keep the server's trace context, so tool spans nest under its spans.
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, tool, *args, **kwargs)
+            )
+
+        # wraps() copies an endpoint tool's unbound __signature__, self included.
+        run.__signature__ = inspect.signature(tool)
+        return run
+
+    def list_tools(self):
+        return [self._to_async(tool) for tool in super().list_tools()]
+
+    def close(self) -> None:
+        """Shut down the worker pool and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        if self._client is not None:
+            self._client.close()
+            self._client = None
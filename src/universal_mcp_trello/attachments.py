@@ -0,0 +1,238 @@
+"""Downloading attachment contents.
+
+:func:`fetch_into` streams a response body into a binary file and, when the
+connection drops, asks for the rest with an HTTP ``Range`` request instead of
+starting over. :class:`AttachmentStore` keeps downloaded files on disk under
+their SHA-256, so identical files are stored once, and maps attachment ids to
+them in an SQLite index. Attachments never change once uploaded, so a stored
+file is served without contacting Trello. The least recently used files are
+evicted beyond ``max_bytes``.
+
+Only files uploaded to Trello are downloaded (:func:`download_url`): a link
+attachment's URL can name any host, including internal ones, and the
+request would carry the app's credentials. Credentials are sent only to
+:data:`TRELLO_HOSTS` (see :func:`is_trello_url`).
+"""
+
+import contextlib
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+from urllib.parse import urlsplit
+
+import httpx
+
+CHUNK_SIZE = 256 * 1024
+
+# Hosts that are sent the app's credentials when downloading.
+TRELLO_HOSTS = frozenset({"trello.com", "api.trello.com"})
+
+_DOWNLOAD_PATH = re.compile(r"^/1/cards/[^/]+/attachments/[^/]+/download/[^/]")
+
+
+class StoredFile(NamedTuple):
+    path: Path
+    sha256: str
+    size: int
+
+
+def is_trello_url(url: str | httpx.URL) -> bool:
+    """Whether ``url`` is an HTTPS URL on one of :data:`TRELLO_HOSTS`."""
+    parts = urlsplit(str(url))
+    return parts.scheme == "https" and parts.hostname in TRELLO_HOSTS
+
+
+def download_url(attachment: Any) -> str:
+    """The URL to fetch an uploaded attachment from, given its metadata.
+
+    Raises:
+        ValueError: If the attachment is a link rather than an uploaded
+            file, or its URL is not a Trello attachment download URL.
+    """
+    attachment_id = attachment.get("id") if isinstance(attachment, dict) else None
+    if not isinstance(attachment, dict) or not attachment.get("isUpload"):
+        raise ValueError(
+            f"Attachment '{attachment_id}' is a link, not an uploaded file; "
+            "only uploaded files can be downloaded."
+        )
+    url = attachment.get("url")
+    if not isinstance(url, str) or not is_trello_url(url):
+        raise ValueError(f"Attachment '{attachment_id}' is not hosted by Trello.")
+    if not _DOWNLOAD_PATH.match(urlsplit(url).path):
+        raise ValueError(f"Attachment '{attachment_id}' has no download URL.")
+    return url
+
+
+def fetch_into(
+    open_response: Callable[[dict[str, str]], httpx.Response],
+    out: BinaryIO,
+    offset: int = 0,
+    retries: int = 3,
+    progress: Callable[[int, int | None], None] | None = None,
+) -> int:
+    """Write a download to ``out``, resuming with Range requests after failures.
+
+    Args:
+        open_response: Sends the GET with the given extra headers and returns
+            the response unread (``stream=True``).
+        out: Where the bytes go; positioned after the first ``offset`` bytes
+            of the file, which are already there.
+        offset: How many bytes a previous attempt already wrote.
+        retries: How many dropped connections to resume from.
+        progress: Called as ``progress(received, total)`` after each chunk.
+
+    Returns:
+        The size of the complete file.
+    """
+    failures = 0
+    while True:
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            with contextlib.closing(open_response(headers)) as response:
+                if offset and response.status_code == 416:
+                    return offset  # nothing left to fetch
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    # The server ignored the range and is sending the whole file.
+                    out.seek(out.tell() - offset)
+                    out.truncate()
+                    offset = 0
+                total = _total_size(response, offset)
+                for chunk in response.iter_raw():  # unbuffered, so a drop loses nothing
+                    out.write(chunk)
+                    offset += len(chunk)
+                    if progress is not None:
+                        progress(offset, total)
+                return offset
+        except httpx.TransportError:
+            failures += 1
+            if failures > retries:
+                raise
+
+
+def _total_size(response: httpx.Response, offset: int) -> int | None:
+    content_range = response.headers.get("content-range", "")
+    if "/" in content_range and not content_range.endswith("*"):
+        return int(content_range.rsplit("/", 1)[1])
+    length = response.headers.get("content-length")
+    return offset + int(length) if length is not None else None
+
+
+def file_sha256(path: str | os.PathLike) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class AttachmentStore:
+    """Content-addressed on-disk store of attachment contents with LRU eviction.
+
+    Args:
+        directory: Where files and the index are kept; created if missing.
+        max_bytes: Total size of stored files above which the least recently
+            used are deleted.
+    """
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 1 << 30) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+        (self.directory / "partial").mkdir(exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite3", check_same_thread=False
+        )
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS blobs"
+                " (sha256 TEXT PRIMARY KEY, size INTEGER, used_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS blobs_used ON blobs (used_at)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS refs (key TEXT PRIMARY KEY, sha256 TEXT)"
+            )
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.directory / "objects" / sha256[:2] / sha256
+
+    def partial_path(self, key: str) -> Path:
+        """Where an unfinished download of ``key`` is kept between attempts."""
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / "partial" / f"{name}.part"
+
+    def get(self, key: str) -> StoredFile | None:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT blobs.sha256, blobs.size FROM refs JOIN blobs USING (sha256)"
+                " WHERE refs.key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            sha256, size = row
+            path = self.blob_path(sha256)
+            if not path.exists():
+                self._forget(sha256)
+                return None
+            self._db.execute(
+                "UPDATE blobs SET used_at = ? WHERE sha256 = ?", (time.time(), sha256)
+            )
+        return StoredFile(path, sha256, size)
+
+    def put(self, key: str, source: str | os.PathLike) -> StoredFile:
+        """Move the finished download at ``source`` into the store under ``key``."""
+        sha256 = file_sha256(source)
+        path = self.blob_path(sha256)
+        path.parent.mkdir(exist_ok=True)
+        size = os.path.getsize(source)
+        if path.exists():
+            os.unlink(source)
+        else:
+            os.replace(source, path)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?)",
+                (sha256, size, time.time()),
+            )
+            self._db.execute("INSERT OR REPLACE INTO refs VALUES (?, ?)", (key, sha256))
+            self._evict(keep=sha256)
+        return StoredFile(path, sha256, size)
+
+    def _evict(self, keep: str) -> None:
+        query = "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        (total,) = self._db.execute(query).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute(
+            "SELECT sha256, size FROM blobs WHERE sha256 != ? ORDER BY used_at", (keep,)
+        ).fetchall()
+        for sha256, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.blob_path(sha256).unlink(missing_ok=True)
+            self._forget(sha256)
+            total -= size
+
+    def _forget(self, sha256: str) -> None:
+        self._db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        self._db.execute("DELETE FROM refs WHERE sha256 = ?", (sha256,))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            files, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return {"files": files, "bytes": size, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        self._db.close()
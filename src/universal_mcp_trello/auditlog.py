@@ -0,0 +1,137 @@
+"""Incremental ingestion of an Enterprise audit log into a local file.
+
+Each :meth:`AuditLogIngester.run` fetches only the entries newer than the
+high-water mark left by the previous run, and appends them oldest first to
+a JSON Lines file. The file is gzip-compressed when its name ends in
+``.gz``, with each run adding one gzip member. The mark and the committed
+size of the log are kept in ``<log>.state.json``. A run interrupted after
+appending but before saving the mark is rolled back to the committed size
+and fetched again, so no entry is written twice.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from array import array
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from universal_mcp_trello.codec import dumps, loads
+
+if TYPE_CHECKING:
+    from universal_mcp_trello.app import TrelloApp
+
+
+@dataclass
+class IngestResult:
+    enterprise_id: str
+    appended: int
+    cursor: str | None
+
+
+class AuditLogIngester:
+    """Appends new audit-log entries of one Enterprise to a local log on each run.
+
+    Entries are spooled to a temporary file while the log is paged newest
+    first, then appended in chronological order, so memory stays bounded by
+    the page size however many entries a run fetches. Entries repeated across
+    page boundaries are dropped by action id.
+
+    Args:
+        app: The app used to talk to Trello.
+        enterprise_id: The Enterprise whose log is ingested.
+        path: The JSON Lines log file; gzip-compressed if it ends in ``.gz``.
+        page_size: Entries fetched per request (at most 1000).
+    """
+
+    def __init__(
+        self,
+        app: "TrelloApp",
+        enterprise_id: str,
+        path: str | os.PathLike,
+        page_size: int = 1000,
+    ) -> None:
+        self.app = app
+        self.enterprise_id = enterprise_id
+        self.path = Path(path)
+        self.state_path = self.path.with_name(self.path.name + ".state.json")
+        self.page_size = page_size
+
+    def run(self) -> IngestResult:
+        """Fetch and append everything newer than the high-water mark."""
+        cursor, committed = self._load_state()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size > committed:
+            os.truncate(self.path, committed)  # drop an unrecorded partial run
+        with tempfile.TemporaryFile(dir=self.path.parent) as spool:
+            offsets, newest = self._spool(cursor, spool)
+            if not offsets:
+                return IngestResult(self.enterprise_id, 0, cursor)
+            with self._open_log() as log:
+                for offset in reversed(offsets):
+                    spool.seek(offset)
+                    log.write(spool.readline())
+        self._save_state(newest, self.path.stat().st_size)
+        return IngestResult(self.enterprise_id, len(offsets), newest)
+
+    def _spool(self, cursor: str | None, spool: IO[bytes]) -> tuple[array, str | None]:
+        offsets, newest = array("q"), None
+        # Ids of the last two pages: repeats can only straddle a page boundary.
+        recent: deque[str] = deque()
+        seen: set[str] = set()
+        repeats = 0
+        entries = self.app.iter_enterprises_id_auditlog(
+            self.enterprise_id, since=cursor, limit=self.page_size
+        )
+        for entry in entries:
+            entry_id = entry["id"]
+            if entry_id == cursor:
+                break  # reached the previous run's newest entry
+            if entry_id in seen:
+                repeats += 1
+                if repeats >= self.page_size:
+                    break  # a whole page again: the log is not advancing
+                continue
+            repeats = 0
+            recent.append(entry_id)
+            seen.add(entry_id)
+            if len(recent) > 2 * self.page_size:
+                seen.discard(recent.popleft())
+            newest = newest or entry_id
+            offsets.append(spool.tell())
+            spool.write(dumps(entry) + b"\n")
+        return offsets, newest
+
+    def _open_log(self) -> IO[bytes]:
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, "ab")
+        return open(self.path, "ab")
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the logged entries, oldest first."""
+        if not self.path.exists():
+            return
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "rb") as log:
+            for line in log:
+                yield loads(line)
+
+    def _load_state(self) -> tuple[str | None, int]:
+        if self.state_path.exists():
+            state = json.loads(self.state_path.read_text())
+            return state["cursor"], state["size"]
+        # No state yet: resume after the last logged entry, if any.
+        last = None
+        for last in self.entries():
+            pass
+        size = self.path.stat().st_size if self.path.exists() else 0
+        return (last["id"] if last else None), size
+
+    def _save_state(self, cursor: str | None, size: int) -> None:
+        tmp = self.state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"cursor": cursor, "size": size}))
+        tmp.replace(self.state_path)
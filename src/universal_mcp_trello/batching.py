@@ -0,0 +1,181 @@
+import contextvars
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any
+from urllib.parse import quote, urlencode
+
+import httpx
+
+from universal_mcp_trello.codec import dumps, loads
+
+MAX_BATCH_ROUTES = 10
+
+# Batcher of the ``TrelloApp.batch()`` scope the current call runs in.
+active_batcher: contextvars.ContextVar["GetBatcher | None"] = contextvars.ContextVar(
+    "trello_batcher", default=None
+)
+
+
+def to_route(base_url: str, url: str, params: dict[str, Any] | None = None) -> str | None:
+    """Convert an absolute API URL into a ``/batch`` route, or None if it can't be.
+
+    Query values are fully percent-encoded so that commas inside them do not
+    collide with the comma separating routes in the ``urls`` parameter.
+    """
+    if not url.startswith(base_url):
+        return None
+    route = url[len(base_url) :] or "/"
+    if not route.startswith("/") or route.startswith("/batch"):
+        return None
+    if params:
+        items = [(k, _format_param(v)) for k, v in params.items()]
+        route = f"{route}?{urlencode(items, quote_via=quote, safe='')}"
+    return route
+
+
+def _format_param(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list | tuple):
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+
+def _to_response(entry: dict[str, Any], request: httpx.Request) -> httpx.Response:
+    """Build the response a single route would have returned from a /batch entry."""
+    if len(entry) == 1:
+        [(status, body)] = entry.items()
+        if status.isdigit():
+            return httpx.Response(int(status), content=dumps(body), request=request)
+    status_code = entry.get("statusCode", 500)
+    return httpx.Response(status_code, content=dumps(entry), request=request)
+
+
+class GetBatcher:
+    """Coalesces concurrent GET requests into Trello ``/batch`` calls.
+
+    Callers block in :meth:`submit` while their route waits in a queue. The
+    queue is flushed as one ``/batch`` request as soon as it holds
+    ``MAX_BATCH_ROUTES`` routes or ``window`` seconds after the first route
+    arrived, whichever comes first, and each caller receives the response for
+    its own route.
+
+    Args:
+        send: Performs a plain (un-batched) GET; called as ``send(url, params)``.
+        base_url: The API root that routes are taken relative to.
+        window: Seconds to wait for more routes before flushing a partial batch.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, dict[str, Any] | None], httpx.Response],
+        base_url: str,
+        window: float = 0.05,
+    ) -> None:
+        self._send = send
+        self.base_url = base_url
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, httpx.Request, Future]] = []
+        self._timer: threading.Timer | None = None
+
+    def submit(self, url: str, params: dict[str, Any] | None = None) -> httpx.Response | None:
+        """Queue a GET and wait for its response.
+
+        Returns None if the URL cannot be expressed as a batch route, in which
+        case the caller should send it directly.
+        """
+        route = to_route(self.base_url, url, params)
+        if route is None:
+            return None
+        future: Future = Future()
+        request = httpx.Request("GET", url, params=params)
+        with self._lock:
+            self._pending.append((route, request, future))
+            if len(self._pending) >= MAX_BATCH_ROUTES:
+                ready = self._take()
+            else:
+                ready = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if ready:
+            self._dispatch(ready)
+        return future.result()
+
+    def flush(self) -> None:
+        """Send everything currently queued without waiting for the window."""
+        while True:
+            with self._lock:
+                ready = self._take()
+            if not ready:
+                return
+            self._dispatch(ready)
+
+    def _take(self) -> list[tuple[str, httpx.Request, Future]]:
+        ready = self._pending[:MAX_BATCH_ROUTES]
+        del self._pending[:MAX_BATCH_ROUTES]
+        if not self._pending and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return ready
+
+    def _dispatch(self, ready: list[tuple[str, httpx.Request, Future]]) -> None:
+        try:
+            if len(ready) == 1:
+                _, request, future = ready[0]
+                future.set_result(self._send(str(request.url), None))
+                return
+            response = self._send(
+                f"{self.base_url}/batch", {"urls": ",".join(route for route, _, _ in ready)}
+            )
+            entries = loads(response.content)
+            if not isinstance(entries, list) or len(entries) != len(ready):
+                raise ValueError("Unexpected /batch response shape.")
+            for (_, request, future), entry in zip(ready, entries, strict=True):
+                future.set_result(_to_response(entry, request))
+        except Exception as exc:
+            for _, _, future in ready:
+                if not future.done():
+                    future.set_exception(exc)
+
+
+class BatchScope:
+    """Handle returned by ``TrelloApp.batch()``.
+
+    Tool calls passed to :meth:`submit` run concurrently on a small worker
+    pool so that their GET requests land in the same ``/batch`` calls.
+    """
+
+    def __init__(self, max_workers: int = MAX_BATCH_ROUTES) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trello-batch")
+
+    def submit(self, tool: Callable[..., Any], *args, **kwargs) -> Future:
+        """Schedule ``tool(*args, **kwargs)`` and return a future for its result."""
+        # Calls run in the caller's context, so their trace spans nest under its span.
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, tool, *args, **kwargs)
+
+    def map(self, tool: Callable[..., Any], *iterables) -> Iterator[Any]:
+        """Like :func:`map`, with calls coalesced into batches."""
+        context = contextvars.copy_context()
+        return self._executor.map(lambda *args: context.copy().run(tool, *args), *iterables)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+@contextmanager
+def batch_scope(batcher: GetBatcher, max_workers: int = MAX_BATCH_ROUTES) -> Iterator[BatchScope]:
+    # Only this context, and the calls submitted from it, batch their GETs.
+    token = active_batcher.set(batcher)
+    scope = BatchScope(max_workers=max_workers)
+    try:
+        yield scope
+    finally:
+        scope.close()
+        active_batcher.reset(token)
+        batcher.flush()
@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from universal_mcp_trello.ratelimit import LIMIT_INTERVAL, TOKEN_LIMIT
+
+# One token may send this many requests a second; more workers than that only
+# queue behind the rate limiter.
+MAX_WORKERS = int(TOKEN_LIMIT / LIMIT_INTERVAL)
+
+# A named request of an operation, e.g. ("addLabel:abc", <partial>).
+Step = tuple[str, Callable[[], Any]]
+
+
+def op_key(op: dict[str, Any]) -> str:
+    """Stable identity of an operation, used to recognise it when resuming."""
+    return hashlib.sha1(json.dumps(op, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class BulkJournal:
+    """Append-only record of completed operations, for resuming after a crash.
+
+    Each line of the file is the :func:`op_key` of an operation that
+    succeeded, or ``<op_key>:<step>`` for one of its steps. Re-running the
+    same batch with the same journal skips them.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.completed: set[str] = set()
+        if os.path.exists(path):
+            with open(path) as f:
+                self.completed = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.completed
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            self.completed.add(key)
+            with open(self.path, "a") as f:
+                f.write(key + "\n")
+
+
+def run_bulk(
+    ops: Iterable[dict[str, Any]],
+    steps: Callable[[dict[str, Any]], Iterable[Step]],
+    max_workers: int = 8,
+    journal: BulkJournal | None = None,
+) -> dict[str, Any]:
+    """Run every operation's steps, operations concurrently, and report each outcome.
+
+    ``steps(op)`` lists the requests of an operation as ``(name, call)``
+    pairs, which are run in order. A failing operation never stops the
+    others. Each step that succeeds is recorded in ``journal``, and so is
+    each operation once all its steps have; a re-run skips both, so an
+    operation that failed part-way resumes after its last completed step.
+    At most :data:`MAX_WORKERS` operations run at once.
+
+    Returns:
+        A summary with ``succeeded``, ``failed`` and ``skipped`` counts,
+        per-operation ``results`` in input order, and ``retry``: the failed
+        operations, ready to be submitted again.
+    """
+    ops = list(ops)
+    keys = [op_key(op) for op in ops]
+
+    def run(index: int) -> dict[str, Any]:
+        op, key = ops[index], keys[index]
+        outcome = {"index": index, "id": op.get("id")}
+        if journal is not None and key in journal:
+            return {**outcome, "ok": True, "skipped": True}
+        try:
+            for name, call in steps(op):
+                step_key = f"{key}:{name}"
+                if journal is not None and step_key in journal:
+                    continue
+                call()
+                if journal is not None:
+                    journal.record(step_key)
+        except Exception as exc:
+            return {**outcome, "ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        if journal is not None:
+            journal.record(key)
+        return {**outcome, "ok": True}
+
+    with ThreadPoolExecutor(max_workers=min(max(1, max_workers), MAX_WORKERS), thread_name_prefix="trello-bulk") as executor:
+        results = list(executor.map(run, range(len(ops))))
+    skipped = sum(1 for r in results if r.get("skipped"))
+    failed = [r for r in results if not r["ok"]]
+    return {
+        "succeeded": len(results) - len(failed) - skipped,
+        "failed": len(failed),
+        "skipped": skipped,
+        "results": results,
+        "retry": [ops[r["index"]] for r in failed],
+    }
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+from urllib.parse import urlencode
+
+import httpx
+
+# Longest-lived first: board metadata changes rarely, card contents often.
+DEFAULT_TTLS: tuple[tuple[str, float], ...] = (
+    (r"/boards/[^/]+/(labels|customFields|customfields)$", 3600.0),
+    (r"/boards/[^/]+/(lists|members|memberships)$", 300.0),
+    (r"/members/[^/]+$", 600.0),
+    (r"/boards/[^/]+$", 120.0),
+    (r"/(cards|checklists)/", 15.0),
+)
+DEFAULT_TTL = 30.0
+
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+# Trello object ids are 24 hex digits (MongoDB ObjectIds).
+TRELLO_ID = re.compile(r"\b[0-9a-f]{24}\b")
+_TRELLO_ID_BYTES = re.compile(rb"\b[0-9a-f]{24}\b")
+
+
+def collect_ids(value: Any) -> set[str]:
+    """Find every Trello object id in a URL, query string or decoded JSON value."""
+    ids: set[str] = set()
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            ids.update(TRELLO_ID.findall(item))
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list | tuple | set | frozenset):
+            stack.extend(item)
+    return ids
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response plus the validators needed to revalidate it."""
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+    ids: frozenset[str] = frozenset()
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            self.status_code, headers=self.headers, content=self.content, request=request
+        )
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def keys_for(self, ids: set[str]) -> set[str]:
+        """Return the keys of every entry that contains any of ``ids``."""
+        ...
+
+
+class MemoryCache:
+    """In-process LRU cache bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._index: dict[str, set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            for object_id in entry.ids:
+                self._index.setdefault(object_id, set()).add(key)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._size > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+            self._size = 0
+
+    def keys_for(self, ids: set[str]) -> set[str]:
+        with self._lock:
+            return set().union(*(self._index.get(object_id, ()) for object_id in ids))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= len(entry.content)
+        for object_id in entry.ids:
+            keys = self._index.get(object_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[object_id]
+
+
+class SQLiteCache:
+    """On-disk cache that survives restarts; evicts least recently used rows."""
+
+    def __init__(self, path: str, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, status_code INTEGER, headers TEXT,"
+                " content BLOB, expires_at REAL, stored_at REAL, used_at REAL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_used ON responses (used_at)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS response_ids (id TEXT, key TEXT)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS response_ids_id ON response_ids (id)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS response_ids_key ON response_ids (key)")
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT status_code, headers, content, expires_at, stored_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+            ids = self._db.execute("SELECT id FROM response_ids WHERE key = ?", (key,)).fetchall()
+        status_code, headers, content, expires_at, stored_at = row
+        return CacheEntry(
+            status_code,
+            json.loads(headers),
+            content,
+            expires_at,
+            stored_at,
+            frozenset(object_id for (object_id,) in ids),
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.expires_at,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self._db.execute("DELETE FROM response_ids WHERE key = ?", (key,))
+            self._db.executemany(
+                "INSERT INTO response_ids VALUES (?, ?)",
+                [(object_id, key) for object_id in entry.ids],
+            )
+            evicted = self._db.execute(
+                "SELECT key FROM responses ORDER BY used_at DESC LIMIT -1 OFFSET ?",
+                (self.max_entries,),
+            ).fetchall()
+            self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            self._db.executemany("DELETE FROM response_ids WHERE key = ?", evicted)
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.execute("DELETE FROM response_ids WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+            self._db.execute("DELETE FROM response_ids")
+
+    def keys_for(self, ids: set[str]) -> set[str]:
+        if not ids:
+            return set()
+        with self._lock:
+            placeholders = ",".join("?" * len(ids))
+            rows = self._db.execute(
+                f"SELECT DISTINCT key FROM response_ids WHERE id IN ({placeholders})",
+                tuple(ids),
+            ).fetchall()
+        return {key for (key,) in rows}
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class TTLPolicy:
+    """Maps an API path to how long its responses stay fresh.
+
+    Rules are ``(regex, seconds)`` pairs matched against the path relative to
+    the API root; the first match wins. A TTL of 0 disables caching.
+    """
+
+    def __init__(
+        self,
+        rules: tuple[tuple[str, float], ...] = DEFAULT_TTLS,
+        default: float = DEFAULT_TTL,
+    ) -> None:
+        self.rules = [(re.compile(pattern), ttl) for pattern, ttl in rules]
+        self.default = default
+
+    def ttl_for(self, path: str) -> float:
+        for pattern, ttl in self.rules:
+            if pattern.search(path):
+                return ttl
+        return self.default
+
+
+def normalize_params(params: Mapping[str, Any] | None) -> str:
+    """Render query params in a canonical order and spelling."""
+    if not params:
+        return ""
+    items = []
+    for key in sorted(params):
+        value = params[key]
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        elif isinstance(value, list | tuple):
+            value = ",".join(str(v) for v in value)
+        items.append((key, str(value)))
+    return urlencode(items)
+
+
+def request_key(method: str, url: str, params: Mapping[str, Any] | None = None) -> str:
+    """Identify a request by method, URL and normalised query params."""
+    query = normalize_params(params)
+    return f"{method.upper()} {url}?{query}" if query else f"{method.upper()} {url}"
+
+
+class ResponseCache:
+    """Caches GET responses keyed on method, URL and normalised query params.
+
+    Fresh entries are served without a request. Stale entries that carry an
+    ``ETag`` or ``Last-Modified`` validator are revalidated with a
+    conditional request, and a ``304 Not Modified`` extends their lifetime.
+
+    Every entry is indexed by the Trello ids found in its URL and body, so a
+    write can evict just the entries that mention the objects it touched
+    (see :meth:`invalidate`) rather than flushing the whole cache.
+
+    Args:
+        backend: Where entries live; defaults to a :class:`MemoryCache`.
+        policy: Per-endpoint freshness lifetimes.
+        base_url: The API root, stripped from URLs before matching ``policy``.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        policy: TTLPolicy | None = None,
+        base_url: str = "https://api.trello.com/1",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend = backend if backend is not None else MemoryCache()
+        self.policy = policy or TTLPolicy()
+        self.base_url = base_url
+        self._clock = clock
+
+    def key(self, method: str, url: str, params: Mapping[str, Any] | None = None) -> str:
+        return request_key(method, url, params)
+
+    def ttl_for(self, url: str) -> float:
+        path = url[len(self.base_url) :] if url.startswith(self.base_url) else url
+        return self.policy.ttl_for(path)
+
+    def lookup(self, key: str) -> tuple[CacheEntry | None, bool]:
+        """Return the entry for ``key`` (if any) and whether it is still fresh."""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+        return entry, entry.is_fresh(self._clock())
+
+    def validators(self, entry: CacheEntry) -> dict[str, str]:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, key: str, url: str, response: httpx.Response) -> CacheEntry | None:
+        ttl = self.ttl_for(url)
+        if response.status_code != 200 or ttl <= 0:
+            return None
+        now = self._clock()
+        headers = {k: response.headers[k] for k in _STORED_HEADERS if k in response.headers}
+        # Scanning the raw body finds the same ids without decoding it.
+        found = {m.decode() for m in _TRELLO_ID_BYTES.findall(response.content)}
+        ids = frozenset(collect_ids(url) | found)
+        entry = CacheEntry(200, headers, response.content, now + ttl, now, ids)
+        self.backend.set(key, entry)
+        return entry
+
+    def refresh(self, key: str, url: str, entry: CacheEntry) -> CacheEntry:
+        """Extend a revalidated entry's lifetime after a 304."""
+        now = self._clock()
+        entry.expires_at = now + self.ttl_for(url)
+        self.backend.set(key, entry)
+        return entry
+
+    def invalidate(self, ids: set[str]) -> int:
+        """Evict every entry that mentions any of ``ids``; returns how many."""
+        keys = self.backend.keys_for(ids)
+        for key in keys:
+            self.backend.delete(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.backend.clear()
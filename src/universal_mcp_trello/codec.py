@@ -0,0 +1,162 @@
+"""JSON encoding and decoding of API payloads.
+
+Bodies are parsed straight from the response bytes with the fastest parser
+installed: ``orjson``, then ``msgspec``, then the standard library. Decoding
+into a type (e.g. ``list[Card]`` from :mod:`universal_mcp_trello.models`) uses
+``msgspec`` when it is installed, which builds the objects without creating
+the intermediate dicts.
+"""
+
+import codecs
+import dataclasses
+import json
+import re
+import typing
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_AFTER_VALUE = frozenset(" \t\n\r,]")
+
+DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if msgspec is not None:
+    DECODE_ERRORS += (msgspec.DecodeError,)
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+elif msgspec is not None:
+    loads = msgspec.json.decode
+    dumps = msgspec.json.encode
+else:
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+
+def convert(value: Any, model: Any) -> Any:
+    """Build ``model`` (a dataclass, or ``list[...]`` of one) from decoded JSON."""
+    if msgspec is not None:
+        return msgspec.convert(value, model)
+    if typing.get_origin(model) is list:
+        [item] = typing.get_args(model)
+        if not isinstance(value, list):
+            raise ValueError(f"Expected an array, got {type(value).__name__}.")
+        return [convert(v, item) for v in value]
+    if dataclasses.is_dataclass(model):
+        if not isinstance(value, dict):
+            raise ValueError(
+                f"Cannot build {model.__name__} from {type(value).__name__}."
+            )
+        names = {f.name for f in dataclasses.fields(model)}
+        try:
+            return model(**{k: v for k, v in value.items() if k in names})
+        except TypeError as exc:
+            raise ValueError(f"Cannot build {model.__name__}: {exc}") from exc
+    return value
+
+
+def decode(data: bytes, model: Any = None) -> Any:
+    """Parse JSON bytes, optionally straight into ``model``."""
+    if model is None:
+        return loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data, type=model)
+    return convert(loads(data), model)
+
+
+def decode_response(response: httpx.Response, model: Any = None) -> Any:
+    """The JSON body of a response, or None if it is empty (e.g. 204) or not JSON.
+
+    A JSON body that does not fit ``model`` raises, rather than reading as None.
+    """
+    content = response.content
+    if response.status_code == 204 or not content or content.isspace():
+        return None
+    if model is not None and msgspec is not None:
+        try:
+            return msgspec.json.decode(content, type=model)
+        except msgspec.ValidationError:
+            raise
+        except msgspec.DecodeError:
+            return None
+    try:
+        value = loads(content)
+    except DECODE_ERRORS:
+        return None
+    return value if model is None else convert(value, model)
+
+
+def iter_array(chunks: Iterable[bytes], model: Any = None) -> Iterator[Any]:
+    """Decode a top-level JSON array incrementally, yielding each element when complete.
+
+    Only the unread part of the current chunk and the element being read are
+    held in memory. A top-level value that is not an array is yielded whole.
+    """
+    chunks = iter(chunks)
+    text = codecs.getincrementaldecoder("utf-8")()
+    scanner = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    state = "open"  # then "first", and "value"/"next" for each element
+    wanted = 0  # unread characters to wait for before retrying an incomplete element
+
+    def more() -> bool:
+        nonlocal buf, pos
+        for chunk in chunks:
+            if chunk:
+                buf, pos = buf[pos:] + text.decode(chunk), 0
+                return True
+        buf, pos = buf[pos:] + text.decode(b"", final=True), 0
+        return False
+
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()
+        if pos == len(buf) or (len(buf) - pos < wanted and not eof):
+            if eof:
+                raise ValueError("Truncated JSON array.")
+            eof = not more()
+            continue
+        char = buf[pos]
+        if state == "open":
+            if char != "[":
+                rest = buf[pos:] + "".join(text.decode(chunk) for chunk in chunks)
+                yield decode((rest + text.decode(b"", final=True)).encode(), model)
+                return
+            pos, state = pos + 1, "first"
+        elif state == "next":
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}.")
+            pos, state = pos + 1, "value"
+        elif state == "first" and char == "]":
+            return
+        else:
+            try:
+                value, end = scanner.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                wanted = 2 * (len(buf) - pos)
+                continue
+            if not eof and (end == len(buf) or buf[end] not in _AFTER_VALUE):
+                # A number cut off by the end of a chunk parses as its prefix.
+                wanted = len(buf) - pos + 1
+                continue
+            pos, state, wanted = end, "next", 0
+            yield value if model is None else convert(value, model)
@@ -0,0 +1,70 @@
+"""Transfer accounting for compressed responses.
+
+Trello compresses JSON bodies when asked to, and action or card dumps shrink
+to a small fraction of their size. httpx already asks for every encoding it
+can decode (gzip and deflate; ``br`` with the ``brotli`` package and ``zstd``
+with ``zstandard`` installed) and decompresses the bodies transparently.
+:class:`TransferStats` records how many bytes crossed the wire against how
+many were decoded, so the saving can be measured.
+"""
+
+import threading
+
+import httpx
+
+
+class TransferStats:
+    """Counts response bytes received on the wire and after decompression.
+
+    Totals are kept overall and per ``Content-Encoding`` (``identity`` for
+    uncompressed bodies). Safe to share between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.responses = 0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.by_encoding: dict[str, dict[str, int]] = {}
+
+    def record(self, response: httpx.Response, body_bytes: int | None = None) -> None:
+        """Add a fully read response.
+
+        Args:
+            response: The response, after its body has been read.
+            body_bytes: Decoded size, for streamed responses whose content
+                was consumed without being kept.
+        """
+        wire = response.num_bytes_downloaded
+        body = len(response.content) if body_bytes is None else body_bytes
+        encoding = response.headers.get("content-encoding", "identity").lower()
+        with self._lock:
+            self.responses += 1
+            self.wire_bytes += wire
+            self.body_bytes += body
+            totals = self.by_encoding.setdefault(
+                encoding, {"responses": 0, "wire_bytes": 0, "body_bytes": 0}
+            )
+            totals["responses"] += 1
+            totals["wire_bytes"] += wire
+            totals["body_bytes"] += body
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(self.body_bytes - self.wire_bytes, 0)
+
+    @property
+    def ratio(self) -> float:
+        """Wire bytes per decoded byte; 1.0 until something is recorded."""
+        return self.wire_bytes / self.body_bytes if self.body_bytes else 1.0
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "responses": self.responses,
+                "wire_bytes": self.wire_bytes,
+                "body_bytes": self.body_bytes,
+                "saved_bytes": self.saved_bytes,
+                "ratio": self.ratio,
+                "by_encoding": {k: dict(v) for k, v in self.by_encoding.items()},
+            }
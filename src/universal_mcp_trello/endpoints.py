@@ -0,0 +1,6957 @@
+"""Table of the Trello REST endpoints exposed as tools.
+
+Each :class:`Endpoint` describes one operation: its HTTP method, path
+template, parameters and tool docstring. :class:`EndpointTool` attaches an
+entry to ``TrelloApp`` and builds the method on first access, with the same
+name, signature and docstring a hand-written method would have; every call
+goes through ``TrelloApp._call_endpoint``.
+
+The table is written in literals only (annotations are spelled as strings),
+so Python stores it as constants in the compiled module and importing it does
+almost no work.
+"""
+
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any, List, NamedTuple, Optional  # noqa: UP035
+
+PATH, QUERY, BODY, FILE = "path", "query", "body", "file"
+
+ANNOTATIONS: dict[str, Any] = {
+    "Any": Any,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "bytes": bytes,
+    "List[Any]": List[Any],
+    "list[Any]": list[Any],
+    "dict[str, Any]": dict[str, Any],
+    "Optional[str]": Optional[str],
+    "Optional[int]": Optional[int],
+    "Optional[float]": Optional[float],
+    "Optional[bool]": Optional[bool],
+    "Optional[bytes]": Optional[bytes],
+    "Optional[Any]": Optional[Any],
+    "Optional[dict[str, Any]]": Optional[dict[str, Any]],
+    "Optional[List[Any]]": Optional[List[Any]],
+    "Optional[List[str]]": Optional[List[str]],
+    "Optional[List[dict[str, Any]]]": Optional[List[dict[str, Any]]],
+}
+
+
+class Param(NamedTuple):
+    """One tool argument and where it goes in the request."""
+
+    name: str
+    annotation: str
+    location: str
+    required: bool = False
+    api_name: str | None = None  # when Trello's name is not a valid identifier
+
+
+class Route(NamedTuple):
+    """What ``TrelloApp._call_endpoint`` needs to send one call."""
+
+    name: str
+    method: str
+    path: str
+    path_params: tuple[str, ...]
+    query: tuple[tuple[str, str], ...]
+    body: tuple[tuple[str, str], ...] | None
+    files: tuple[tuple[str, str], ...] = ()  # sent as multipart/form-data
+
+
+class Endpoint(NamedTuple):
+    """One row of :data:`ENDPOINTS`.
+
+    ``params`` holds a ``(name, annotation, location[, required[, api_name]])``
+    tuple per argument, in signature order; see :class:`Param`.
+    """
+
+    name: str
+    method: str
+    path: str
+    params: tuple[tuple[Any, ...], ...]
+    returns: str
+    doc: str
+
+    def parameters(self) -> tuple[Param, ...]:
+        return tuple(Param(*row) for row in self.params)
+
+    def route(self) -> Route:
+        pairs: dict[str, list[tuple[str, str]]] = {PATH: [], QUERY: [], BODY: [], FILE: []}
+        for p in self.parameters():
+            pairs[p.location].append((p.api_name or p.name, p.name))
+        path_params = tuple(name for _, name in pairs[PATH])
+        body = tuple(pairs[BODY]) or None
+        query, files = tuple(pairs[QUERY]), tuple(pairs[FILE])
+        return Route(self.name, self.method, self.path, path_params, query, body, files)
+
+    def signature(self) -> inspect.Signature:
+        params = [_parameter("self", None, True)]
+        params += [_parameter(p.name, p.annotation, p.required) for p in self.parameters()]
+        return inspect.Signature(params, return_annotation=ANNOTATIONS[self.returns])
+
+
+@functools.cache
+def _parameter(name: str, annotation: str | None, required: bool) -> inspect.Parameter:
+    # Parameters are immutable, so tools share the many identical ones.
+    return inspect.Parameter(
+        name,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        default=inspect.Parameter.empty if required else None,
+        annotation=inspect.Parameter.empty if annotation is None else ANNOTATIONS[annotation],
+    )
+
+
+def make_tool(endpoint: Endpoint) -> Callable[..., Any]:
+    """Build the method that calls ``endpoint``."""
+    route = endpoint.route()
+    params = endpoint.parameters()
+    names = tuple(p.name for p in params)
+    required = sum(p.required for p in params)  # always the leading ones
+
+    def tool(self, *args, **kwargs):
+        if len(args) > len(names):
+            raise TypeError(
+                f"{route.name}() takes {len(names) + 1} positional arguments "
+                f"but {len(args) + 1} were given"
+            )
+        values = dict.fromkeys(names)
+        values.update(zip(names, args))
+        for key, value in kwargs.items():
+            if key not in values:
+                raise TypeError(f"{route.name}() got an unexpected keyword argument '{key}'")
+            if key in names[: len(args)]:
+                raise TypeError(f"{route.name}() got multiple values for argument '{key}'")
+            values[key] = value
+        missing = [key for key in names[len(args) : required] if key not in kwargs]
+        if missing:
+            raise TypeError(f"{route.name}() missing required arguments: {', '.join(missing)}")
+        return self._call_endpoint(route, values)
+
+    tool.__name__ = tool.__qualname__ = endpoint.name
+    tool.route = route
+    tool.__doc__ = endpoint.doc
+    tool.__signature__ = endpoint.signature()
+    tool.__annotations__ = {p.name: ANNOTATIONS[p.annotation] for p in params}
+    tool.__annotations__["return"] = ANNOTATIONS[endpoint.returns]
+    return tool
+
+
+class EndpointTool:
+    """Class attribute standing in for an endpoint's tool method.
+
+    The method is built on first access and replaces this descriptor on the
+    class, so importing the app only costs the table itself and processes
+    that expose a few tools never build the rest.
+    """
+
+    __slots__ = ("endpoint",)
+
+    def __init__(self, endpoint: Endpoint) -> None:
+        self.endpoint = endpoint
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        owner = owner if owner is not None else type(obj)
+        tool = make_tool(self.endpoint)
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.endpoint.name) is self:
+                setattr(cls, self.endpoint.name, tool)
+                break
+        return tool if obj is None else tool.__get__(obj, owner)
+
+
+ENDPOINTS: tuple[Endpoint, ...] = (
+    Endpoint(
+        "get_actions_id",
+        "GET",
+        "/actions/{id}",
+        (
+            ("id", "str", "path", True),
+            ("display", "Optional[bool]", "query"),
+            ("entities", "Optional[bool]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("member", "Optional[bool]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("memberCreator", "Optional[bool]", "query"),
+            ("memberCreator_fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get an Action
+
+        Args:
+            id (string): id
+            display (boolean): Determines whether the results should include a visible response or not; defaults to true if not specified.
+            entities (boolean): A boolean flag indicating whether to include entities in the response.
+            fields (string): `all` or a comma-separated list of action [fields](/cloud/trello/guides/rest-api/object-definitions/#action-object)
+            member (boolean): Include this boolean query parameter to filter the action response based on membership status; defaults to true.
+            member_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            memberCreator (boolean): Whether to include the member object for the creator of the action
+            memberCreator_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            
+        Tags:
+            actions, important
+        """,
+    ),
+    Endpoint(
+        "put_actions_id",
+        "PUT",
+        "/actions/{id}",
+        (
+            ("id", "str", "path", True),
+            ("text", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update an Action
+
+        Args:
+            id (string): id
+            text (string): The new text for the comment
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_actions_id",
+        "DELETE",
+        "/actions/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete an Action
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_field",
+        "GET",
+        "/actions/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a specific field on an Action
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_board",
+        "GET",
+        "/actions/{id}/board",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the Board for an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_card",
+        "GET",
+        "/actions/{id}/card",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the Card for an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of card fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_list",
+        "GET",
+        "/actions/{id}/list",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the List for an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of list fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_member",
+        "GET",
+        "/actions/{id}/member",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the Member of an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_membercreator",
+        "GET",
+        "/actions/{id}/memberCreator",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the Member Creator of an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_id_organization",
+        "GET",
+        "/actions/{id}/organization",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get the Organization of an Action
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of organization fields
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_actions_id_text",
+        "PUT",
+        "/actions/{id}/text",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update a Comment Action
+
+        Args:
+            id (string): id
+            value (string): The new text for the comment
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_actions_idaction_reactions",
+        "GET",
+        "/actions/{idAction}/reactions",
+        (
+            ("idAction", "str", "path", True),
+            ("member", "Optional[bool]", "query"),
+            ("emoji", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Get Action's Reactions
+
+        Args:
+            idAction (string): idAction
+            member (boolean): Whether to load the member as a nested resource. See [Members Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#members-nested-resource)
+            emoji (boolean): Whether to load the emoji as a nested resource.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "create_reaction_to_action",
+        "POST",
+        "/actions/{idAction}/reactions",
+        (
+            ("idAction", "str", "path", True),
+            ("shortName", "Optional[str]", "body"),
+            ("skinVariation", "Optional[str]", "body"),
+            ("native", "Optional[str]", "body"),
+            ("unified", "Optional[str]", "body"),
+        ),
+        "Any",
+        """
+        Create Reaction for Action
+
+        Args:
+            idAction (string): idAction
+            shortName (string): The primary `shortName` of the emoji to add. See [/emoji](#emoji)
+            skinVariation (string): The `skinVariation` of the emoji to add. See [/emoji](#emoji)
+            native (string): The emoji to add as a native unicode emoji. See [/emoji](#emoji)
+            unified (string): The `unified` value of the emoji to add. See [/emoji](#emoji)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_action_reaction_by_id",
+        "GET",
+        "/actions/{idAction}/reactions/{id}",
+        (
+            ("idAction", "str", "path", True),
+            ("id", "str", "path", True),
+            ("member", "Optional[bool]", "query"),
+            ("emoji", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Get Action's Reaction
+
+        Args:
+            idAction (string): idAction
+            id (string): id
+            member (boolean): Whether to load the member as a nested resource. See [Members Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#members-nested-resource)
+            emoji (boolean): Whether to load the emoji as a nested resource.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_reaction_by_id_action",
+        "DELETE",
+        "/actions/{idAction}/reactions/{id}",
+        (
+            ("idAction", "str", "path", True),
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete Action's Reaction
+
+        Args:
+            idAction (string): idAction
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_action_reactions_summary",
+        "GET",
+        "/actions/{idAction}/reactionsSummary",
+        (
+            ("idAction", "str", "path", True),
+        ),
+        "Any",
+        """
+        List Action's summary of Reactions
+
+        Args:
+            idAction (string): idAction
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "applications_key_compliance",
+        "GET",
+        "/applications/{key}/compliance",
+        (
+            ("key", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Application's compliance data
+
+        Args:
+            key (string): key
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_batch",
+        "GET",
+        "/batch",
+        (
+            ("urls", "str", "query", True),
+        ),
+        "Any",
+        """
+        Batch Requests
+
+        Args:
+            urls (string): A list of API routes. Maximum of 10 routes allowed. The routes should begin with a forward slash and should not include the API version number - e.g. "urls=/members/trello,/cards/[cardId]"
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_memberships",
+        "GET",
+        "/boards/{id}/memberships",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("activity", "Optional[bool]", "query"),
+            ("orgMemberType", "Optional[bool]", "query"),
+            ("member", "Optional[bool]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get Memberships of a Board
+
+        Args:
+            id (string): id
+            filter (string): One of `admins`, `all`, `none`, `normal`
+            activity (boolean): Works for premium organizations only.
+            orgMemberType (boolean): Shows the type of member to the org the user is. For instance, an org admin will have a `orgMemberType` of `admin`.
+            member (boolean): Determines whether to include a [nested member object](/cloud/trello/guides/rest-api/nested-resources/).
+            member_fields (string): Fields to show if `member=true`. Valid values: [nested member resource fields](/cloud/trello/guides/rest-api/nested-resources/).
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id",
+        "GET",
+        "/boards/{id}",
+        (
+            ("id", "str", "path", True),
+            ("actions", "Optional[str]", "query"),
+            ("boardStars", "Optional[str]", "query"),
+            ("cards", "Optional[str]", "query"),
+            ("card_pluginData", "Optional[bool]", "query"),
+            ("checklists", "Optional[str]", "query"),
+            ("customFields", "Optional[bool]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("labels", "Optional[str]", "query"),
+            ("lists", "Optional[str]", "query"),
+            ("members", "Optional[str]", "query"),
+            ("memberships", "Optional[str]", "query"),
+            ("pluginData", "Optional[bool]", "query"),
+            ("organization", "Optional[bool]", "query"),
+            ("organization_pluginData", "Optional[bool]", "query"),
+            ("myPrefs", "Optional[bool]", "query"),
+            ("tags", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Board
+
+        Args:
+            id (string): id
+            actions (string): This is a nested resource. Read more about actions as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            boardStars (string): Valid values are one of: `mine` or `none`.
+            cards (string): This is a nested resource. Read more about cards as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            card_pluginData (boolean): Use with the `cards` param to include card pluginData with the response
+            checklists (string): This is a nested resource. Read more about checklists as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            customFields (boolean): This is a nested resource. Read more about custom fields as nested resources [here](#custom-fields-nested-resource).
+            fields (string): The fields of the board to be included in the response. Valid values: all or a comma-separated list of: closed, dateLastActivity, dateLastView, desc, descData, idMemberCreator, idOrganization, invitations, invited, labelNames, memberships, name, pinned, powerUps, prefs, shortLink, shortUrl, starred, subscribed, url
+            labels (string): This is a nested resource. Read more about labels as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            lists (string): This is a nested resource. Read more about lists as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            members (string): This is a nested resource. Read more about members as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            memberships (string): This is a nested resource. Read more about memberships as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            pluginData (boolean): Determines whether the pluginData for this board should be returned. Valid values: true or false.
+            organization (boolean): This is a nested resource. Read more about organizations as nested resources [here](/cloud/trello/guides/rest-api/nested-resources/).
+            organization_pluginData (boolean): Use with the `organization` param to include organization pluginData with the response
+            myPrefs (boolean): Indicates whether to include the current user’s preferences for the specified board (default is false).
+            tags (boolean): Also known as collections, tags, refer to the collection(s) that a Board belongs to.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_boards_id",
+        "PUT",
+        "/boards/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("desc", "Optional[str]", "query"),
+            ("closed", "Optional[bool]", "query"),
+            ("subscribed", "Optional[str]", "query"),
+            ("idOrganization", "Optional[str]", "query"),
+            ("prefs_permissionLevel", "Optional[str]", "query", False, "prefs/permissionLevel"),
+            ("prefs_selfJoin", "Optional[bool]", "query", False, "prefs/selfJoin"),
+            ("prefs_cardCovers", "Optional[bool]", "query", False, "prefs/cardCovers"),
+            ("prefs_hideVotes", "Optional[bool]", "query", False, "prefs/hideVotes"),
+            ("prefs_invitations", "Optional[str]", "query", False, "prefs/invitations"),
+            ("prefs_voting", "Optional[str]", "query", False, "prefs/voting"),
+            ("prefs_comments", "Optional[str]", "query", False, "prefs/comments"),
+            ("prefs_background", "Optional[str]", "query", False, "prefs/background"),
+            ("prefs_cardAging", "Optional[str]", "query", False, "prefs/cardAging"),
+            ("prefs_calendarFeedEnabled", "Optional[bool]", "query", False, "prefs/calendarFeedEnabled"),
+            ("labelNames_green", "Optional[str]", "query", False, "labelNames/green"),
+            ("labelNames_yellow", "Optional[str]", "query", False, "labelNames/yellow"),
+            ("labelNames_orange", "Optional[str]", "query", False, "labelNames/orange"),
+            ("labelNames_red", "Optional[str]", "query", False, "labelNames/red"),
+            ("labelNames_purple", "Optional[str]", "query", False, "labelNames/purple"),
+            ("labelNames_blue", "Optional[str]", "query", False, "labelNames/blue"),
+        ),
+        "Any",
+        """
+        Update a Board
+
+        Args:
+            id (string): id
+            name (string): The new name for the board. 1 to 16384 characters long.
+            desc (string): A new description for the board, 0 to 16384 characters long
+            closed (boolean): Whether the board is closed
+            subscribed (string): Whether the acting user is subscribed to the board Example: '5abbe4b7ddc1b351ef961414'.
+            idOrganization (string): The id of the Workspace the board should be moved to
+            prefs_permissionLevel (string): One of: org, private, public
+            prefs_selfJoin (boolean): Whether Workspace members can join the board themselves
+            prefs_cardCovers (boolean): Whether card covers should be displayed on this board
+            prefs_hideVotes (boolean): Determines whether the Voting Power-Up should hide who voted on cards or not.
+            prefs_invitations (string): Who can invite people to this board. One of: admins, members
+            prefs_voting (string): Who can vote on this board. One of disabled, members, observers, org, public
+            prefs_comments (string): Who can comment on cards on this board. One of: disabled, members, observers, org, public
+            prefs_background (string): The id of a custom background or one of: blue, orange, green, red, purple, pink, lime, sky, grey
+            prefs_cardAging (string): One of: pirate, regular
+            prefs_calendarFeedEnabled (boolean): Determines whether the calendar feed is enabled or not.
+            labelNames_green (string): Name for the green label. 1 to 16384 characters long
+            labelNames_yellow (string): Name for the yellow label. 1 to 16384 characters long
+            labelNames_orange (string): Name for the orange label. 1 to 16384 characters long
+            labelNames_red (string): Name for the red label. 1 to 16384 characters long
+            labelNames_purple (string): Name for the purple label. 1 to 16384 characters long
+            labelNames_blue (string): Name for the blue label. 1 to 16384 characters long
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_boards_id",
+        "DELETE",
+        "/boards/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_field",
+        "GET",
+        "/boards/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get a field on a Board
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_actions",
+        "GET",
+        "/boards/{boardId}/actions",
+        (
+            ("boardId", "str", "path", True),
+            ("fields", "Optional[dict[str, Any]]", "query"),
+            ("filter", "Optional[str]", "query"),
+            ("format", "Optional[str]", "query"),
+            ("idModels", "Optional[str]", "query"),
+            ("limit", "Optional[float]", "query"),
+            ("member", "Optional[bool]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("memberCreator", "Optional[bool]", "query"),
+            ("memberCreator_fields", "Optional[str]", "query"),
+            ("page", "Optional[float]", "query"),
+            ("reactions", "Optional[bool]", "query"),
+            ("before", "Optional[str]", "query"),
+            ("since", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Actions of a Board
+
+        Args:
+            boardId (string): boardId
+            fields (object): The fields to be returned for the Actions. [See Action fields here](/cloud/trello/guides/rest-api/object-definitions/#action-object).
+            filter (string): A comma-separated list of [action types](/cloud/trello/guides/rest-api/action-types/).
+            format (string): The format of the returned Actions. Either list or count.
+            idModels (string): A comma-separated list of idModels. Only actions related to these models will be returned.
+            limit (number): The limit of the number of responses, between 0 and 1000.
+            member (boolean): Whether to return the member object for each action.
+            member_fields (string): The fields of the [member](/cloud/trello/guides/rest-api/object-definitions/#member-object) to return.
+            memberCreator (boolean): Whether to return the memberCreator object for each action.
+            memberCreator_fields (string): The fields of the [member](/cloud/trello/guides/rest-api/object-definitions/#member-object) creator to return
+            page (number): The page of results for actions.
+            reactions (boolean): Whether to show reactions on comments or not.
+            before (string): A date string in the form of YYYY-MM-DDThh:mm:ssZ or a mongo object ID. Only objects created before this date will be returned.
+            since (string): A date string in the form of YYYY-MM-DDThh:mm:ssZ or a mongo object ID. Only objects created since this date will be returned.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_boardstars",
+        "GET",
+        "/boards/{boardId}/boardStars",
+        (
+            ("boardId", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get boardStars on a Board
+
+        Args:
+            boardId (string): boardId
+            filter (string): Valid values: mine, none
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "boards_id_checklists",
+        "GET",
+        "/boards/{id}/checklists",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Checklists on a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_cards",
+        "GET",
+        "/boards/{id}/cards",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Cards on a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_cards_filter",
+        "GET",
+        "/boards/{id}/cards/{filter}",
+        (
+            ("id", "str", "path", True),
+            ("filter", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get filtered Cards on a Board
+
+        Args:
+            id (string): id
+            filter (string): filter
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_customfields",
+        "GET",
+        "/boards/{id}/customFields",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Custom Fields for Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_labels",
+        "GET",
+        "/boards/{id}/labels",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[dict[str, Any]]", "query"),
+            ("limit", "Optional[int]", "query"),
+        ),
+        "Any",
+        """
+        Get Labels on a Board
+
+        Args:
+            id (string): id
+            fields (object): The fields to be returned for the Labels.
+            limit (integer): The number of Labels to be returned.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards_id_labels",
+        "POST",
+        "/boards/{id}/labels",
+        (
+            ("id", "str", "path", True),
+            ("name", "str", "query", True),
+            ("color", "str", "query", True),
+        ),
+        "Any",
+        """
+        Create a Label on a Board
+
+        Args:
+            id (string): id
+            name (string): The name of the label to be created. 1 to 16384 characters long.
+            color (string): Sets the color of the new label. Valid values are a label color or `null`.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_lists",
+        "GET",
+        "/boards/{id}/lists",
+        (
+            ("id", "str", "path", True),
+            ("cards", "Optional[str]", "query"),
+            ("card_fields", "Optional[str]", "query"),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Lists on a Board
+
+        Args:
+            id (string): id
+            cards (string): Filter to apply to Cards.
+            card_fields (string): `all` or a comma-separated list of card [fields](/cloud/trello/guides/rest-api/object-definitions/#card-object)
+            filter (string): Filter to apply to Lists
+            fields (string): `all` or a comma-separated list of list [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards_id_lists",
+        "POST",
+        "/boards/{id}/lists",
+        (
+            ("id", "str", "path", True),
+            ("name", "str", "query", True),
+            ("pos", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Create a List on a Board
+
+        Args:
+            id (string): id
+            name (string): The name of the list to be created. 1 to 16384 characters long.
+            pos (string): Determines the position of the list. Valid values: `top`, `bottom`, or a positive number.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_lists_filter",
+        "GET",
+        "/boards/{id}/lists/{filter}",
+        (
+            ("id", "str", "path", True),
+            ("filter", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get filtered Lists on a Board
+
+        Args:
+            id (string): id
+            filter (string): filter
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_members",
+        "GET",
+        "/boards/{id}/members",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get the Members of a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_boards_id_members",
+        "PUT",
+        "/boards/{id}/members",
+        (
+            ("id", "str", "path", True),
+            ("email", "str", "query", True),
+            ("type", "Optional[str]", "query"),
+            ("fullName", "Optional[str]", "body"),
+        ),
+        "Any",
+        """
+        Invite Member to Board via email
+
+        Args:
+            id (string): id
+            email (string): The email address of a user to add as a member of the board.
+            type (string): Valid values: admin, normal, observer. Determines what type of member the user being added should be of the board.
+            fullName (string): The full name of the user to as a member of the board. Must have a length of at least 1 and cannot begin nor end with a space.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_boards_id_members_idmember",
+        "PUT",
+        "/boards/{id}/members/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("type", "str", "query", True),
+            ("allowBillableGuest", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Add a Member to a Board
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            type (string): One of: admin, normal, observer. Determines the type of member this user will be on the board.
+            allowBillableGuest (boolean): Optional param that allows organization admins to add multi-board guests onto a board.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "boardsidmembersidmember",
+        "DELETE",
+        "/boards/{id}/members/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove Member from Board
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_membership",
+        "PUT",
+        "/boards/{id}/memberships/{idMembership}",
+        (
+            ("id", "str", "path", True),
+            ("idMembership", "str", "path", True),
+            ("type", "str", "query", True),
+            ("member_fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update Membership of Member on a Board
+
+        Args:
+            id (string): id
+            idMembership (string): idMembership
+            type (string): One of: admin, normal, observer. Determines the type of member that this membership will be to this board.
+            member_fields (string): Valid values: all, avatarHash, bio, bioData, confirmed, fullName, idPremOrgsAdmin, initials, memberType, products, status, url, username
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_email_position",
+        "PUT",
+        "/boards/{id}/myPrefs/emailPosition",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update emailPosition Pref on a Board
+
+        Args:
+            id (string): id
+            value (string): Valid values: bottom, top. Determines the position of the email address.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_my_prefs_id_email_list",
+        "PUT",
+        "/boards/{id}/myPrefs/idEmailList",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update idEmailList Pref on a Board
+
+        Args:
+            id (string): id
+            value (string): The id of an email list. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_sidebar_pref",
+        "PUT",
+        "/boards/{id}/myPrefs/showSidebar",
+        (
+            ("id", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "Any",
+        """
+        Update showSidebar Pref on a Board
+
+        Args:
+            id (string): id
+            value (boolean): Determines whether to show the side bar.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_sidebar_act_pref",
+        "PUT",
+        "/boards/{id}/myPrefs/showSidebarActivity",
+        (
+            ("id", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "Any",
+        """
+        Update showSidebarActivity Pref on a Board
+
+        Args:
+            id (string): id
+            value (boolean): Determines whether to show sidebar activity.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_sidebar_actions",
+        "PUT",
+        "/boards/{id}/myPrefs/showSidebarBoardActions",
+        (
+            ("id", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "Any",
+        """
+        Update showSidebarBoardActions Pref on a Board
+
+        Args:
+            id (string): id
+            value (boolean): Determines whether to show the sidebar board actions.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_prefs_show_members",
+        "PUT",
+        "/boards/{id}/myPrefs/showSidebarMembers",
+        (
+            ("id", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "Any",
+        """
+        Update showSidebarMembers Pref on a Board
+
+        Args:
+            id (string): id
+            value (boolean): Determines whether to show members of the board in the sidebar.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards",
+        "POST",
+        "/boards/",
+        (
+            ("name", "str", "query", True),
+            ("defaultLabels", "Optional[bool]", "query"),
+            ("defaultLists", "Optional[bool]", "query"),
+            ("desc", "Optional[str]", "query"),
+            ("idOrganization", "Optional[str]", "query"),
+            ("idBoardSource", "Optional[str]", "query"),
+            ("keepFromSource", "Optional[str]", "query"),
+            ("powerUps", "Optional[str]", "query"),
+            ("prefs_permissionLevel", "Optional[str]", "query"),
+            ("prefs_voting", "Optional[str]", "query"),
+            ("prefs_comments", "Optional[str]", "query"),
+            ("prefs_invitations", "Optional[str]", "query"),
+            ("prefs_selfJoin", "Optional[bool]", "query"),
+            ("prefs_cardCovers", "Optional[bool]", "query"),
+            ("prefs_background", "Optional[str]", "query"),
+            ("prefs_cardAging", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create a Board
+
+        Args:
+            name (string): The new name for the board. 1 to 16384 characters long.
+            defaultLabels (boolean): Determines whether to use the default set of labels.
+            defaultLists (boolean): Determines whether to add the default set of lists to a board (To Do, Doing, Done). It is ignored if `idBoardSource` is provided.
+            desc (string): A new description for the board, 0 to 16384 characters long
+            idOrganization (string): The id or name of the Workspace the board should belong to. Example: '5abbe4b7ddc1b351ef961414'.
+            idBoardSource (string): The id of a board to copy into the new board. Example: '5abbe4b7ddc1b351ef961414'.
+            keepFromSource (string): To keep cards from the original board pass in the value `cards`
+            powerUps (string): The Power-Ups that should be enabled on the new board. One of: `all`, `calendar`, `cardAging`, `recap`, `voting`.
+            prefs_permissionLevel (string): The permissions level of the board. One of: `org`, `private`, `public`.
+            prefs_voting (string): Who can vote on this board. One of `disabled`, `members`, `observers`, `org`, `public`.
+            prefs_comments (string): Who can comment on cards on this board. One of: `disabled`, `members`, `observers`, `org`, `public`.
+            prefs_invitations (string): Determines what types of members can invite users to join. One of: `admins`, `members`.
+            prefs_selfJoin (boolean): Determines whether users can join the boards themselves or whether they have to be invited.
+            prefs_cardCovers (boolean): Determines whether card covers are enabled.
+            prefs_background (string): The id of a custom background or one of: `blue`, `orange`, `green`, `red`, `purple`, `pink`, `lime`, `sky`, `grey`.
+            prefs_cardAging (string): Determines the type of card aging that should take place on the board if card aging is enabled. One of: `pirate`, `regular`.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "generate_calendar_key",
+        "POST",
+        "/boards/{id}/calendarKey/generate",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Create a calendarKey for a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "generate_board_email_key",
+        "POST",
+        "/boards/{id}/emailKey/generate",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Create a emailKey for a Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards_id_idtags",
+        "POST",
+        "/boards/{id}/idTags",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Create a Tag for a Board
+
+        Args:
+            id (string): id
+            value (string): The id of a tag from the organization to which this board belongs. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards_id_markedasviewed",
+        "POST",
+        "/boards/{id}/markedAsViewed",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Mark Board as viewed
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_boards_id_boardplugins",
+        "GET",
+        "/boards/{id}/boardPlugins",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Enabled Power-Ups on Board
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_boards_id_boardplugins",
+        "POST",
+        "/boards/{id}/boardPlugins",
+        (
+            ("id", "str", "path", True),
+            ("idPlugin", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Enable a Power-Up on a Board
+
+        Args:
+            id (string): id
+            idPlugin (string): The ID of the Power-Up to enable Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_boards_id_boardplugins",
+        "DELETE",
+        "/boards/{id}/boardPlugins/{idPlugin}",
+        (
+            ("id", "str", "path", True),
+            ("idPlugin", "str", "path", True),
+        ),
+        "Any",
+        """
+        Disable a Power-Up on a Board
+
+        Args:
+            id (string): id
+            idPlugin (string): idPlugin
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_board_id_plugins",
+        "GET",
+        "/boards/{id}/plugins",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get Power-Ups on a Board
+
+        Args:
+            id (string): id
+            filter (string): One of: `enabled` or `available`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards",
+        "POST",
+        "/cards",
+        (
+            ("idList", "str", "query", True),
+            ("name", "Optional[str]", "query"),
+            ("desc", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+            ("due", "Optional[str]", "query"),
+            ("start", "Optional[str]", "query"),
+            ("dueComplete", "Optional[bool]", "query"),
+            ("idMembers", "Optional[List[Any]]", "query"),
+            ("idLabels", "Optional[List[Any]]", "query"),
+            ("urlSource", "Optional[str]", "query"),
+            ("fileSource", "Optional[bytes]", "query"),
+            ("mimeType", "Optional[str]", "query"),
+            ("idCardSource", "Optional[str]", "query"),
+            ("keepFromSource", "Optional[str]", "query"),
+            ("address", "Optional[str]", "query"),
+            ("locationName", "Optional[str]", "query"),
+            ("coordinates", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Create a new Card
+
+        Args:
+            idList (string): The ID of the list the card should be created in Example: '5abbe4b7ddc1b351ef961414'.
+            name (string): The name for the card
+            desc (string): The description for the card
+            pos (string): The position of the new card. `top`, `bottom`, or a positive float
+            due (string): A due date for the card
+            start (string): The start date of a card, or `null`
+            dueComplete (boolean): Whether the status of the card is complete
+            idMembers (array): Comma-separated list of member IDs to add to the card
+            idLabels (array): Comma-separated list of label IDs to add to the card
+            urlSource (string): A URL starting with ` or ` The URL will be attached to the card upon creation.
+            fileSource (string): Optional query parameter specifying the source file for the operation.
+            mimeType (string): The mimeType of the attachment. Max length 256
+            idCardSource (string): The ID of a card to copy into the new card Example: '5abbe4b7ddc1b351ef961414'.
+            keepFromSource (string): If using `idCardSource` you can specify which properties to copy over. `all` or comma-separated list of: `attachments,checklists,customFields,comments,due,start,labels,members,start,stickers`
+            address (string): For use with/by the Map View
+            locationName (string): For use with/by the Map View
+            coordinates (string): For use with/by the Map View. Should take the form latitude,longitude
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id",
+        "GET",
+        "/cards/{id}",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("actions", "Optional[str]", "query"),
+            ("attachments", "Optional[str]", "query"),
+            ("attachment_fields", "Optional[str]", "query"),
+            ("members", "Optional[bool]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("membersVoted", "Optional[bool]", "query"),
+            ("memberVoted_fields", "Optional[str]", "query"),
+            ("checkItemStates", "Optional[bool]", "query"),
+            ("checklists", "Optional[str]", "query"),
+            ("checklist_fields", "Optional[str]", "query"),
+            ("board", "Optional[bool]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+            ("list", "Optional[bool]", "query"),
+            ("pluginData", "Optional[bool]", "query"),
+            ("stickers", "Optional[bool]", "query"),
+            ("sticker_fields", "Optional[str]", "query"),
+            ("customFieldItems", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of [fields](/cloud/trello/guides/rest-api/object-definitions/). **Defaults**: `badges, checkItemStates, closed, dateLastActivity, desc, descData, due, start, idBoard, idChecklists, idLabels, idList, idMembers, idShort, idAttachmentCover, manualCoverAttachment, labels, name, pos, shortUrl, url`
+            actions (string): See the [Actions Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#actions-nested-resource)
+            attachments (string): `true`, `false`, or `cover`
+            attachment_fields (string): `all` or a comma-separated list of attachment [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            members (boolean): Whether to return member objects for members on the card
+            member_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/). **Defaults**: `avatarHash, fullName, initials, username`
+            membersVoted (boolean): Whether to return member objects for members who voted on the card
+            memberVoted_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/). **Defaults**: `avatarHash, fullName, initials, username`
+            checkItemStates (boolean): Optional boolean parameter to indicate whether to check the states of items associated with the card.
+            checklists (string): Whether to return the checklists on the card. `all` or `none`
+            checklist_fields (string): `all` or a comma-separated list of `idBoard,idCard,name,pos`
+            board (boolean): Whether to return the board object the card is on
+            board_fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/#board-object). **Defaults**: `name, desc, descData, closed, idOrganization, pinned, url, prefs`
+            list (boolean): See the [Lists Nested Resource](/cloud/trello/guides/rest-api/nested-resources/)
+            pluginData (boolean): Whether to include pluginData on the card with the response
+            stickers (boolean): Whether to include sticker models with the response
+            sticker_fields (string): `all` or a comma-separated list of sticker [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            customFieldItems (boolean): Whether to include the customFieldItems
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_cards_id",
+        "PUT",
+        "/cards/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("desc", "Optional[str]", "query"),
+            ("closed", "Optional[bool]", "query"),
+            ("idMembers", "Optional[str]", "query"),
+            ("idAttachmentCover", "Optional[str]", "query"),
+            ("idList", "Optional[str]", "query"),
+            ("idLabels", "Optional[str]", "query"),
+            ("idBoard", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+            ("due", "Optional[str]", "query"),
+            ("start", "Optional[str]", "query"),
+            ("dueComplete", "Optional[bool]", "query"),
+            ("subscribed", "Optional[bool]", "query"),
+            ("address", "Optional[str]", "query"),
+            ("locationName", "Optional[str]", "query"),
+            ("coordinates", "Optional[str]", "query"),
+            ("cover", "Optional[dict[str, Any]]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Card
+
+        Args:
+            id (string): id
+            name (string): The new name for the card
+            desc (string): The new description for the card
+            closed (boolean): Whether the card should be archived (closed: true)
+            idMembers (string): Comma-separated list of member IDs Example: '5abbe4b7ddc1b351ef961414'.
+            idAttachmentCover (string): The ID of the image attachment the card should use as its cover, or null for none Example: '5abbe4b7ddc1b351ef961414'.
+            idList (string): The ID of the list the card should be in Example: '5abbe4b7ddc1b351ef961414'.
+            idLabels (string): Comma-separated list of label IDs Example: '5abbe4b7ddc1b351ef961414'.
+            idBoard (string): The ID of the board the card should be on Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): The position of the card in its list. `top`, `bottom`, or a positive float
+            due (string): When the card is due, or `null`
+            start (string): The start date of a card, or `null`
+            dueComplete (boolean): Whether the status of the card is complete
+            subscribed (boolean): Whether the member is should be subscribed to the card
+            address (string): For use with/by the Map View
+            locationName (string): For use with/by the Map View
+            coordinates (string): For use with/by the Map View. Should be latitude,longitude
+            cover (object): Updates the card's cover | Option | Values | About | |--------|--------|-------| | color | `pink`, `yellow`, `lime`, `blue`, `black`, `orange`, `red`, `purple`, `sky`, `green` | Makes the cover a solid color . | | brightness | `dark`, `light` | Determines whether the text on the cover should be dark or light. | url | An unsplash URL: | Used if making an image the cover. Only Unsplash URLs work. | idAttachment | ID of an attachment on the card | Used if setting an attached image as the cover. | | size | `normal`, `full` | Determines whether to show the card name on the cover, or below it. | `brightness` can be sent alongside any of the other parameters, but all of the other parameters are mutually exclusive; you can not have the cover be a `color` and an `idAttachment` at the same time. On the brightness options, setting it to light will make the text on the card cover dark: ![](/cloud/trello/images/rest/cards/cover-brightness-dark.png) And vice versa, setting it to dark will make the text on the card cover light: ![](/cloud/trello/images/rest/cards/cover-brightness-light.png)
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_cards_id",
+        "DELETE",
+        "/cards/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Card
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_field",
+        "GET",
+        "/cards/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a field on a Card
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_actions",
+        "GET",
+        "/cards/{id}/actions",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("page", "Optional[float]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Actions on a Card
+
+        Args:
+            id (string): id
+            filter (string): A comma-separated list of [action types](
+            page (number): The page of results for actions. Each page of results has 50 actions.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_attachments",
+        "GET",
+        "/cards/{id}/attachments",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Attachments on a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of attachment [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            filter (string): Use `cover` to restrict to just the cover attachment
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_attachments",
+        "POST",
+        "/cards/{id}/attachments",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("file", "Optional[bytes]", "file"),
+            ("mimeType", "Optional[str]", "query"),
+            ("url", "Optional[str]", "query"),
+            ("setCover", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Create Attachment On Card
+
+        Args:
+            id (string): id
+            name (string): The name of the attachment. Max length 256.
+            file (bytes): The file to attach: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+            mimeType (string): The mimeType of the attachment. Max length 256
+            url (string): A URL to attach. Must start with ` or `
+            setCover (boolean): Determines whether to use the new attachment as a cover for the Card.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_attachment_by_id",
+        "GET",
+        "/cards/{id}/attachments/{idAttachment}",
+        (
+            ("id", "str", "path", True),
+            ("idAttachment", "str", "path", True),
+            ("fields", "Optional[List[Any]]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get an Attachment on a Card
+
+        Args:
+            id (string): id
+            idAttachment (string): idAttachment
+            fields (array): The Attachment fields to be included in the response.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_attachment_by_id",
+        "DELETE",
+        "/cards/{id}/attachments/{idAttachment}",
+        (
+            ("id", "str", "path", True),
+            ("idAttachment", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete an Attachment on a Card
+
+        Args:
+            id (string): id
+            idAttachment (string): idAttachment
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_board",
+        "GET",
+        "/cards/{id}/board",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Board the Card is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/#board-object)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_checkitemstates",
+        "GET",
+        "/cards/{id}/checkItemStates",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get checkItems on a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of: `idCheckItem`, `state`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_checklists",
+        "GET",
+        "/cards/{id}/checklists",
+        (
+            ("id", "str", "path", True),
+            ("checkItems", "Optional[str]", "query"),
+            ("checkItem_fields", "Optional[str]", "query"),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Checklists on a Card
+
+        Args:
+            id (string): id
+            checkItems (string): `all` or `none`
+            checkItem_fields (string): `all` or a comma-separated list of: `name,nameData,pos,state,type,due,dueReminder,idMember`
+            filter (string): `all` or `none`
+            fields (string): `all` or a comma-separated list of: `idBoard,idCard,name,pos`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_checklists",
+        "POST",
+        "/cards/{id}/checklists",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("idChecklistSource", "Optional[str]", "query"),
+            ("pos", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create Checklist on a Card
+
+        Args:
+            id (string): id
+            name (string): The name of the checklist
+            idChecklistSource (string): The ID of a source checklist to copy into the new one Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): The position of the checklist on the card. One of: `top`, `bottom`, or a positive number.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "check_card_item",
+        "GET",
+        "/cards/{id}/checkItem/{idCheckItem}",
+        (
+            ("id", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get checkItem on a Card
+
+        Args:
+            id (string): id
+            idCheckItem (string): idCheckItem
+            fields (string): `all` or a comma-separated list of `name,nameData,pos,state,type,due,dueReminder,idMember`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            
+        Tags:
+            card, important 
+        """,
+    ),
+    Endpoint(
+        "update_card_check_item",
+        "PUT",
+        "/cards/{id}/checkItem/{idCheckItem}",
+        (
+            ("id", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("state", "Optional[str]", "query"),
+            ("idChecklist", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+            ("due", "Optional[str]", "query"),
+            ("dueReminder", "Optional[float]", "query"),
+            ("idMember", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update a checkItem on a Card
+
+        Args:
+            id (string): id
+            idCheckItem (string): idCheckItem
+            name (string): The new name for the checklist item
+            state (string): One of: `complete`, `incomplete`
+            idChecklist (string): The ID of the checklist this item is in Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): `top`, `bottom`, or a positive float
+            due (string): A due date for the checkitem
+            dueReminder (number): A dueReminder for the due date on the checkitem
+            idMember (string): The ID of the member to remove from the card Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_card_check_item",
+        "DELETE",
+        "/cards/{id}/checkItem/{idCheckItem}",
+        (
+            ("id", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete checkItem on a Card
+
+        Args:
+            id (string): id
+            idCheckItem (string): idCheckItem
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_list",
+        "GET",
+        "/cards/{id}/list",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the List of a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of list [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_members",
+        "GET",
+        "/cards/{id}/members",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Members of a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_membersvoted",
+        "GET",
+        "/cards/{id}/membersVoted",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Members who have voted on a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "cardsidmembersvoted",
+        "POST",
+        "/cards/{id}/membersVoted",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Add Member vote to Card
+
+        Args:
+            id (string): id
+            value (string): The ID of the member to vote 'yes' on the card Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_plugindata",
+        "GET",
+        "/cards/{id}/pluginData",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get pluginData on a Card
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_stickers",
+        "GET",
+        "/cards/{id}/stickers",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Stickers on a Card
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of sticker [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_stickers",
+        "POST",
+        "/cards/{id}/stickers",
+        (
+            ("id", "str", "path", True),
+            ("image", "str", "query", True),
+            ("top", "float", "query", True),
+            ("left", "float", "query", True),
+            ("zIndex", "int", "query", True),
+            ("rotate", "Optional[float]", "query"),
+        ),
+        "Any",
+        """
+        Add a Sticker to a Card
+
+        Args:
+            id (string): id
+            image (string): For custom stickers, the id of the sticker. For default stickers, the string identifier (like 'taco-cool', see below)
+            top (number): The top position of the sticker, from -60 to 100
+            left (number): The left position of the sticker, from -60 to 100
+            zIndex (integer): The z-index of the sticker
+            rotate (number): The rotation of the sticker
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_card_sticker",
+        "GET",
+        "/cards/{id}/stickers/{idSticker}",
+        (
+            ("id", "str", "path", True),
+            ("idSticker", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Sticker on a Card
+
+        Args:
+            id (string): id
+            idSticker (string): idSticker
+            fields (string): `all` or a comma-separated list of sticker [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_sticker_by_id",
+        "DELETE",
+        "/cards/{id}/stickers/{idSticker}",
+        (
+            ("id", "str", "path", True),
+            ("idSticker", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Sticker on a Card
+
+        Args:
+            id (string): id
+            idSticker (string): idSticker
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_card_sticker_by_id_sticker",
+        "PUT",
+        "/cards/{id}/stickers/{idSticker}",
+        (
+            ("id", "str", "path", True),
+            ("idSticker", "str", "path", True),
+            ("top", "float", "query", True),
+            ("left", "float", "query", True),
+            ("zIndex", "int", "query", True),
+            ("rotate", "Optional[float]", "query"),
+        ),
+        "Any",
+        """
+        Update a Sticker on a Card
+
+        Args:
+            id (string): id
+            idSticker (string): idSticker
+            top (number): The top position of the sticker, from -60 to 100
+            left (number): The left position of the sticker, from -60 to 100
+            zIndex (integer): The z-index of the sticker
+            rotate (number): The rotation of the sticker
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_card_action_comment",
+        "PUT",
+        "/cards/{id}/actions/{idAction}/comments",
+        (
+            ("id", "str", "path", True),
+            ("idAction", "str", "path", True),
+            ("text", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update Comment Action on a Card
+
+        Args:
+            id (string): id
+            idAction (string): idAction
+            text (string): The new text for the comment
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_comment_action",
+        "DELETE",
+        "/cards/{id}/actions/{idAction}/comments",
+        (
+            ("id", "str", "path", True),
+            ("idAction", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a comment on a Card
+
+        Args:
+            id (string): id
+            idAction (string): idAction
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_card_custom_field_item",
+        "PUT",
+        "/cards/{idCard}/customField/{idCustomField}/item",
+        (
+            ("idCard", "str", "path", True),
+            ("idCustomField", "str", "path", True),
+            ("value", "Optional[dict[str, Any]]", "body"),
+            ("idValue", "Optional[str]", "body"),
+        ),
+        "Any",
+        """
+        Update Custom Field item on Card
+
+        Args:
+            idCard (string): idCard
+            idCustomField (string): idCustomField
+            value (object): An object containing the key and value to set for the card's Custom Field value. The key used to set the value should match the type of Custom Field defined.
+            idValue (string): idValue Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_cards_idcard_customfields",
+        "PUT",
+        "/cards/{idCard}/customFields",
+        (
+            ("idCard", "str", "path", True),
+            ("customFieldItems", "Optional[List[dict[str, Any]]]", "body"),
+        ),
+        "Any",
+        """
+        Update Multiple Custom Field items on Card
+
+        Args:
+            idCard (string): idCard
+            customFieldItems (array): An array of objects containing the custom field ID, key and value, and ID of list type option.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_cards_id_customfielditems",
+        "GET",
+        "/cards/{id}/customFieldItems",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Custom Field Items for a Card
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_actions_comments",
+        "POST",
+        "/cards/{id}/actions/comments",
+        (
+            ("id", "str", "path", True),
+            ("text", "str", "query", True),
+        ),
+        "dict[str, Any]",
+        """
+        Add a new comment to a Card
+
+        Args:
+            id (string): id
+            text (string): The comment
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_idlabels",
+        "POST",
+        "/cards/{id}/idLabels",
+        (
+            ("id", "str", "path", True),
+            ("value", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Add a Label to a Card
+
+        Args:
+            id (string): id
+            value (string): The ID of the label to add Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_idmembers",
+        "POST",
+        "/cards/{id}/idMembers",
+        (
+            ("id", "str", "path", True),
+            ("value", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Add a Member to a Card
+
+        Args:
+            id (string): id
+            value (string): The ID of the Member to add to the card Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_cards_id_labels",
+        "POST",
+        "/cards/{id}/labels",
+        (
+            ("id", "str", "path", True),
+            ("color", "str", "query", True),
+            ("name", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create a new Label on a Card
+
+        Args:
+            id (string): id
+            color (string): A valid label color or `null`. See [labels](/cloud/trello/guides/rest-api/object-definitions/)
+            name (string): A name for the label
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "mark_notifications_read",
+        "POST",
+        "/cards/{id}/markAssociatedNotificationsRead",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Mark a Card's Notifications as read
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_card_id_label_by_id",
+        "DELETE",
+        "/cards/{id}/idLabels/{idLabel}",
+        (
+            ("id", "str", "path", True),
+            ("idLabel", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Label from a Card
+
+        Args:
+            id (string): id
+            idLabel (string): idLabel
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_id_idmembers_idmember",
+        "DELETE",
+        "/cards/{id}/idMembers/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Member from a Card
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_card_voter",
+        "DELETE",
+        "/cards/{id}/membersVoted/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Member's Vote on a Card
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_check_item",
+        "PUT",
+        "/cards/{idCard}/checklist/{idChecklist}/checkItem/{idCheckItem}",
+        (
+            ("idCard", "str", "path", True),
+            ("idChecklist", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+            ("pos", "Optional[Any]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update Checkitem on Checklist on Card
+
+        Args:
+            idCard (string): idCard
+            idChecklist (string): idChecklist
+            idCheckItem (string): idCheckItem
+            pos (string): `top`, `bottom`, or a positive float
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_checklist_by_id",
+        "DELETE",
+        "/cards/{id}/checklists/{idChecklist}",
+        (
+            ("id", "str", "path", True),
+            ("idChecklist", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Checklist on a Card
+
+        Args:
+            id (string): id
+            idChecklist (string): idChecklist
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_checklists",
+        "POST",
+        "/checklists",
+        (
+            ("idCard", "str", "query", True),
+            ("name", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+            ("idChecklistSource", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create a Checklist
+
+        Args:
+            idCard (string): The ID of the Card that the checklist should be added to. Example: '5abbe4b7ddc1b351ef961414'.
+            name (string): The name of the checklist. Should be a string of length 1 to 16384.
+            pos (string): The position of the checklist on the card. One of: `top`, `bottom`, or a positive number.
+            idChecklistSource (string): The ID of a checklist to copy into the new checklist. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_checklists_id",
+        "GET",
+        "/checklists/{id}",
+        (
+            ("id", "str", "path", True),
+            ("cards", "Optional[str]", "query"),
+            ("checkItems", "Optional[str]", "query"),
+            ("checkItem_fields", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Checklist
+
+        Args:
+            id (string): id
+            cards (string): Valid values: `all`, `closed`, `none`, `open`, `visible`. Cards is a nested resource. The additional query params available are documented at [Cards Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#cards-nested-resource).
+            checkItems (string): The check items on the list to return. One of: `all`, `none`.
+            checkItem_fields (string): The fields on the checkItem to return if checkItems are being returned. `all` or a comma-separated list of: `name`, `nameData`, `pos`, `state`, `type`, `due`, `dueReminder`, `idMember`
+            fields (string): `all` or a comma-separated list of checklist [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_checlists_id",
+        "PUT",
+        "/checklists/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+        ),
+        "Any",
+        """
+        Update a Checklist
+
+        Args:
+            id (string): id
+            name (string): Name of the new checklist being created. Should be length of 1 to 16384.
+            pos (string): Determines the position of the checklist on the card. One of: `top`, `bottom`, or a positive number.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_checklists_id",
+        "DELETE",
+        "/checklists/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Checklist
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_checklists_id_field",
+        "GET",
+        "/checklists/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get field on a Checklist
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_checklists_id_field",
+        "PUT",
+        "/checklists/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+            ("value", "Any", "query", True),
+        ),
+        "Any",
+        """
+        Update field on a Checklist
+
+        Args:
+            id (string): id
+            field (string): field
+            value (string): The value to change the checklist name to. Should be a string of length 1 to 16384.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_checklists_id_board",
+        "GET",
+        "/checklists/{id}/board",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Board the Checklist is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_checklists_id_cards",
+        "GET",
+        "/checklists/{id}/cards",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get the Card a Checklist is on
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_checklists_id_checkitems",
+        "GET",
+        "/checklists/{id}/checkItems",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Checkitems on a Checklist
+
+        Args:
+            id (string): id
+            filter (string): One of: `all`, `none`.
+            fields (string): One of: `all`, `name`, `nameData`, `pos`, `state`,`type`, `due`, `dueReminder`, `idMember`.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_checklists_id_checkitems",
+        "POST",
+        "/checklists/{id}/checkItems",
+        (
+            ("id", "str", "path", True),
+            ("name", "str", "query", True),
+            ("pos", "Optional[Any]", "query"),
+            ("checked", "Optional[bool]", "query"),
+            ("due", "Optional[str]", "query"),
+            ("dueReminder", "Optional[float]", "query"),
+            ("idMember", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create Checkitem on Checklist
+
+        Args:
+            id (string): id
+            name (string): The name of the new check item on the checklist. Should be a string of length 1 to 16384.
+            pos (string): The position of the check item in the checklist. One of: `top`, `bottom`, or a positive number.
+            checked (boolean): Determines whether the check item is already checked when created.
+            due (string): A due date for the checkitem
+            dueReminder (number): A dueReminder for the due date on the checkitem
+            idMember (string): An ID of a member resource. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_check_item_detail",
+        "GET",
+        "/checklists/{id}/checkItems/{idCheckItem}",
+        (
+            ("id", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Checkitem on a Checklist
+
+        Args:
+            id (string): id
+            idCheckItem (string): idCheckItem
+            fields (string): One of: `all`, `name`, `nameData`, `pos`, `state`, `type`, `due`, `dueReminder`, `idMember`,.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_checklist_item_by_id",
+        "DELETE",
+        "/checklists/{id}/checkItems/{idCheckItem}",
+        (
+            ("id", "str", "path", True),
+            ("idCheckItem", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete Checkitem from Checklist
+
+        Args:
+            id (string): id
+            idCheckItem (string): idCheckItem
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_customfields",
+        "POST",
+        "/customFields",
+        (
+            ("idModel", "Optional[str]", "body"),
+            ("modelType", "Optional[str]", "body"),
+            ("name", "Optional[str]", "body"),
+            ("type", "Optional[str]", "body"),
+            ("options", "Optional[str]", "body"),
+            ("pos", "Optional[Any]", "body"),
+            ("display_cardFront", "Optional[bool]", "body"),
+        ),
+        "dict[str, Any]",
+        """
+        Create a new Custom Field on a Board
+
+        Args:
+            idModel (string): idModel Example: '5abbe4b7ddc1b351ef961414'.
+            modelType (string): The type of model that the Custom Field is being defined on. This should always be `board`.
+            name (string): The name of the Custom Field
+            type (string): The type of Custom Field to create.
+            options (string): If the type is `checkbox` 
+            pos (string): pos
+            display_cardFront (boolean): Whether this Custom Field should be shown on the front of Cards
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_customfields_id",
+        "GET",
+        "/customFields/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Custom Field
+
+        Args:
+            id (string): id
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_customfields_id",
+        "PUT",
+        "/customFields/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "body"),
+            ("pos", "Optional[Any]", "body"),
+            ("display_cardFront", "Optional[bool]", "body", False, "display/cardFront"),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Custom Field definition
+
+        Args:
+            id (string): id
+            name (string): The name of the Custom Field
+            pos (string): pos
+            display_cardFront (boolean): Whether to display this custom field on the front of cards
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_customfields_id",
+        "DELETE",
+        "/customFields/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Custom Field definition
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_customfields_id_options",
+        "POST",
+        "/customFields/{id}/options",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Add Option to Custom Field dropdown
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_customfields_id_options",
+        "GET",
+        "/customFields/{id}/options",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Options of Custom Field drop down
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_custom_field_option_by_id",
+        "GET",
+        "/customFields/{id}/options/{idCustomFieldOption}",
+        (
+            ("id", "str", "path", True),
+            ("idCustomFieldOption", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Option of Custom Field dropdown
+
+        Args:
+            id (string): id
+            idCustomFieldOption (string): idCustomFieldOption
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_custom_field_option",
+        "DELETE",
+        "/customFields/{id}/options/{idCustomFieldOption}",
+        (
+            ("id", "str", "path", True),
+            ("idCustomFieldOption", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete Option of Custom Field dropdown
+
+        Args:
+            id (string): id
+            idCustomFieldOption (string): idCustomFieldOption
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "emoji",
+        "GET",
+        "/emoji",
+        (
+            ("locale", "Optional[str]", "query"),
+            ("spritesheets", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        List available Emoji
+
+        Args:
+            locale (string): The locale to return emoji descriptions and names in. Defaults to the logged in member's locale.
+            spritesheets (boolean): `true` to return spritesheet URLs in the response
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_enterprises_id",
+        "GET",
+        "/enterprises/{id}",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("members", "Optional[str]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("member_filter", "Optional[str]", "query"),
+            ("member_sort", "Optional[str]", "query"),
+            ("member_sortBy", "Optional[str]", "query"),
+            ("member_sortOrder", "Optional[str]", "query"),
+            ("member_startIndex", "Optional[int]", "query"),
+            ("member_count", "Optional[int]", "query"),
+            ("organizations", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("organization_paid_accounts", "Optional[bool]", "query"),
+            ("organization_memberships", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get an Enterprise
+
+        Args:
+            id (string): id
+            fields (string): Comma-separated list of: `id`, `name`, `displayName`, `prefs`, `ssoActivationFailed`, `idAdmins`, `idMembers` (Note that the members array returned will be paginated if `members` is 'normal' or 'admins'. Pagination can be controlled with member_startIndex, etc, but the API response will not contain the total available result count or pagination status data. Read the SCIM documentation [here]() for more information on filtering), `idOrganizations`, `products`, `userTypes`, `idMembers`, `idOrganizations`
+            members (string): One of: `none`, `normal`, `admins`, `owners`, `all`
+            member_fields (string): One of: `avatarHash`, `fullName`, `initials`, `username`
+            member_filter (string): Pass a [SCIM-style query](/cloud/trello/scim/) to filter members. This takes precedence over the all/normal/admins value of members. If any of the member_* args are set, the member array will be paginated.
+            member_sort (string): This parameter expects a [SCIM-style](/cloud/trello/scim/) sorting value prefixed by a `-` to sort descending. If no `-` is prefixed, it will be sorted ascending. Note that the members array returned will be paginated if `members` is 'normal' or 'admins'. Pagination can be controlled with member_startIndex, etc, but the API response will not contain the total available result count or pagination status data.
+            member_sortBy (string): Deprecated: Please use member_sort. This parameter expects a [SCIM-style sorting value](/cloud/trello/scim/). Note that the members array returned will be paginated if `members` is `normal` or `admins`. Pagination can be controlled with `member_startIndex`, etc, and the API response's header will contain the total count and pagination state.
+            member_sortOrder (string): Deprecated: Please use member_sort. One of: `ascending`, `descending`, `asc`, `desc`
+            member_startIndex (integer): Any integer between 0 and 100.
+            member_count (integer): 0 to 100
+            organizations (string): One of: `none`, `members`, `public`, `all`
+            organization_fields (string): Any valid value that the [nested organization field resource]() accepts.
+            organization_paid_accounts (boolean): Whether or not to include paid account information in the returned workspace objects
+            organization_memberships (string): Comma-seperated list of: `me`, `normal`, `admin`, `active`, `deactivated`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_enterprises_id_auditlog",
+        "GET",
+        "/enterprises/{id}/auditlog",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get auditlog data for an Enterprise
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_enterprises_id_admins",
+        "GET",
+        "/enterprises/{id}/admins",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get Enterprise admin Members
+
+        Args:
+            id (string): id
+            fields (string): Any valid value that the [nested member field resource]() accepts.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_enterprises_id_signupurl",
+        "GET",
+        "/enterprises/{id}/signupUrl",
+        (
+            ("id", "str", "path", True),
+            ("authenticate", "Optional[bool]", "query"),
+            ("confirmationAccepted", "Optional[bool]", "query"),
+            ("returnUrl", "Optional[str]", "query"),
+            ("tosAccepted", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get signupUrl for Enterprise
+
+        Args:
+            id (string): id
+            authenticate (boolean): Optional boolean parameter to specify whether authentication should be performed during the signup process.
+            confirmationAccepted (boolean): Indicates whether the user has accepted the confirmation; defaults to false if not specified.
+            returnUrl (string): Any valid URL.
+            tosAccepted (boolean): Designates whether the user has seen/consented to the Trello ToS prior to being redirected to the enterprise signup page/their IdP.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_users_id",
+        "GET",
+        "/enterprises/{id}/members/query",
+        (
+            ("id", "str", "path", True),
+            ("licensed", "Optional[bool]", "query"),
+            ("deactivated", "Optional[bool]", "query"),
+            ("collaborator", "Optional[bool]", "query"),
+            ("managed", "Optional[bool]", "query"),
+            ("admin", "Optional[bool]", "query"),
+            ("activeSince", "Optional[str]", "query"),
+            ("inactiveSince", "Optional[str]", "query"),
+            ("search", "Optional[str]", "query"),
+            ("cursor", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Users of an Enterprise
+
+        Args:
+            id (string): id
+            licensed (boolean): When true, returns members who possess a license for the corresponding Trello Enterprise; when false, returns members who do not. If unspecified, both licensed and unlicensed members will be returned.
+            deactivated (boolean): When true, returns members who have been deactivated for the corresponding Trello Enterprise; when false, returns members who have not. If unspecified, both active and deactivated members will be returned.
+            collaborator (boolean): When true, returns members who are guests on one or more boards in the corresponding Trello Enterprise (but do not possess a license); when false, returns members who are not. If unspecified, both guests and non-guests will be returned.
+            managed (boolean): When true, returns members who are managed by the corresponding Trello Enterprise; when false, returns members who are not. If unspecified, both managed and unmanaged members will be returned.
+            admin (boolean): When true, returns members who are administrators of the corresponding Trello Enterprise; when false, returns members who are not. If unspecified, both admin and non-admin members will be returned.
+            activeSince (string): Returns only Trello users active since this date (inclusive).
+            inactiveSince (string): Returns only Trello users active since this date (inclusive).
+            search (string): Returns members with email address or full name that start with the search value.
+            cursor (string): Cursor to return next set of results, use cursor returned in the response to query the next batch.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_enterprises_id_members",
+        "GET",
+        "/enterprises/{id}/members",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("filter", "Optional[str]", "query"),
+            ("sort", "Optional[str]", "query"),
+            ("sortBy", "Optional[str]", "query"),
+            ("sortOrder", "Optional[str]", "query"),
+            ("startIndex", "Optional[int]", "query"),
+            ("count", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Members of Enterprise
+
+        Args:
+            id (string): id
+            fields (string): A comma-seperated list of valid [member fields](/cloud/trello/guides/rest-api/object-definitions/#member-object).
+            filter (string): Pass a [SCIM-style query](/cloud/trello/scim/) to filter members. This takes precedence over the all/normal/admins value of members. If any of the below member_* args are set, the member array will be paginated.
+            sort (string): This parameter expects a [SCIM-style](/cloud/trello/scim/) sorting value prefixed by a `-` to sort descending. If no `-` is prefixed, it will be sorted ascending. Note that the members array returned will be paginated if `members` is 'normal' or 'admins'. Pagination can be controlled with member_startIndex, etc, but the API response will not contain the total available result count or pagination status data.
+            sortBy (string): Deprecated: Please use `sort` instead. This parameter expects a [SCIM-style](/cloud/trello/scim/) sorting value. Note that the members array returned will be paginated if `members` is 'normal' or 'admins'. Pagination can be controlled with member_startIndex, etc, but the API response will not contain the total available result count or pagination status data.
+            sortOrder (string): Deprecated: Please use `sort` instead. One of: `ascending`, `descending`, `asc`, `desc`.
+            startIndex (integer): Any integer between 0 and 9999.
+            count (string): [SCIM-style filter](/cloud/trello/scim/).
+            organization_fields (string): Any valid value that the [nested organization field resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+            board_fields (string): Any valid value that the [nested board resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_details",
+        "GET",
+        "/enterprises/{id}/members/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Member of Enterprise
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            fields (string): A comma separated list of any valid values that the [nested member field resource]() accepts.
+            organization_fields (string): Any valid value that the [nested organization field resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+            board_fields (string): Any valid value that the [nested board resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organization_transfer",
+        "GET",
+        "/enterprises/{id}/transferrable/organization/{idOrganization}",
+        (
+            ("id", "str", "path", True),
+            ("idOrganization", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get whether an organization can be transferred to an enterprise.
+
+        Args:
+            id (string): id
+            idOrganization (string): idOrganization
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "list_enterprise_transferrables_by_org_ids",
+        "GET",
+        "/enterprises/{id}/transferrable/bulk/{idOrganizations}",
+        (
+            ("id", "str", "path", True),
+            ("idOrganizations", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get a bulk list of organizations that can be transferred to an enterprise.
+
+        Args:
+            id (string): id
+            idOrganizations (string): idOrganizations
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "bulk_join_enterprise_requests",
+        "PUT",
+        "/enterprises/${id}/enterpriseJoinRequest/bulk",
+        (
+            ("id", "str", "path", True),
+            ("idOrganizations", "List[Any]", "query", True),
+        ),
+        "Any",
+        """
+        Decline enterpriseJoinRequests from one organization or a bulk list of organizations.
+
+        Args:
+            id (string): id
+            idOrganizations (array): An array of IDs of an Organization resource.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "list_claimable_orgs",
+        "GET",
+        "/enterprises/{id}/claimableOrganizations",
+        (
+            ("id", "str", "path", True),
+            ("limit", "Optional[int]", "query"),
+            ("cursor", "Optional[str]", "query"),
+            ("name", "Optional[str]", "query"),
+            ("activeSince", "Optional[str]", "query"),
+            ("inactiveSince", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get ClaimableOrganizations of an Enterprise
+
+        Args:
+            id (string): id
+            limit (integer): Limits the number of workspaces to be sorted
+            cursor (string): Specifies the sort order to return matching documents
+            name (string): Name of the enterprise to retrieve workspaces for
+            activeSince (string): Date in YYYY-MM-DD format indicating the date to search up to for activeness of workspace
+            inactiveSince (string): Date in YYYY-MM-DD format indicating the date to search up to for inactiveness of workspace
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_pending_organizations",
+        "GET",
+        "/enterprises/{id}/pendingOrganizations",
+        (
+            ("id", "str", "path", True),
+            ("activeSince", "Optional[str]", "query"),
+            ("inactiveSince", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get PendingOrganizations of an Enterprise
+
+        Args:
+            id (string): id
+            activeSince (string): Date in YYYY-MM-DD format indicating the date to search up to for activeness of workspace
+            inactiveSince (string): Date in YYYY-MM-DD format indicating the date to search up to for inactiveness of workspace
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_enterprises_id_tokens",
+        "POST",
+        "/enterprises/{id}/tokens",
+        (
+            ("id", "str", "path", True),
+            ("expiration", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create an auth Token for an Enterprise.
+
+        Args:
+            id (string): id
+            expiration (string): One of: `1hour`, `1day`, `30days`, `never`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_enterprise_organizations_by_id",
+        "PUT",
+        "/enterprises/{id}/organizations",
+        (
+            ("id", "str", "path", True),
+            ("idOrganization", "str", "query", True),
+        ),
+        "list[Any]",
+        """
+        Transfer an Organization to an Enterprise.
+
+        Args:
+            id (string): id
+            idOrganization (string): ID of Organization to be transferred to Enterprise.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_enterprise_member_licensed",
+        "PUT",
+        "/enterprises/{id}/members/{idMember}/licensed",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Member's licensed status
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            value (boolean): Boolean value to determine whether the user should be given an Enterprise license (true) or not (false).
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "deactivate_member",
+        "PUT",
+        "/enterprises/{id}/members/{idMember}/deactivated",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("value", "bool", "query", True),
+            ("fields", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Deactivate a Member of an Enterprise.
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            value (boolean): Determines whether the user is deactivated or not.
+            fields (string): A comma separated list of any valid values that the [nested member field resource]() accepts.
+            organization_fields (string): Any valid value that the [nested organization resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+            board_fields (string): Any valid value that the [nested board resource](/cloud/trello/guides/rest-api/nested-resources/) accepts.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_admin_member",
+        "PUT",
+        "/enterprises/{id}/admins/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Update Member to be admin of Enterprise
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_enterprise_admin_by_id",
+        "DELETE",
+        "/enterprises/{id}/admins/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Member as admin from Enterprise.
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_organization_by_id_and_org_id",
+        "DELETE",
+        "/enterprises/{id}/organizations/{idOrg}",
+        (
+            ("id", "str", "path", True),
+            ("idOrg", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete an Organization from an Enterprise.
+
+        Args:
+            id (string): id
+            idOrg (string): idOrg
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_bulk_organizations_by_ids",
+        "GET",
+        "/enterprises/{id}/organizations/bulk/{idOrganizations}",
+        (
+            ("id", "str", "path", True),
+            ("idOrganizations", "str", "path", True),
+        ),
+        "Any",
+        """
+        Bulk accept a set of organizations to an Enterprise.
+
+        Args:
+            id (string): id
+            idOrganizations (string): idOrganizations
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_labels_id",
+        "GET",
+        "/labels/{id}",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Label
+
+        Args:
+            id (string): id
+            fields (string): all or a comma-separated list of [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_labels_id",
+        "PUT",
+        "/labels/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("color", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update a Label
+
+        Args:
+            id (string): id
+            name (string): The new name for the label
+            color (string): The new color for the label. See: [fields](/cloud/trello/guides/rest-api/object-definitions/) for color options
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_labels_id",
+        "DELETE",
+        "/labels/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Label
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_labels_id_field",
+        "PUT",
+        "/labels/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update a field on a label
+
+        Args:
+            id (string): id
+            field (string): field
+            value (string): The new value for the field. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_labels",
+        "POST",
+        "/labels",
+        (
+            ("name", "str", "query", True),
+            ("color", "str", "query", True),
+            ("idBoard", "str", "query", True),
+        ),
+        "Any",
+        """
+        Create a Label
+
+        Args:
+            name (string): Name for the label
+            color (string): The color for the label.
+            idBoard (string): The ID of the Board to create the Label on.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_lists_id",
+        "GET",
+        "/lists/{id}",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a List
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma separated list of List field names.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_lists_id",
+        "PUT",
+        "/lists/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("closed", "Optional[bool]", "query"),
+            ("idBoard", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+            ("subscribed", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Update a List
+
+        Args:
+            id (string): id
+            name (string): New name for the list
+            closed (boolean): Whether the list should be closed (archived)
+            idBoard (string): ID of a board the list should be moved to Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): New position for the list: `top`, `bottom`, or a positive floating point number
+            subscribed (boolean): Whether the active member is subscribed to this list
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_lists",
+        "POST",
+        "/lists",
+        (
+            ("name", "str", "query", True),
+            ("idBoard", "str", "query", True),
+            ("idListSource", "Optional[str]", "query"),
+            ("pos", "Optional[Any]", "query"),
+        ),
+        "Any",
+        """
+        Create a new List
+
+        Args:
+            name (string): Name for the list
+            idBoard (string): The long ID of the board the list should be created on Example: '5abbe4b7ddc1b351ef961414'.
+            idListSource (string): ID of the List to copy into the new List Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): Position of the list. `top`, `bottom`, or a positive floating point number
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_lists_id_archiveallcards",
+        "POST",
+        "/lists/{id}/archiveAllCards",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Archive all Cards in List
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_lists_id_moveallcards",
+        "POST",
+        "/lists/{id}/moveAllCards",
+        (
+            ("id", "str", "path", True),
+            ("idBoard", "str", "query", True),
+            ("idList", "str", "query", True),
+        ),
+        "Any",
+        """
+        Move all Cards in List
+
+        Args:
+            id (string): id
+            idBoard (string): The ID of the board the cards should be moved to Example: '5abbe4b7ddc1b351ef961414'.
+            idList (string): The ID of the list that the cards should be moved to Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_lists_id_closed",
+        "PUT",
+        "/lists/{id}/closed",
+        (
+            ("id", "str", "path", True),
+            ("value", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Archive or unarchive a list
+
+        Args:
+            id (string): id
+            value (string): Set to true to close (archive) the list Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_id_idboard",
+        "PUT",
+        "/lists/{id}/idBoard",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Move List to Board
+
+        Args:
+            id (string): id
+            value (string): The ID of the board to move the list to Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_lists_id_field",
+        "PUT",
+        "/lists/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+            ("value", "Optional[Any]", "query"),
+        ),
+        "Any",
+        """
+        Update a field on a List
+
+        Args:
+            id (string): id
+            field (string): field
+            value (string): The new value for the field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_lists_id_actions",
+        "GET",
+        "/lists/{id}/actions",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get Actions for a List
+
+        Args:
+            id (string): id
+            filter (string): A comma-separated list of [action types](
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_lists_id_board",
+        "GET",
+        "/lists/{id}/board",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Board a List is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/#board-object)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_lists_id_cards",
+        "GET",
+        "/lists/{id}/cards",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Cards in a List
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id",
+        "GET",
+        "/members/{id}",
+        (
+            ("id", "str", "path", True),
+            ("actions", "Optional[str]", "query"),
+            ("boards", "Optional[str]", "query"),
+            ("boardBackgrounds", "Optional[str]", "query"),
+            ("boardsInvited", "Optional[str]", "query"),
+            ("boardsInvited_fields", "Optional[str]", "query"),
+            ("boardStars", "Optional[bool]", "query"),
+            ("cards", "Optional[str]", "query"),
+            ("customBoardBackgrounds", "Optional[str]", "query"),
+            ("customEmoji", "Optional[str]", "query"),
+            ("customStickers", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("notifications", "Optional[str]", "query"),
+            ("organizations", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("organization_paid_account", "Optional[bool]", "query"),
+            ("organizationsInvited", "Optional[str]", "query"),
+            ("organizationsInvited_fields", "Optional[str]", "query"),
+            ("paid_account", "Optional[bool]", "query"),
+            ("savedSearches", "Optional[bool]", "query"),
+            ("tokens", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Member
+
+        Args:
+            id (string): id
+            actions (string): See the [Actions Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#actions-nested-resource)
+            boards (string): See the [Boards Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#boards-nested-resource)
+            boardBackgrounds (string): One of: `all`, `custom`, `default`, `none`, `premium`
+            boardsInvited (string): `all` or a comma-separated list of: closed, members, open, organization, pinned, public, starred, unpinned
+            boardsInvited_fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            boardStars (boolean): Whether to return the boardStars or not
+            cards (string): See the [Cards Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#cards-nested-resource) for additional options
+            customBoardBackgrounds (string): `all` or `none`
+            customEmoji (string): `all` or `none`
+            customStickers (string): `all` or `none`
+            fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            notifications (string): See the [Notifications Nested Resource](/cloud/trello/guides/rest-api/nested-resources/#notifications-nested-resource)
+            organizations (string): One of: `all`, `members`, `none`, `public`
+            organization_fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            organization_paid_account (boolean): Whether or not to include paid account information in the returned workspace object
+            organizationsInvited (string): One of: `all`, `members`, `none`, `public`
+            organizationsInvited_fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            paid_account (boolean): Whether or not to include paid account information in the returned member object
+            savedSearches (boolean): Indicates whether to include saved searches in the response for the specified member.
+            tokens (string): `all` or `none`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_members_id",
+        "PUT",
+        "/members/{id}",
+        (
+            ("id", "str", "path", True),
+            ("fullName", "Optional[str]", "query"),
+            ("initials", "Optional[str]", "query"),
+            ("username", "Optional[str]", "query"),
+            ("bio", "Optional[str]", "query"),
+            ("avatarSource", "Optional[str]", "query"),
+            ("prefs_colorBlind", "Optional[bool]", "query", False, "prefs/colorBlind"),
+            ("prefs_locale", "Optional[str]", "query", False, "prefs/locale"),
+            ("prefs_minutesBetweenSummaries", "Optional[int]", "query", False, "prefs/minutesBetweenSummaries"),
+        ),
+        "Any",
+        """
+        Update a Member
+
+        Args:
+            id (string): id
+            fullName (string): New name for the member. Cannot begin or end with a space.
+            initials (string): New initials for the member. 1-4 characters long.
+            username (string): New username for the member. At least 3 characters long, only lowercase letters, underscores, and numbers. Must be unique.
+            bio (string): Provides a brief biography for the member, included as an optional string in the query parameter.
+            avatarSource (string): One of: `gravatar`, `none`, `upload`
+            prefs_colorBlind (boolean): Indicates whether the member's preferences should accommodate color blindness by adjusting visual elements, with true enabling colorblind-friendly settings.
+            prefs_locale (string): Optional query parameter specifying the preferred locale for the member, allowing language or region-specific preferences to be set during the update.
+            prefs_minutesBetweenSummaries (integer): `-1` for disabled, `1`, or `60`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_field",
+        "GET",
+        "/members/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get a field on a Member
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_actions",
+        "GET",
+        "/members/{id}/actions",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get a Member's Actions
+
+        Args:
+            id (string): id
+            filter (string): A comma-separated list of [action types](
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_board_backgrounds_by_id",
+        "GET",
+        "/members/{id}/boardBackgrounds",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Member's custom Board backgrounds
+
+        Args:
+            id (string): id
+            filter (string): One of: `all`, `custom`, `default`, `none`, `premium`
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "create_board_background",
+        "POST",
+        "/members/{id}/boardBackgrounds",
+        (
+            ("id", "str", "path", True),
+            ("file", "bytes", "file", True),
+        ),
+        "list[Any]",
+        """
+        Upload new boardBackground for Member
+
+        Args:
+            id (string): id
+            file (bytes): The board background image: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_board_backgrounds",
+        "GET",
+        "/members/{id}/boardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a boardBackground of a Member
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+            fields (string): `all` or a comma-separated list of: `brightness`, `fullSizeUrl`, `scaled`, `tile`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_background",
+        "PUT",
+        "/members/{id}/boardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+            ("brightness", "Optional[str]", "query"),
+            ("tile", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Member's custom Board background
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+            brightness (string): One of: `dark`, `light`, `unknown`
+            tile (boolean): Whether the background should be tiled
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_board_background_by_id",
+        "DELETE",
+        "/members/{id}/boardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Member's custom Board background
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_boardstars",
+        "GET",
+        "/members/{id}/boardStars",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get a Member's boardStars
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_members_id_boardstars",
+        "POST",
+        "/members/{id}/boardStars",
+        (
+            ("id", "str", "path", True),
+            ("idBoard", "str", "query", True),
+            ("pos", "Any", "query", True),
+        ),
+        "list[Any]",
+        """
+        Create Star for Board
+
+        Args:
+            id (string): id
+            idBoard (string): The ID of the board to star Example: '5abbe4b7ddc1b351ef961414'.
+            pos (string): The position of the newly starred board. `top`, `bottom`, or a positive float.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_board_star_by_id",
+        "GET",
+        "/members/{id}/boardStars/{idStar}",
+        (
+            ("id", "str", "path", True),
+            ("idStar", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a boardStar of Member
+
+        Args:
+            id (string): id
+            idStar (string): idStar
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_board_star_position",
+        "PUT",
+        "/members/{id}/boardStars/{idStar}",
+        (
+            ("id", "str", "path", True),
+            ("idStar", "str", "path", True),
+            ("pos", "Optional[Any]", "query"),
+        ),
+        "Any",
+        """
+        Update the position of a boardStar of Member
+
+        Args:
+            id (string): id
+            idStar (string): idStar
+            pos (string): New position for the starred board. `top`, `bottom`, or a positive float.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_board_star",
+        "DELETE",
+        "/members/{id}/boardStars/{idStar}",
+        (
+            ("id", "str", "path", True),
+            ("idStar", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete Star for Board
+
+        Args:
+            id (string): id
+            idStar (string): idStar
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_boards",
+        "GET",
+        "/members/{id}/boards",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("lists", "Optional[str]", "query"),
+            ("organization", "Optional[bool]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Boards that Member belongs to
+
+        Args:
+            id (string): id
+            filter (string): `all` or a comma-separated list of: `closed`, `members`, `open`, `organization`, `public`, `starred`
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            lists (string): Which lists to include with the boards. One of: `all`, `closed`, `none`, `open`
+            organization (boolean): Whether to include the Organization object with the Boards
+            organization_fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_boardsinvited",
+        "GET",
+        "/members/{id}/boardsInvited",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Boards the Member has been invited to
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_cards",
+        "GET",
+        "/members/{id}/cards",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Cards the Member is on
+
+        Args:
+            id (string): id
+            filter (string): One of: `all`, `closed`, `complete`, `incomplete`, `none`, `open`, `visible`
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_custom_board_backgrounds_by_id",
+        "GET",
+        "/members/{id}/customBoardBackgrounds",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get a Member's custom Board Backgrounds
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "set_custom_board_backgrounds",
+        "POST",
+        "/members/{id}/customBoardBackgrounds",
+        (
+            ("id", "str", "path", True),
+            ("file", "bytes", "file", True),
+        ),
+        "dict[str, Any]",
+        """
+        Create a new custom Board Background
+
+        Args:
+            id (string): id
+            file (bytes): The board background image: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_custom_board_backgrounds_by_id_back",
+        "GET",
+        "/members/{id}/customBoardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get custom Board Background of Member
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_member_custom_board_background",
+        "PUT",
+        "/members/{id}/customBoardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+            ("brightness", "Optional[str]", "query"),
+            ("tile", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update custom Board Background of Member
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+            brightness (string): One of: `dark`, `light`, `unknown`
+            tile (boolean): Whether to tile the background
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_custom_background_by_id",
+        "DELETE",
+        "/members/{id}/customBoardBackgrounds/{idBackground}",
+        (
+            ("id", "str", "path", True),
+            ("idBackground", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete custom Board Background of Member
+
+        Args:
+            id (string): id
+            idBackground (string): idBackground
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_customemoji",
+        "GET",
+        "/members/{id}/customEmoji",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get a Member's customEmojis
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_members_id_customemoji",
+        "POST",
+        "/members/{id}/customEmoji",
+        (
+            ("id", "str", "path", True),
+            ("file", "bytes", "file", True),
+            ("name", "str", "query", True),
+        ),
+        "dict[str, Any]",
+        """
+        Create custom Emoji for Member
+
+        Args:
+            id (string): id
+            file (bytes): The emoji image: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+            name (string): Name for the emoji. 2 - 64 characters
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "membersidcustomemojiidemoji",
+        "GET",
+        "/members/{id}/customEmoji/{idEmoji}",
+        (
+            ("id", "str", "path", True),
+            ("idEmoji", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Member's custom Emoji
+
+        Args:
+            id (string): id
+            idEmoji (string): idEmoji
+            fields (string): `all` or a comma-separated list of `name`, `url`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_customstickers",
+        "GET",
+        "/members/{id}/customStickers",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Member's custom Stickers
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_members_id_customstickers",
+        "POST",
+        "/members/{id}/customStickers",
+        (
+            ("id", "str", "path", True),
+            ("file", "bytes", "file", True),
+        ),
+        "dict[str, Any]",
+        """
+        Create custom Sticker for Member
+
+        Args:
+            id (string): id
+            file (bytes): The sticker image: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_custom_sticker_by_id",
+        "GET",
+        "/members/{id}/customStickers/{idSticker}",
+        (
+            ("id", "str", "path", True),
+            ("idSticker", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Member's custom Sticker
+
+        Args:
+            id (string): id
+            idSticker (string): idSticker
+            fields (string): `all` or a comma-separated list of `scaled`, `url`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_member_custom_sticker_by_id",
+        "DELETE",
+        "/members/{id}/customStickers/{idSticker}",
+        (
+            ("id", "str", "path", True),
+            ("idSticker", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Member's custom Sticker
+
+        Args:
+            id (string): id
+            idSticker (string): idSticker
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_notifications",
+        "GET",
+        "/members/{id}/notifications",
+        (
+            ("id", "str", "path", True),
+            ("entities", "Optional[bool]", "query"),
+            ("display", "Optional[bool]", "query"),
+            ("filter", "Optional[str]", "query"),
+            ("read_filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("limit", "Optional[int]", "query"),
+            ("page", "Optional[int]", "query"),
+            ("before", "Optional[str]", "query"),
+            ("since", "Optional[str]", "query"),
+            ("memberCreator", "Optional[bool]", "query"),
+            ("memberCreator_fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Member's Notifications
+
+        Args:
+            id (string): id
+            entities (boolean): Optional boolean query parameter indicating whether to include entities in the response, defaulting to false.
+            display (boolean): Determines if notifications should be displayed for the member (defaults to false).
+            filter (string): Optional string parameter to filter notifications for the specified member, defaulting to "all" if not provided.
+            read_filter (string): One of: `all`, `read`, `unread`
+            fields (string): `all` or a comma-separated list of notification [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            limit (integer): Max 1000
+            page (integer): Max 100
+            before (string): A notification ID
+            since (string): A notification ID
+            memberCreator (boolean): Filter notifications to only include those created by the member specified by the {id} when set to true; defaults to true if not provided.
+            memberCreator_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_organizations",
+        "GET",
+        "/members/{id}/organizations",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("paid_account", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Member's Organizations
+
+        Args:
+            id (string): id
+            filter (string): One of: `all`, `members`, `none`, `public` (Note: `members` filters to only private Workspaces)
+            fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            paid_account (boolean): Whether or not to include paid account information in the returned workspace object
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_organizations_invited",
+        "GET",
+        "/members/{id}/organizationsInvited",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Organizations a Member has been invited to
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_savedsearches",
+        "GET",
+        "/members/{id}/savedSearches",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Member's saved searched
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_members_id_savedsearches",
+        "POST",
+        "/members/{id}/savedSearches",
+        (
+            ("id", "str", "path", True),
+            ("name", "str", "query", True),
+            ("query", "str", "query", True),
+            ("pos", "Any", "query", True),
+        ),
+        "dict[str, Any]",
+        """
+        Create saved Search for Member
+
+        Args:
+            id (string): id
+            name (string): The name for the saved search
+            query (string): The search query
+            pos (string): The position of the saved search. `top`, `bottom`, or a positive float.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_saved_searches_by_id",
+        "GET",
+        "/members/{id}/savedSearches/{idSearch}",
+        (
+            ("id", "str", "path", True),
+            ("idSearch", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a saved search
+
+        Args:
+            id (string): id
+            idSearch (string): idSearch
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_member_saved_search",
+        "PUT",
+        "/members/{id}/savedSearches/{idSearch}",
+        (
+            ("id", "str", "path", True),
+            ("idSearch", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("query", "Optional[str]", "query"),
+            ("pos", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update a saved search
+
+        Args:
+            id (string): id
+            idSearch (string): idSearch
+            name (string): The new name for the saved search
+            query (string): The new search query
+            pos (string): New position for saves search. `top`, `bottom`, or a positive float.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_saved_search",
+        "DELETE",
+        "/members/{id}/savedSearches/{idSearch}",
+        (
+            ("id", "str", "path", True),
+            ("idSearch", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a saved search
+
+        Args:
+            id (string): id
+            idSearch (string): idSearch
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_members_id_tokens",
+        "GET",
+        "/members/{id}/tokens",
+        (
+            ("id", "str", "path", True),
+            ("webhooks", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Member's Tokens
+
+        Args:
+            id (string): id
+            webhooks (boolean): Whether to include webhooks
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "membersidavatar",
+        "POST",
+        "/members/{id}/avatar",
+        (
+            ("id", "str", "path", True),
+            ("file", "bytes", "file", True),
+        ),
+        "Any",
+        """
+        Create Avatar for Member
+
+        Args:
+            id (string): id
+            file (bytes): The avatar image: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_member_one_time_messages_dismissed",
+        "POST",
+        "/members/{id}/oneTimeMessagesDismissed",
+        (
+            ("id", "str", "path", True),
+            ("value", "str", "query", True),
+        ),
+        "Any",
+        """
+        Dismiss a message for Member
+
+        Args:
+            id (string): id
+            value (string): The message to dismiss Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_notifications_channel_settings",
+        "GET",
+        "/members/{id}/notificationsChannelSettings",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get a Member's notification channel settings
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_notification_channel_settings",
+        "PUT",
+        "/members/{id}/notificationsChannelSettings",
+        (
+            ("id", "str", "path", True),
+            ("channel", "str", "body", True),
+            ("blockedKeys", "Any", "body", True),
+        ),
+        "Any",
+        """
+        Update blocked notification keys of Member on a channel
+
+        Args:
+            id (string): id
+            channel (string): channel Example: 'email'.
+            blockedKeys (string): Blocked key or array of blocked keys.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_notification_channel_settings",
+        "GET",
+        "/members/{id}/notificationsChannelSettings/{channel}",
+        (
+            ("id", "str", "path", True),
+            ("channel", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get blocked notification keys of Member on this channel
+
+        Args:
+            id (string): id
+            channel (string): channel
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_member_notification_channel_settings",
+        "PUT",
+        "/members/{id}/notificationsChannelSettings/{channel}",
+        (
+            ("id", "str", "path", True),
+            ("channel", "str", "path", True),
+            ("blockedKeys", "Any", "body", True),
+        ),
+        "Any",
+        """
+        Update blocked notification keys of Member on a channel
+
+        Args:
+            id (string): id
+            channel (string): channel
+            blockedKeys (string): Singular key or array of notification keys
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_notification_settings",
+        "PUT",
+        "/members/{id}/notificationsChannelSettings/{channel}/{blockedKeys}",
+        (
+            ("id", "str", "path", True),
+            ("channel", "str", "path", True),
+            ("blockedKeys", "str", "path", True),
+        ),
+        "Any",
+        """
+        Update blocked notification keys of Member on a channel
+
+        Args:
+            id (string): id
+            channel (string): channel
+            blockedKeys (string): blockedKeys
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notifications_id",
+        "GET",
+        "/notifications/{id}",
+        (
+            ("id", "str", "path", True),
+            ("board", "Optional[bool]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+            ("card", "Optional[bool]", "query"),
+            ("card_fields", "Optional[str]", "query"),
+            ("display", "Optional[bool]", "query"),
+            ("entities", "Optional[bool]", "query"),
+            ("fields", "Optional[str]", "query"),
+            ("list", "Optional[bool]", "query"),
+            ("member", "Optional[bool]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("memberCreator", "Optional[bool]", "query"),
+            ("memberCreator_fields", "Optional[str]", "query"),
+            ("organization", "Optional[bool]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Notification
+
+        Args:
+            id (string): id
+            board (boolean): Whether to include the board object
+            board_fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            card (boolean): Whether to include the card object
+            card_fields (string): `all` or a comma-separated list of card [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            display (boolean): Whether to include the display object with the results
+            entities (boolean): Whether to include the entities object with the results
+            fields (string): `all` or a comma-separated list of notification [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            list (boolean): Whether to include the list object
+            member (boolean): Whether to include the member object
+            member_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            memberCreator (boolean): Whether to include the member object of the creator
+            memberCreator_fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+            organization (boolean): Whether to include the organization object
+            organization_fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_notifications_id",
+        "PUT",
+        "/notifications/{id}",
+        (
+            ("id", "str", "path", True),
+            ("unread", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Update a Notification's read status
+
+        Args:
+            id (string): id
+            unread (boolean): Whether the notification should be marked as read or not
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notifications_id_field",
+        "GET",
+        "/notifications/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get a field of a Notification
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_notifications_all_read",
+        "POST",
+        "/notifications/all/read",
+        (
+            ("read", "Optional[bool]", "query"),
+            ("ids", "Optional[List[str]]", "query"),
+        ),
+        "Any",
+        """
+        Mark all Notifications as read
+
+        Args:
+            read (boolean): Boolean to specify whether to mark as read or unread (defaults to `true`, marking as read)
+            ids (array): A comma-seperated list of IDs. Allows specifying an array of notification IDs to change the read state for. This will become useful as we add grouping of notifications to the UI, with a single button to mark all notifications in the group as read/unread.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_notifications_id_unread",
+        "PUT",
+        "/notifications/{id}/unread",
+        (
+            ("id", "str", "path", True),
+            ("value", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update Notification's read status
+
+        Args:
+            id (string): id
+            value (string): The "value" query parameter optionally specifies the new unread status as a string for the notification identified by {id}.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notifications_id_board",
+        "GET",
+        "/notifications/{id}/board",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Board a Notification is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of board[fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notifications_id_card",
+        "GET",
+        "/notifications/{id}/card",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Card a Notification is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of card [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notifications_id_list",
+        "GET",
+        "/notifications/{id}/list",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the List a Notification is on
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of list [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "notificationsidmember",
+        "GET",
+        "/notifications/{id}/member",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Member a Notification is about (not the creator)
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_creator_details",
+        "GET",
+        "/notifications/{id}/memberCreator",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get the Member who created the Notification
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of member [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_notification_org",
+        "GET",
+        "/notifications/{id}/organization",
+        (
+            ("id", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Get a Notification's associated Organization
+
+        Args:
+            id (string): id
+            fields (string): `all` or a comma-separated list of organization [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_organizations",
+        "POST",
+        "/organizations",
+        (
+            ("displayName", "str", "query", True),
+            ("desc", "Optional[str]", "query"),
+            ("name", "Optional[str]", "query"),
+            ("website", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Create a new Organization
+
+        Args:
+            displayName (string): The name to display for the Organization
+            desc (string): The description for the organizations
+            name (string): A string with a length of at least 3. Only lowercase letters, underscores, and numbers are allowed. If the name contains invalid characters, they will be removed. If the name conflicts with an existing name, a new name will be substituted.
+            website (string): A URL starting with ` or `
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id",
+        "GET",
+        "/organizations/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get an Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_organizations_id",
+        "PUT",
+        "/organizations/{id}",
+        (
+            ("id", "str", "path", True),
+            ("name", "Optional[str]", "query"),
+            ("displayName", "Optional[str]", "query"),
+            ("desc", "Optional[str]", "query"),
+            ("website", "Optional[str]", "query"),
+            ("prefs_associatedDomain", "Optional[str]", "query", False, "prefs/associatedDomain"),
+            ("prefs_externalMembersDisabled", "Optional[bool]", "query", False, "prefs/externalMembersDisabled"),
+            ("prefs_googleAppsVersion", "Optional[int]", "query", False, "prefs/googleAppsVersion"),
+            ("prefs_boardVisibilityRestrict_org", "Optional[str]", "query", False, "prefs/boardVisibilityRestrict/org"),
+            ("prefs_boardVisibilityRestrict_private", "Optional[str]", "query", False, "prefs/boardVisibilityRestrict/private"),
+            ("prefs_boardVisibilityRestrict_public", "Optional[str]", "query", False, "prefs/boardVisibilityRestrict/public"),
+            ("prefs_orgInviteRestrict", "Optional[str]", "query", False, "prefs/orgInviteRestrict"),
+            ("prefs_permissionLevel", "Optional[str]", "query", False, "prefs/permissionLevel"),
+        ),
+        "dict[str, Any]",
+        """
+        Update an Organization
+
+        Args:
+            id (string): id
+            name (string): A new name for the organization. At least 3 lowercase letters, underscores, and numbers. Must be unique
+            displayName (string): A new displayName for the organization. Must be at least 1 character long and not begin or end with a space.
+            desc (string): A new description for the organization
+            website (string): A URL starting with ` ` or `null`
+            prefs_associatedDomain (string): The Google Apps domain to link this org to.
+            prefs_externalMembersDisabled (boolean): Whether non-workspace members can be added to boards inside the Workspace
+            prefs_googleAppsVersion (integer): `1` or `2`
+            prefs_boardVisibilityRestrict_org (string): Who on the Workspace can make Workspace visible boards. One of `admin`, `none`, `org`
+            prefs_boardVisibilityRestrict_private (string): Who can make private boards. One of: `admin`, `none`, `org`
+            prefs_boardVisibilityRestrict_public (string): Who on the Workspace can make public boards. One of: `admin`, `none`, `org`
+            prefs_orgInviteRestrict (string): An email address with optional wildcard characters. (E.g. `subdomain.*.trello.com`)
+            prefs_permissionLevel (string): Whether the Workspace page is publicly visible. One of: `private`, `public`
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_organizations_id",
+        "DELETE",
+        "/organizations/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete an Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_field",
+        "GET",
+        "/organizations/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get field on Organization
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_actions",
+        "GET",
+        "/organizations/{id}/actions",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Actions for Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_boards",
+        "GET",
+        "/organizations/{id}/boards",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Boards in an Organization
+
+        Args:
+            id (string): id
+            filter (string): `all` or a comma-separated list of: `open`, `closed`, `members`, `organization`, `public`
+            fields (string): `all` or a comma-separated list of board [fields](/cloud/trello/guides/rest-api/object-definitions/)
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_organizations_id_exports",
+        "POST",
+        "/organizations/{id}/exports",
+        (
+            ("id", "str", "path", True),
+            ("attachments", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Create Export for Organizations
+
+        Args:
+            id (string): id
+            attachments (boolean): Whether the CSV should include attachments or not.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_exports",
+        "GET",
+        "/organizations/{id}/exports",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Retrieve Organization's Exports
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_members",
+        "GET",
+        "/organizations/{id}/members",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get the Members of an Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_organizations_id_members",
+        "PUT",
+        "/organizations/{id}/members",
+        (
+            ("id", "str", "path", True),
+            ("email", "str", "query", True),
+            ("fullName", "str", "query", True),
+            ("type", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update an Organization's Members
+
+        Args:
+            id (string): id
+            email (string): An email address
+            fullName (string): Name for the member, at least 1 character not beginning or ending with a space
+            type (string): One of: `admin`, `normal`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organization_memberships",
+        "GET",
+        "/organizations/{id}/memberships",
+        (
+            ("id", "str", "path", True),
+            ("filter", "Optional[str]", "query"),
+            ("member", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Get Memberships of an Organization
+
+        Args:
+            id (string): id
+            filter (string): `all` or a comma-separated list of: `active`, `admin`, `deactivated`, `me`, `normal`
+            member (boolean): Whether to include the Member objects with the Memberships
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_membership_details",
+        "GET",
+        "/organizations/{id}/memberships/{idMembership}",
+        (
+            ("id", "str", "path", True),
+            ("idMembership", "str", "path", True),
+            ("member", "Optional[bool]", "query"),
+        ),
+        "Any",
+        """
+        Get a Membership of an Organization
+
+        Args:
+            id (string): id
+            idMembership (string): idMembership
+            member (boolean): Whether to include the Member object in the response
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organization_plugin_data_by_id",
+        "GET",
+        "/organizations/{id}/pluginData",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get the pluginData Scoped to Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_organizations_id_tags",
+        "GET",
+        "/organizations/{id}/tags",
+        (
+            ("id", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Tags of an Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_organizations_id_tags",
+        "POST",
+        "/organizations/{id}/tags",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Create a Tag in Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_member_type",
+        "PUT",
+        "/organizations/{id}/members/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("type", "str", "query", True),
+        ),
+        "Any",
+        """
+        Update a Member of an Organization
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            type (string): One of: `admin`, `normal`
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "remove_organization_member",
+        "DELETE",
+        "/organizations/{id}/members/{idMember}",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Member from an Organization
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "deactivate_member_org",
+        "PUT",
+        "/organizations/{id}/members/{idMember}/deactivated",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+            ("value", "bool", "query", True),
+        ),
+        "Any",
+        """
+        Deactivate or reactivate a member of an Organization
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+            value (boolean): Indicates whether the member is deactivated, with `true` deactivating the member and `false` reactivating them.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_organizations_id_logo",
+        "POST",
+        "/organizations/{id}/logo",
+        (
+            ("id", "str", "path", True),
+            ("file", "Optional[bytes]", "file"),
+        ),
+        "Any",
+        """
+        Update logo for an Organization
+
+        Args:
+            id (string): id
+            file (bytes): Image file for the logo: its contents, or an open binary file; streamed as multipart/form-data. Use `TrelloApp.upload` to send a file from disk.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_organizations_id_logo",
+        "DELETE",
+        "/organizations/{id}/logo",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete Logo for Organization
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_organization_member_all",
+        "DELETE",
+        "/organizations/{id}/members/{idMember}/all",
+        (
+            ("id", "str", "path", True),
+            ("idMember", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove a Member from an Organization and all Organization Boards
+
+        Args:
+            id (string): id
+            idMember (string): idMember
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_associated_domain",
+        "DELETE",
+        "/organizations/{id}/prefs/associatedDomain",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Remove the associated Google Apps domain from a Workspace
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_org_invite_restrict_by_id",
+        "DELETE",
+        "/organizations/{id}/prefs/orgInviteRestrict",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete the email domain restriction on who can be invited to the Workspace
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_organization_tag_by_id_tag",
+        "DELETE",
+        "/organizations/{id}/tags/{idTag}",
+        (
+            ("id", "str", "path", True),
+            ("idTag", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete an Organization's Tag
+
+        Args:
+            id (string): id
+            idTag (string): idTag
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_guests_by_board",
+        "GET",
+        "/organizations/{id}/newBillableGuests/{idBoard}",
+        (
+            ("id", "str", "path", True),
+            ("idBoard", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Organizations new billable guests
+
+        Args:
+            id (string): id
+            idBoard (string): idBoard
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_plugins_id",
+        "GET",
+        "/plugins/{id}/",
+        (
+            ("id", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Plugin
+
+        Args:
+            id (string): id
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_plugins_id",
+        "PUT",
+        "/plugins/{id}/",
+        (
+            ("id", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Plugin
+
+        Args:
+            id (string): id
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_plugins_idplugin_listing",
+        "POST",
+        "/plugins/{idPlugin}/listing",
+        (
+            ("idPlugin", "str", "path", True),
+            ("description", "Optional[str]", "body"),
+            ("locale", "Optional[str]", "body"),
+            ("overview", "Optional[str]", "body"),
+            ("name", "Optional[str]", "body"),
+        ),
+        "dict[str, Any]",
+        """
+        Create a Listing for Plugin
+
+        Args:
+            idPlugin (string): idPlugin
+            description (string): The description to show for the given locale
+            locale (string): The locale that this listing should be displayed for.
+            overview (string): The overview to show for the given locale.
+            name (string): The name to use for the given locale.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_member_privacy_compliance",
+        "GET",
+        "/plugins/{id}/compliance/memberPrivacy",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get Plugin's Member privacy compliance
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "update_plugin_listing",
+        "PUT",
+        "/plugins/{idPlugin}/listings/{idListing}",
+        (
+            ("idPlugin", "str", "path", True),
+            ("idListing", "str", "path", True),
+            ("description", "Optional[str]", "body"),
+            ("locale", "Optional[str]", "body"),
+            ("overview", "Optional[str]", "body"),
+            ("name", "Optional[str]", "body"),
+        ),
+        "dict[str, Any]",
+        """
+        Updating Plugin's Listing
+
+        Args:
+            idPlugin (string): idPlugin
+            idListing (string): idListing
+            description (string): The description to show for the given locale
+            locale (string): The locale that this listing should be displayed for.
+            overview (string): The overview to show for the given locale.
+            name (string): The name to use for the given locale.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_search",
+        "GET",
+        "/search",
+        (
+            ("query", "str", "query", True),
+            ("idBoards", "Optional[Any]", "query"),
+            ("idOrganizations", "Optional[str]", "query"),
+            ("idCards", "Optional[str]", "query"),
+            ("modelTypes", "Optional[str]", "query"),
+            ("board_fields", "Optional[str]", "query"),
+            ("boards_limit", "Optional[int]", "query"),
+            ("board_organization", "Optional[bool]", "query"),
+            ("card_fields", "Optional[str]", "query"),
+            ("cards_limit", "Optional[int]", "query"),
+            ("cards_page", "Optional[float]", "query"),
+            ("card_board", "Optional[bool]", "query"),
+            ("card_list", "Optional[bool]", "query"),
+            ("card_members", "Optional[bool]", "query"),
+            ("card_stickers", "Optional[bool]", "query"),
+            ("card_attachments", "Optional[str]", "query"),
+            ("organization_fields", "Optional[str]", "query"),
+            ("organizations_limit", "Optional[int]", "query"),
+            ("member_fields", "Optional[str]", "query"),
+            ("members_limit", "Optional[int]", "query"),
+            ("partial", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Search Trello
+
+        Args:
+            query (string): The search query with a length of 1 to 16384 characters
+            idBoards (string): `mine` or a comma-separated list of Board IDs
+            idOrganizations (string): A comma-separated list of Organization IDs
+            idCards (string): A comma-separated list of Card IDs
+            modelTypes (string): What type or types of Trello objects you want to search. all or a comma-separated list of: `actions`, `boards`, `cards`, `members`, `organizations`
+            board_fields (string): all or a comma-separated list of: `closed`, `dateLastActivity`, `dateLastView`, `desc`, `descData`, `idOrganization`, `invitations`, `invited`, `labelNames`, `memberships`, `name`, `pinned`, `powerUps`, `prefs`, `shortLink`, `shortUrl`, `starred`, `subscribed`, `url`
+            boards_limit (integer): The maximum number of boards returned. Maximum: 1000
+            board_organization (boolean): Whether to include the parent organization with board results
+            card_fields (string): all or a comma-separated list of: `badges`, `checkItemStates`, `closed`, `dateLastActivity`, `desc`, `descData`, `due`, `idAttachmentCover`, `idBoard`, `idChecklists`, `idLabels`, `idList`, `idMembers`, `idMembersVoted`, `idShort`, `labels`, `manualCoverAttachment`, `name`, `pos`, `shortLink`, `shortUrl`, `subscribed`, `url`
+            cards_limit (integer): The maximum number of cards to return. Maximum: 1000
+            cards_page (number): The page of results for cards. Maximum: 100
+            card_board (boolean): Whether to include the parent board with card results
+            card_list (boolean): Whether to include the parent list with card results
+            card_members (boolean): Whether to include member objects with card results
+            card_stickers (boolean): Whether to include sticker objects with card results
+            card_attachments (string): Whether to include attachment objects with card results. A boolean value (true or false) or cover for only card cover attachments.
+            organization_fields (string): all or a comma-separated list of billableMemberCount, desc, descData, displayName, idBoards, invitations, invited, logoHash, memberships, name, powerUps, prefs, premiumFeatures, products, url, website
+            organizations_limit (integer): The maximum number of Workspaces to return. Maximum 1000
+            member_fields (string): all or a comma-separated list of: avatarHash, bio, bioData, confirmed, fullName, idPremOrgsAdmin, initials, memberType, products, status, url, username
+            members_limit (integer): The maximum number of members to return. Maximum 1000
+            partial (boolean): By default, Trello searches for each word in your query against exactly matching words within Member content. Specifying partial to be true means that we will look for content that starts with any of the words in your query. If you are looking for a Card titled "My Development Status Report", by default you would need to search for "Development". If you have partial enabled, you will be able to search for "dev" but not "velopment".
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+            
+        Tags:
+            Search, important
+        """,
+    ),
+    Endpoint(
+        "get_search_members",
+        "GET",
+        "/search/members/",
+        (
+            ("query", "str", "query", True),
+            ("limit", "Optional[int]", "query"),
+            ("idBoard", "Optional[str]", "query"),
+            ("idOrganization", "Optional[str]", "query"),
+            ("onlyOrgMembers", "Optional[bool]", "query"),
+        ),
+        "list[Any]",
+        """
+        Search for Members
+
+        Args:
+            query (string): Search query 1 to 16384 characters long
+            limit (integer): The maximum number of results to return. Maximum of 20.
+            idBoard (string): Optional parameter to filter search results by a specific board ID. Example: '5abbe4b7ddc1b351ef961414'.
+            idOrganization (string): The optional query parameter to filter members by the ID of their organization. Example: '5abbe4b7ddc1b351ef961414'.
+            onlyOrgMembers (boolean): A boolean flag indicating whether to return only members of the organization; defaults to false.
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_tokens_token",
+        "GET",
+        "/tokens/{token}",
+        (
+            ("token", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+            ("webhooks", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Token
+
+        Args:
+            token (string): token
+            fields (string): `all` or a comma-separated list of `dateCreated`, `dateExpires`, `idMember`, `identifier`, `permissions`
+            webhooks (boolean): Determines whether to include webhooks.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_tokens_token_member",
+        "GET",
+        "/tokens/{token}/member",
+        (
+            ("token", "str", "path", True),
+            ("fields", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Get Token's Member
+
+        Args:
+            token (string): token
+            fields (string): `all` or a comma-separated list of valid fields for [Member Object](/cloud/trello/guides/rest-api/object-definitions/).
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_tokens_token_webhooks",
+        "GET",
+        "/tokens/{token}/webhooks",
+        (
+            ("token", "str", "path", True),
+        ),
+        "list[Any]",
+        """
+        Get Webhooks for Token
+
+        Args:
+            token (string): token
+
+        Returns:
+            list[Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_tokens_token_webhooks",
+        "POST",
+        "/tokens/{token}/webhooks",
+        (
+            ("token", "str", "path", True),
+            ("callbackURL", "str", "query", True),
+            ("idModel", "str", "query", True),
+            ("description", "Optional[str]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Create Webhooks for Token
+
+        Args:
+            token (string): token
+            callbackURL (string): The URL that the webhook should POST information to.
+            idModel (string): ID of the object to create a webhook on. Example: '5abbe4b7ddc1b351ef961414'.
+            description (string): A description to be displayed when retrieving information about the webhook.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_webhook_by_id",
+        "GET",
+        "/tokens/{token}/webhooks/{idWebhook}",
+        (
+            ("token", "str", "path", True),
+            ("idWebhook", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Webhook belonging to a Token
+
+        Args:
+            token (string): token
+            idWebhook (string): idWebhook
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_webhook_by_id",
+        "DELETE",
+        "/tokens/{token}/webhooks/{idWebhook}",
+        (
+            ("token", "str", "path", True),
+            ("idWebhook", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Webhook created by Token
+
+        Args:
+            token (string): token
+            idWebhook (string): idWebhook
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "tokenstokenwebhooks",
+        "PUT",
+        "/tokens/{token}/webhooks/{idWebhook}",
+        (
+            ("token", "str", "path", True),
+            ("idWebhook", "str", "path", True),
+            ("description", "Optional[str]", "query"),
+            ("callbackURL", "Optional[str]", "query"),
+            ("idModel", "Optional[str]", "query"),
+        ),
+        "Any",
+        """
+        Update a Webhook created by Token
+
+        Args:
+            token (string): token
+            idWebhook (string): idWebhook
+            description (string): A description to be displayed when retrieving information about the webhook.
+            callbackURL (string): The URL that the webhook should `POST` information to.
+            idModel (string): ID of the object that the webhook is on. Example: '5abbe4b7ddc1b351ef961414'.
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_token",
+        "DELETE",
+        "/tokens/{token}/",
+        (
+            ("token", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Token
+
+        Args:
+            token (string): token
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "post_webhooks",
+        "POST",
+        "/webhooks/",
+        (
+            ("callbackURL", "str", "query", True),
+            ("idModel", "str", "query", True),
+            ("description", "Optional[str]", "query"),
+            ("active", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Create a Webhook
+
+        Args:
+            callbackURL (string): A valid URL that is reachable with a `HEAD` and `POST` request.
+            idModel (string): ID of the model to be monitored Example: '5abbe4b7ddc1b351ef961414'.
+            description (string): A string with a length from `0` to `16384`.
+            active (boolean): Determines whether the webhook is active and sending `POST` requests.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "get_webhooks_id",
+        "GET",
+        "/webhooks/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "dict[str, Any]",
+        """
+        Get a Webhook
+
+        Args:
+            id (string): id
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "put_webhooks_id",
+        "PUT",
+        "/webhooks/{id}",
+        (
+            ("id", "str", "path", True),
+            ("description", "Optional[str]", "query"),
+            ("callbackURL", "Optional[str]", "query"),
+            ("idModel", "Optional[str]", "query"),
+            ("active", "Optional[bool]", "query"),
+        ),
+        "dict[str, Any]",
+        """
+        Update a Webhook
+
+        Args:
+            id (string): id
+            description (string): A string with a length from `0` to `16384`.
+            callbackURL (string): A valid URL that is reachable with a `HEAD` and `POST` request.
+            idModel (string): ID of the model to be monitored Example: '5abbe4b7ddc1b351ef961414'.
+            active (boolean): Determines whether the webhook is active and sending `POST` requests.
+
+        Returns:
+            dict[str, Any]: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "delete_webhooks_id",
+        "DELETE",
+        "/webhooks/{id}",
+        (
+            ("id", "str", "path", True),
+        ),
+        "Any",
+        """
+        Delete a Webhook
+
+        Args:
+            id (string): id
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+    Endpoint(
+        "webhooksidfield",
+        "GET",
+        "/webhooks/{id}/{field}",
+        (
+            ("id", "str", "path", True),
+            ("field", "str", "path", True),
+        ),
+        "Any",
+        """
+        Get a field on a Webhook
+
+        Args:
+            id (string): id
+            field (string): field
+
+        Returns:
+            Any: Success
+
+        Raises:
+            HTTPError: Raised when the API request fails (e.g., non-2XX status code).
+            JSONDecodeError: Raised if the response body cannot be parsed as JSON.
+        """,
+    ),
+)
@@ -0,0 +1,215 @@
+"""Workspace (organization) exports run in the background.
+
+:class:`ExportRunner` starts an export, polls Trello with exponential backoff
+on a worker thread, so the tool call that started it returns at once, then
+streams the finished archive to disk (resuming with Range requests if the
+connection drops) and optionally loads it into a
+:class:`~universal_mcp_trello.store.BoardStore`. The archive is read one
+board at a time, so neither the download nor the import holds the whole
+workspace in memory.
+"""
+
+import functools
+import logging
+import threading
+import time
+import zipfile
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from universal_mcp_trello.codec import decode_response, iter_array
+from universal_mcp_trello.store import BoardStore
+from universal_mcp_trello.tracing import span
+
+if TYPE_CHECKING:
+    from universal_mcp_trello.app import TrelloApp
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 256 * 1024
+
+
+@dataclass
+class ExportJob:
+    """Progress of one export; ``status`` moves through ``exporting``,
+    ``downloading`` and ``importing`` to ``done`` or ``failed``."""
+
+    id: str
+    organization_id: str
+    status: str = "exporting"
+    polls: int = 0
+    path: str | None = None
+    bytes: int | None = None
+    boards_imported: int | None = None
+    error: str | None = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class ExportRunner:
+    """Starts workspace exports and sees each one through on a worker thread.
+
+    Args:
+        directory: Where finished archives are saved; created if missing.
+        store: If set, every board in a finished archive is saved into it.
+        initial_delay: Seconds before the first status check.
+        max_delay: Longest wait between status checks; the wait doubles
+            after each check until it reaches this.
+        timeout: Give up on an export still unfinished after this long.
+        max_workers: How many exports are followed at once.
+        max_jobs: How many jobs are remembered for :meth:`job`; the oldest
+            finished ones are forgotten first.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        store: BoardStore | None = None,
+        initial_delay: float = 5.0,
+        max_delay: float = 300.0,
+        timeout: float = 24 * 3600.0,
+        max_workers: int = 2,
+        max_jobs: int = 100,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.store = store
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix="trello-export"
+        )
+        self._jobs: dict[str, ExportJob] = {}
+        self._futures: dict[str, Future[ExportJob]] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def start(
+        self, app: "TrelloApp", organization_id: str, attachments: bool | None = None
+    ) -> ExportJob:
+        """Ask Trello for an export and follow it in the background."""
+        export = app.post_organizations_id_exports(
+            organization_id, attachments=attachments
+        )
+        job = ExportJob(export["id"], organization_id)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._futures[job.id] = self._executor.submit(self._run, app, job)
+            self._prune()
+        return job
+
+    def _prune(self) -> None:
+        # Jobs are kept in start order, so the first finished ones are oldest.
+        finished = [id for id, job in self._jobs.items() if job.finished_at]
+        for export_id in finished[: max(len(self._jobs) - self.max_jobs, 0)]:
+            del self._jobs[export_id], self._futures[export_id]
+
+    def job(self, export_id: str) -> ExportJob:
+        with self._lock:
+            job = self._jobs.get(export_id)
+        if job is None:
+            raise ValueError(f"Unknown export '{export_id}'.")
+        return job
+
+    def wait(self, export_id: str, timeout: float | None = None) -> ExportJob:
+        """Block until an export is done or failed."""
+        with self._lock:
+            future = self._futures.get(export_id)
+        if future is None:
+            raise ValueError(f"Unknown export '{export_id}'.")
+        return future.result(timeout)
+
+    def _run(self, app: "TrelloApp", job: ExportJob) -> ExportJob:
+        try:
+            url = self._poll(app, job)
+            job.status = "downloading"
+            path = self.directory / f"{job.organization_id}-{job.id}.zip"
+            partial = path.with_name(path.name + ".part")
+            job.bytes = app._download_file(url, partial)
+            partial.replace(path)
+            job.path = str(path)
+            if self.store is not None:
+                job.status = "importing"
+                with span(app.tracer, "decode", {"trello.export.id": job.id}):
+                    job.boards_imported = import_archive(path, self.store)
+            job.status = "done"
+        except Exception as exc:
+            logger.exception("Export %s of %s failed", job.id, job.organization_id)
+            job.status, job.error = "failed", str(exc) or type(exc).__name__
+        job.finished_at = time.time()
+        return job
+
+    def _poll(self, app: "TrelloApp", job: ExportJob) -> str:
+        delay = self.initial_delay
+        deadline = time.monotonic() + self.timeout
+        while True:
+            if self._closed.wait(delay):
+                raise RuntimeError("Export runner was closed.")
+            job.polls += 1
+            exports = _fetch_exports(app, job.organization_id) or []
+            export = next((e for e in exports if e.get("id") == job.id), None)
+            if export is None:
+                raise RuntimeError("The export is no longer listed by Trello.")
+            status = export.get("status") or {}
+            if "fail" in str(status.get("stage", "")).lower():
+                raise RuntimeError(f"Trello reported the export as {status['stage']}.")
+            if status.get("finished") and export.get("exportUrl"):
+                return export["exportUrl"]
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Export unfinished after {self.timeout:.0f} s.")
+            delay = min(delay * 2, self.max_delay)
+
+    def close(self) -> None:
+        """Stop following unfinished exports and wait for the workers to exit."""
+        self._closed.set()
+        self._executor.shutdown(wait=True)
+
+
+def _fetch_exports(app: "TrelloApp", organization_id: str) -> Any:
+    # Straight to the API: a cached listing would report a stale status.
+    url = f"{app.base_url}/organizations/{organization_id}/exports"
+    response = app._fetch(url)
+    response.raise_for_status()
+    return decode_response(response)
+
+
+def iter_boards(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Yield the boards in an export archive (or a single JSON export) one by one.
+
+    Each JSON file may hold one board or an array of boards; arrays are
+    decoded element by element, so only one board is in memory at a time.
+    """
+    if not zipfile.is_zipfile(path):
+        with open(path, "rb") as f:
+            yield from _boards_in(f)
+        return
+    with zipfile.ZipFile(path) as archive:
+        for info in archive.infolist():
+            if info.filename.lower().endswith(".json"):
+                with archive.open(info) as f:
+                    yield from _boards_in(f)
+
+
+def _boards_in(f: IO[bytes]) -> Iterator[dict[str, Any]]:
+    for value in iter_array(iter(functools.partial(f.read, CHUNK_SIZE), b"")):
+        if not isinstance(value, dict) or "id" not in value:
+            continue
+        if "lists" in value or "cards" in value:
+            yield value
+
+
+def import_archive(path: str | Path, store: BoardStore) -> int:
+    """Save every board in an export into ``store``; returns how many."""
+    count = 0
+    for board in iter_boards(path):
+        store.save_board(board)
+        count += 1
+    return count
@@ -0,0 +1,54 @@
+"""Build-time manifest of every tool's name, parameters, types, descriptions and tags.
+
+The manifest is generated from the tool signatures and docstrings once, at
+build time, and shipped as ``tools.json`` next to this module, where
+``TrelloApp.tool_schema`` and the MCP server (see ``registration``) read it
+instead of introspecting every tool at startup. Regenerate it after changing
+tools with::
+
+    python -m universal_mcp_trello.manifest
+"""
+
+import json
+import os
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from universal_mcp_trello.schemas import build_schema
+
+MANIFEST_PATH = Path(__file__).with_name("tools.json")
+
+
+def build_manifest(tools: list[Any]) -> dict[str, dict[str, Any]]:
+    """Map each tool's name to its schema."""
+    return {tool.__name__: build_schema(tool) for tool in tools}
+
+
+def dump_manifest(manifest: dict[str, dict[str, Any]]) -> str:
+    # One tool per line keeps the file compact and its diffs readable.
+    lines = [f"{json.dumps(name)}: {json.dumps(schema, separators=(',', ':'))}" for name, schema in manifest.items()]
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+
+@cache
+def load_manifest(path: str | os.PathLike = MANIFEST_PATH) -> dict[str, dict[str, Any]]:
+    """The shipped manifest, or an empty one if it has not been generated."""
+    try:
+        return json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def main(argv: list[str] | None = None) -> None:
+    from universal_mcp_trello.app import TrelloApp
+
+    argv = sys.argv[1:] if argv is None else argv
+    path = Path(argv[0]) if argv else MANIFEST_PATH
+    path.write_text(dump_manifest(build_manifest(TrelloApp()._all_tools())))
+    print(f"Wrote {path}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Latency, size, status and retry metrics for tool calls and HTTP requests.
+
+:class:`Metrics` keeps counters and histograms in memory, labelled by tool
+name, or by HTTP method and endpoint template (``/cards/{id}/actions``).
+Read them in-process with :meth:`Metrics.snapshot`, as Prometheus text with
+:meth:`Metrics.render`, or serve that text over HTTP with
+:meth:`Metrics.serve`. Recording one observation is a dictionary lookup and
+a few additions under a lock. An app created without ``metrics=`` skips the
+whole layer.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextvars import ContextVar
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+# Upper bounds in seconds; Trello calls range from tens of ms to many seconds.
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Path template of the REST tool being called, set while it runs.
+current_endpoint: ContextVar[str | None] = ContextVar("trello_endpoint", default=None)
+
+_ID_SEGMENT = re.compile(r"/[0-9a-f]{24}(?=/|$)")
+_API_PREFIX = re.compile(r"^/1(?=/)")
+
+
+def endpoint_template(url: str) -> str:
+    """The endpoint label for a URL outside a REST tool, e.g. ``/batch``.
+
+    Trello ids in the path become ``{id}``, which keeps the label set bounded.
+    """
+    path = _API_PREFIX.sub("", urlsplit(url).path)
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+def body_sizes(response: httpx.Response) -> tuple[int, int]:
+    """Bytes of request body sent and response body received for ``response``.
+
+    A streamed response counts its ``Content-Length``, as its body is unread.
+    """
+    try:
+        sent = len(response.request.content)
+    except httpx.RequestNotRead:  # a streamed upload
+        sent = int(response.request.headers.get("content-length", 0))
+    received = response.num_bytes_downloaded or int(
+        response.headers.get("content-length", 0)
+    )
+    return sent, received
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class _Family:
+    """One metric name and its values, keyed by label values."""
+
+    def __init__(self, name: str, kind: str, doc: str, labels: tuple[str, ...]) -> None:
+        self.name = name
+        self.kind = kind
+        self.doc = doc
+        self.labels = labels
+        self.values: dict[tuple[str, ...], Any] = {}
+
+
+class Metrics:
+    """Thread-safe registry of the app's metrics.
+
+    Args:
+        buckets: Upper bounds of the latency histograms, in seconds.
+        namespace: Prefix of every metric name.
+    """
+
+    def __init__(
+        self, buckets: tuple[float, ...] = DEFAULT_BUCKETS, namespace: str = "trello"
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        families = (
+            (
+                "tool_calls_total",
+                "counter",
+                "Tool calls by outcome.",
+                ("tool", "outcome"),
+            ),
+            ("tool_duration_seconds", "histogram", "Tool call latency.", ("tool",)),
+            (
+                "http_requests_total",
+                "counter",
+                "HTTP requests by status code (`error` if no response).",
+                ("method", "endpoint", "status"),
+            ),
+            (
+                "http_request_duration_seconds",
+                "histogram",
+                "HTTP request latency, per attempt.",
+                ("method", "endpoint"),
+            ),
+            (
+                "http_request_bytes_total",
+                "counter",
+                "Request body bytes sent.",
+                ("method", "endpoint"),
+            ),
+            (
+                "http_response_bytes_total",
+                "counter",
+                "Response body bytes received on the wire.",
+                ("method", "endpoint"),
+            ),
+            (
+                "http_retries_total",
+                "counter",
+                "Requests resent after a 429.",
+                ("method", "endpoint"),
+            ),
+        )
+        self._families = {
+            name: _Family(f"{namespace}_{name}", kind, doc, labels)
+            for name, kind, doc, labels in families
+        }
+
+    def _add(self, family: str, labels: tuple[str, ...], amount: float = 1) -> None:
+        values = self._families[family].values
+        values[labels] = values.get(labels, 0) + amount
+
+    def _time(self, family: str, labels: tuple[str, ...], seconds: float) -> None:
+        values = self._families[family].values
+        histogram = values.get(labels)
+        if histogram is None:
+            histogram = values[labels] = _Histogram(len(self.buckets) + 1)
+        histogram.counts[bisect_left(self.buckets, seconds)] += 1
+        histogram.sum += seconds
+
+    def observe_tool(self, tool: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._add("tool_calls_total", (tool, "ok" if ok else "error"))
+            self._time("tool_duration_seconds", (tool,), seconds)
+
+    def observe_request(
+        self,
+        method: str,
+        endpoint: str,
+        status: int | str,
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        labels = (method, endpoint)
+        with self._lock:
+            self._add("http_requests_total", (*labels, str(status)))
+            self._time("http_request_duration_seconds", labels, seconds)
+            if request_bytes:
+                self._add("http_request_bytes_total", labels, request_bytes)
+            if response_bytes:
+                self._add("http_response_bytes_total", labels, response_bytes)
+
+    def observe_response(
+        self, method: str, endpoint: str, response: httpx.Response, seconds: float
+    ) -> None:
+        """Record one attempt from its response."""
+        sent, received = body_sizes(response)
+        self.observe_request(
+            method, endpoint, response.status_code, seconds, sent, received
+        )
+
+    def observe_retries(self, method: str, endpoint: str, retries: int) -> None:
+        with self._lock:
+            self._add("http_retries_total", (method, endpoint), retries)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Every metric as plain data: counters as ``value``, histograms as
+        ``count``, ``sum`` and cumulative ``buckets`` keyed by upper bound."""
+        with self._lock:
+            result = {}
+            for family in self._families.values():
+                rows = []
+                for key, value in family.values.items():
+                    row: dict[str, Any] = {"labels": dict(zip(family.labels, key))}
+                    if family.kind == "counter":
+                        row["value"] = value
+                    else:
+                        cumulative = list(self._cumulative(value))
+                        row["count"], row["sum"] = cumulative[-1][1], value.sum
+                        row["buckets"] = dict(cumulative)
+                    rows.append(row)
+                result[family.name] = rows
+        return result
+
+    def _cumulative(self, histogram: _Histogram) -> Iterator[tuple[str, int]]:
+        total = 0
+        for bound, count in zip((*map(repr, self.buckets), "+Inf"), histogram.counts):
+            total += count
+            yield bound, total
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for family in self._families.values():
+                lines.append(f"# HELP {family.name} {family.doc}")
+                lines.append(f"# TYPE {family.name} {family.kind}")
+                for key, value in family.values.items():
+                    labels = list(zip(family.labels, key))
+                    if family.kind == "counter":
+                        lines.append(f"{family.name}{_labels(labels)} {value}")
+                        continue
+                    total = 0
+                    for bound, total in self._cumulative(value):
+                        le = _labels([*labels, ("le", bound)])
+                        lines.append(f"{family.name}_bucket{le} {total}")
+                    lines.append(f"{family.name}_sum{_labels(labels)} {value.sum}")
+                    lines.append(f"{family.name}_count{_labels(labels)} {total}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve :meth:`render` at ``/metrics`` from a daemon thread.
+
+        Returns the server; call ``shutdown()`` on it to stop.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=server.serve_forever, name="trello-metrics", daemon=True
+        ).start()
+        return server
+
+
+def _labels(pairs: list[tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,191 @@
+import copy
+import threading
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+_CARD_CREATED = {"createCard", "copyCard", "convertToCardFromCheckItem", "emailCard", "moveCardToBoard"}
+_CARD_REMOVED = {"deleteCard", "moveCardFromBoard"}
+_LIST_CREATED = {"createList", "moveListToBoard"}
+_LIST_REMOVED = {"moveListFromBoard"}
+
+# Nested objects in ``action.data.card`` that are references, not card fields.
+_NOT_CARD_FIELDS = {"list", "board"}
+
+
+class BoardMirror:
+    """In-process copy of Trello boards kept current by applying actions.
+
+    A board is loaded once from a full snapshot (:meth:`load`) and then
+    patched with each action Trello reports for it (:meth:`apply_action`),
+    whether those arrive by webhook or by polling. Reads are answered from
+    memory in the same shape the REST API returns.
+    """
+
+    def __init__(self, remember_actions: int = 10_000) -> None:
+        self.boards: dict[str, dict[str, Any]] = {}
+        self.lists: dict[str, dict[str, Any]] = {}
+        self.cards: dict[str, dict[str, Any]] = {}
+        self.labels: dict[str, dict[str, Any]] = {}
+        self._seen: deque[str] = deque(maxlen=remember_actions)
+        self._seen_set: set[str] = set()
+        self._lock = threading.RLock()
+
+    def load(
+        self,
+        board: dict[str, Any],
+        lists: Iterable[dict[str, Any]] = (),
+        cards: Iterable[dict[str, Any]] = (),
+        labels: Iterable[dict[str, Any]] = (),
+    ) -> None:
+        """Replace everything known about ``board`` with a fresh snapshot."""
+        board = copy.deepcopy(board)
+        nested = {key: board.pop(key, None) or [] for key in ("lists", "cards", "labels")}
+        lists = list(lists) or nested["lists"]
+        cards = list(cards) or nested["cards"]
+        labels = list(labels) or nested["labels"]
+        with self._lock:
+            self.drop(board["id"])
+            self.boards[board["id"]] = board
+            for item, index in ((lists, self.lists), (cards, self.cards), (labels, self.labels)):
+                for obj in item:
+                    obj = copy.deepcopy(obj)
+                    obj.setdefault("idBoard", board["id"])
+                    index[obj["id"]] = obj
+
+    def drop(self, board_id: str) -> None:
+        """Forget a board and everything on it."""
+        with self._lock:
+            self.boards.pop(board_id, None)
+            for index in (self.lists, self.cards, self.labels):
+                for obj_id in [k for k, v in index.items() if v.get("idBoard") == board_id]:
+                    del index[obj_id]
+
+    def has_board(self, board_id: str) -> bool:
+        return board_id in self.boards
+
+    def has_list(self, list_id: str) -> bool:
+        return list_id in self.lists
+
+    def board_cards(self, board_id: str) -> list[dict[str, Any]]:
+        """Open cards on a board, as ``GET /boards/{id}/cards`` returns them."""
+        with self._lock:
+            list_pos = {k: v.get("pos", 0) for k, v in self.lists.items()}
+            cards = [
+                c for c in self.cards.values() if c.get("idBoard") == board_id and not c.get("closed")
+            ]
+            cards.sort(key=lambda c: (list_pos.get(c.get("idList"), 0), c.get("pos", 0)))
+            return copy.deepcopy(cards)
+
+    def list_cards(self, list_id: str) -> list[dict[str, Any]]:
+        """Open cards in a list, as ``GET /lists/{id}/cards`` returns them."""
+        with self._lock:
+            cards = [c for c in self.cards.values() if c.get("idList") == list_id and not c.get("closed")]
+            cards.sort(key=lambda c: c.get("pos", 0))
+            return copy.deepcopy(cards)
+
+    def snapshot(self, board_id: str) -> dict[str, Any]:
+        """Everything mirrored for a board, in the shape :meth:`load` accepts."""
+        with self._lock:
+            snapshot = {"board": self.boards[board_id]}
+            for name, index in (("lists", self.lists), ("cards", self.cards), ("labels", self.labels)):
+                snapshot[name] = [v for v in index.values() if v.get("idBoard") == board_id]
+            return copy.deepcopy(snapshot)
+
+    def board_lists(self, board_id: str) -> list[dict[str, Any]]:
+        with self._lock:
+            lists = [
+                v for v in self.lists.values() if v.get("idBoard") == board_id and not v.get("closed")
+            ]
+            lists.sort(key=lambda v: v.get("pos", 0))
+            return copy.deepcopy(lists)
+
+    def apply_action(self, action: dict[str, Any]) -> bool:
+        """Apply one Trello action to the mirror.
+
+        Actions for boards that are not mirrored, repeated actions and action
+        types that do not change mirrored state are ignored.
+
+        Returns:
+            True if the mirror changed.
+        """
+        data = action.get("data") or {}
+        board_id = (data.get("board") or {}).get("id")
+        action_id = action.get("id")
+        with self._lock:
+            if board_id not in self.boards or action_id in self._seen_set:
+                return False
+            if action_id:
+                if len(self._seen) == self._seen.maxlen:
+                    self._seen_set.discard(self._seen[0])
+                self._seen.append(action_id)
+                self._seen_set.add(action_id)
+            return self._apply(action.get("type", ""), data, board_id)
+
+    def _apply(self, kind: str, data: dict[str, Any], board_id: str) -> bool:
+        card = data.get("card") or {}
+        if kind in _CARD_CREATED:
+            fields = {k: v for k, v in card.items() if k not in _NOT_CARD_FIELDS}
+            entry = self.cards.setdefault(card["id"], {"closed": False, "idLabels": [], "idMembers": []})
+            entry.update(fields, idBoard=board_id)
+            if data.get("list"):
+                entry["idList"] = data["list"]["id"]
+            return True
+        if kind in _CARD_REMOVED:
+            return self.cards.pop(card.get("id"), None) is not None
+        if kind == "updateCard":
+            entry = self.cards.get(card.get("id"))
+            if entry is None:
+                return False
+            entry.update({k: v for k, v in card.items() if k not in _NOT_CARD_FIELDS})
+            if data.get("listAfter"):
+                entry["idList"] = data["listAfter"]["id"]
+            return True
+        if kind in ("addLabelToCard", "removeLabelFromCard"):
+            label = data.get("label") or {}
+            added = kind.startswith("add")
+            if not self._toggle(card.get("id"), "idLabels", label.get("id"), added):
+                return False
+            entry = self.cards[card["id"]]
+            labels = [v for v in entry.get("labels", []) if v.get("id") != label["id"]]
+            if added:
+                labels.append(self.labels.get(label["id"], label))
+            entry["labels"] = labels
+            return True
+        if kind in ("addMemberToCard", "removeMemberFromCard"):
+            member_id = data.get("idMember") or (data.get("member") or {}).get("id")
+            return self._toggle(card.get("id"), "idMembers", member_id, kind.startswith("add"))
+        lst = data.get("list") or {}
+        if kind in _LIST_CREATED:
+            entry = self.lists.setdefault(lst["id"], {"closed": False})
+            entry.update(lst, idBoard=board_id)
+            return True
+        if kind in _LIST_REMOVED:
+            return self.lists.pop(lst.get("id"), None) is not None
+        if kind == "updateList" and lst.get("id") in self.lists:
+            self.lists[lst["id"]].update(lst)
+            return True
+        label = data.get("label") or {}
+        if kind in ("createLabel", "updateLabel"):
+            self.labels.setdefault(label["id"], {"idBoard": board_id}).update(label)
+            return True
+        if kind == "deleteLabel":
+            for entry in self.cards.values():
+                if label.get("id") in entry.get("idLabels", ()):
+                    entry["idLabels"].remove(label["id"])
+            return self.labels.pop(label.get("id"), None) is not None
+        if kind == "updateBoard":
+            self.boards[board_id].update(data.get("board") or {})
+            return True
+        return False
+
+    def _toggle(self, card_id: str | None, field: str, value: str | None, add: bool) -> bool:
+        entry = self.cards.get(card_id)
+        if entry is None or value is None:
+            return False
+        values = entry.setdefault(field, [])
+        if add and value not in values:
+            values.append(value)
+        elif not add and value in values:
+            values.remove(value)
+        return True
@@ -0,0 +1,56 @@
+"""Slotted views of the Trello objects read most often.
+
+Decoding a response into these (see ``TrelloApp.call_typed``) keeps only the
+fields listed here, in objects without a per-instance ``__dict__``. That takes
+a fraction of the memory of the full JSON dicts, whose nested ``badges``,
+``prefs`` and ``descData`` are usually never read. Fields missing from a
+response keep their defaults.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(slots=True)
+class Card:
+    id: str
+    name: str = ""
+    desc: str = ""
+    idBoard: str | None = None
+    idList: str | None = None
+    idLabels: list[str] = field(default_factory=list)
+    idMembers: list[str] = field(default_factory=list)
+    closed: bool = False
+    pos: float = 0.0
+    start: str | None = None
+    due: str | None = None
+    dueComplete: bool = False
+    dateLastActivity: str | None = None
+    shortUrl: str | None = None
+
+
+@dataclass(slots=True)
+class TrelloList:
+    id: str
+    name: str = ""
+    idBoard: str | None = None
+    closed: bool = False
+    pos: float = 0.0
+
+
+@dataclass(slots=True)
+class Action:
+    id: str
+    type: str = ""
+    date: str | None = None
+    idMemberCreator: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Member:
+    id: str
+    username: str = ""
+    fullName: str = ""
+    initials: str = ""
+    avatarUrl: str | None = None
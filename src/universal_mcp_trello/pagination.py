@@ -0,0 +1,60 @@
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+Page = list[Any]
+
+
+def paginate(
+    fetch: Callable[[Any], Page | None],
+    first: Any,
+    advance: Callable[[Any, Page], Any | None],
+    prefetch: bool = False,
+) -> Iterator[Any]:
+    """Lazily walk a paged endpoint, yielding one item at a time.
+
+    Args:
+        fetch: Returns the page for a cursor (a page number, an id, ...).
+        first: The cursor of the first page; may be None (e.g. no ``before``).
+        advance: Given the current cursor and its page, returns the next
+            cursor, or None once the last page has been read.
+        prefetch: Fetch the next page in the background while the current
+            one is being consumed. At most two pages are held in memory.
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    pending: Future | None = None
+    cursor = first
+    try:
+        while True:
+            page = (pending.result() if pending is not None else fetch(cursor)) or []
+            cursor = advance(cursor, page)
+            if cursor is not None and executor is not None:
+                pending = executor.submit(fetch, cursor)
+            yield from page
+            if cursor is None:
+                return
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def by_cursor(page_size: int, key: str = "id") -> Callable[[Any, Page], Any | None]:
+    """Advance a ``before`` cursor to the id of the last (oldest) item of each page."""
+
+    def advance(cursor: Any, page: Page) -> Any | None:
+        if len(page) < page_size:
+            return None
+        return page[-1][key]
+
+    return advance
+
+
+def by_page(page_size: int, last_page: int | None = None) -> Callable[[int, Page], int | None]:
+    """Advance a zero-based page number until a short page or ``last_page``."""
+
+    def advance(page_number: int, page: Page) -> int | None:
+        if len(page) < page_size or (last_page is not None and page_number >= last_page):
+            return None
+        return page_number + 1
+
+    return advance
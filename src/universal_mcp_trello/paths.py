@@ -0,0 +1,29 @@
+"""Confining file names that arrive through tool calls to one directory.
+
+Tool arguments come from the agent, and through it from whatever text it
+read, so a tool must never open a path it was handed. Tools that work with
+files take a name instead, which :func:`resolve_within` maps into a
+directory the app was configured with.
+"""
+
+import os
+from pathlib import Path
+
+
+def resolve_within(directory: str | os.PathLike, name: str) -> Path:
+    """The path of ``name`` inside ``directory``.
+
+    Raises:
+        ValueError: If ``name`` is empty, absolute, contains ``..``, or
+            resolves (e.g. through a symlink) to somewhere outside
+            ``directory``.
+    """
+    if not isinstance(name, str) or not name or os.path.isabs(name):
+        raise ValueError(f"'{name}' must be a relative file name.")
+    if ".." in Path(name).parts or "\\" in name:
+        raise ValueError(f"'{name}' must not leave its directory.")
+    root = Path(directory).resolve()
+    path = (root / name).resolve()
+    if path == root or root not in path.parents:
+        raise ValueError(f"'{name}' must not leave its directory.")
+    return path
@@ -0,0 +1,70 @@
+"""Default ``fields=`` projections for REST tools.
+
+Trello returns full objects unless asked otherwise, including ``prefs``,
+``badges``, ``descData`` and other nested data an agent rarely reads. A
+profile maps tool names to query parameters that are sent whenever the
+caller leaves them unset, so the API returns only the listed fields. Trello
+always includes ``id``. Passing ``fields="all"`` (or any explicit value) to a
+tool overrides its default for that call.
+"""
+
+from collections.abc import Mapping
+
+# Fields kept for each kind of object by the "compact" profile.
+BOARD = "name,desc,closed,idOrganization,shortUrl,dateLastActivity"
+CARD = (
+    "name,desc,idBoard,idList,idLabels,idMembers,closed,pos,start,due,dueComplete,"
+    "dateLastActivity,shortUrl"
+)
+LIST = "name,idBoard,closed,pos"
+ACTION = "type,date,data,idMemberCreator"
+MEMBER = "username,fullName,initials"
+ORGANIZATION = "name,displayName"
+
+PROFILES: dict[str, dict[str, dict[str, str]]] = {
+    "all": {},
+    "compact": {
+        "get_actions_id": {"member_fields": MEMBER, "memberCreator_fields": MEMBER},
+        "get_boards_id": {"fields": BOARD},
+        "get_boards_id_actions": {
+            "fields": ACTION,
+            "member_fields": MEMBER,
+            "memberCreator_fields": MEMBER,
+        },
+        "get_boards_id_cards": {"fields": CARD},
+        "get_boards_id_lists": {"fields": LIST, "card_fields": CARD},
+        "get_cards_id": {"fields": CARD, "member_fields": MEMBER, "board_fields": BOARD},
+        "get_cards_id_board": {"fields": BOARD},
+        "get_cards_id_list": {"fields": LIST},
+        "get_cards_id_members": {"fields": MEMBER},
+        "get_lists_id": {"fields": LIST},
+        "get_lists_id_board": {"fields": BOARD},
+        "get_lists_id_cards": {"fields": CARD},
+        "get_members_id": {"fields": f"{MEMBER},idBoards,idOrganizations"},
+        "get_members_id_boards": {"fields": BOARD, "organization_fields": ORGANIZATION},
+        "get_members_id_organizations": {"fields": ORGANIZATION},
+        "get_organizations_id_boards": {"fields": BOARD},
+        "get_search": {
+            "card_fields": CARD,
+            "board_fields": BOARD,
+            "member_fields": MEMBER,
+            "organization_fields": ORGANIZATION,
+        },
+    },
+}
+
+
+def resolve_profile(
+    profile: str | Mapping[str, Mapping[str, str]] | None,
+) -> dict[str, dict[str, str]]:
+    """Tool name -> default query parameters for a profile name or custom mapping."""
+    if profile is None:
+        return {}
+    if isinstance(profile, str):
+        try:
+            return PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown fields profile '{profile}'; expected one of {sorted(PROFILES)}."
+            ) from None
+    return {tool: dict(params) for tool, params in profile.items()}
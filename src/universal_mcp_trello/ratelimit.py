@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+
+import httpx
+
+# Trello's published limits: 100 requests per 10 s per token, 300 per 10 s per key.
+TOKEN_LIMIT = 100
+KEY_LIMIT = 300
+LIMIT_INTERVAL = 10.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket holding at most ``capacity`` tokens.
+
+    The bucket refills continuously at ``capacity / interval`` tokens per
+    second, so a full bucket allows a burst of ``capacity`` requests and then
+    settles to the sustained rate.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = float(capacity)
+        self.interval = interval
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, otherwise the seconds until one will be.
+        """
+        with self._lock:
+            self._refill()
+            # Tolerate float rounding so a just-refilled token is never missed.
+            if self._tokens >= 1 - 1e-9:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def give_back(self) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def sync(self, remaining: int, capacity: int | None = None, interval: float | None = None) -> None:
+        """Align the bucket with the server's view of the budget."""
+        with self._lock:
+            self._refill()
+            if capacity:
+                self.capacity = float(capacity)
+            if interval:
+                self.interval = interval
+            self._tokens = min(self._tokens, float(remaining))
+
+    def drain(self) -> None:
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """Schedules Trello requests within both the per-token and per-key budgets.
+
+    Requests wait for a token from each bucket before they are sent, the
+    buckets are re-synchronised from the ``x-rate-limit-*`` response headers,
+    and 429 responses are retried with jittered exponential backoff (or after
+    ``Retry-After`` when the server sends one).
+
+    Share one instance between apps that use the same API key so that the
+    per-key budget is enforced across all of them.
+
+    Args:
+        token_limit: Requests allowed per token in each ``interval``.
+        key_limit: Requests allowed per API key in each ``interval``.
+        interval: Length of the limit window in seconds.
+        max_retries: How many times a 429 is retried before it is raised.
+        base_delay: First backoff delay in seconds; doubles on each retry.
+        max_delay: Upper bound for a single backoff delay.
+    """
+
+    def __init__(
+        self,
+        token_limit: int = TOKEN_LIMIT,
+        key_limit: int = KEY_LIMIT,
+        interval: float = LIMIT_INTERVAL,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.token_bucket = TokenBucket(token_limit, interval, clock)
+        self.key_bucket = TokenBucket(key_limit, interval, clock)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def acquire(self) -> None:
+        """Block until both budgets allow another request."""
+        while True:
+            wait = self.token_bucket.try_acquire()
+            if not wait:
+                wait = self.key_bucket.try_acquire()
+                if not wait:
+                    return
+                self.token_bucket.give_back()
+            self._sleep(wait)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Update both buckets from Trello's rate-limit response headers."""
+        for scope, bucket in (("token", self.token_bucket), ("key", self.key_bucket)):
+            remaining = headers.get(f"x-rate-limit-api-{scope}-remaining")
+            if remaining is None:
+                continue
+            capacity = headers.get(f"x-rate-limit-api-{scope}-max")
+            interval_ms = headers.get(f"x-rate-limit-api-{scope}-interval-ms")
+            bucket.sync(
+                int(remaining),
+                int(capacity) if capacity else None,
+                int(interval_ms) / 1000 if interval_ms else None,
+            )
+
+    def backoff(self, attempt: int, response: httpx.Response) -> float:
+        retry_after = response.headers.get("retry-after")
+        if retry_after:
+            try:
+                return min(self.max_delay, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(delay / 2, delay)
+
+    def call(self, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """Send a request under the limiter, retrying on 429.
+
+        ``send`` may either return the 429 response or raise
+        ``httpx.HTTPStatusError`` for it; other errors propagate unchanged.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                response = send()
+            except httpx.HTTPStatusError as exc:
+                response = exc.response
+                self.observe(response.headers)
+                if response.status_code != 429 or attempt >= self.max_retries:
+                    raise
+            else:
+                self.observe(response.headers)
+                if response.status_code != 429 or attempt >= self.max_retries:
+                    return response
+            response.close()  # a streamed 429 would otherwise hold its connection
+            self.token_bucket.drain()
+            self._sleep(self.backoff(attempt, response))
+            attempt += 1
@@ -0,0 +1,116 @@
+"""Registering the app's tools with the MCP server from the build-time manifest.
+
+``Tool.from_function`` builds a pydantic argument model for every tool and
+renders its JSON schema, which for a few hundred tools is most of the
+server's startup time. :func:`manifest_tools` takes each tool's
+description, tags and input schema from ``tools.json`` instead (through
+``TrelloApp.tool_schema``, which builds the schema of a tool the manifest
+does not list), and builds the argument model that validates calls only
+when the tool is first called.
+"""
+
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import PrivateAttr
+from universal_mcp.applications import BaseApplication
+from universal_mcp.servers import BaseServer, ServerConfig
+from universal_mcp.tools import Tool
+from universal_mcp.tools.func_metadata import FuncMetadata
+from universal_mcp.tools.manager import TOOL_NAME_SEPARATOR
+
+from universal_mcp_trello.manifest import load_manifest
+
+
+class LazyFuncMetadata(FuncMetadata):
+    """``FuncMetadata`` whose ``arg_model`` is built on first use."""
+
+    _fn: Callable[..., Any] = PrivateAttr()
+    _arg_description: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def of(
+        cls, fn: Callable[..., Any], arg_description: dict[str, str]
+    ) -> "LazyFuncMetadata":
+        metadata = cls.model_construct()
+        metadata._fn = fn
+        metadata._arg_description = arg_description
+        return metadata
+
+    def __getattr__(self, name: str) -> Any:
+        if name != "arg_model":
+            return super().__getattr__(name)
+        built = FuncMetadata.func_metadata(
+            self._fn, arg_description=self._arg_description
+        )
+        self.__dict__["arg_model"] = built.arg_model
+        return built.arg_model
+
+
+def manifest_tool(fn: Callable[..., Any], entry: dict[str, Any]) -> Tool:
+    """A ``Tool`` for ``fn`` described by its manifest ``entry``."""
+    schema = entry["inputSchema"]
+    arg_description = {
+        name: prop["description"]
+        for name, prop in schema["properties"].items()
+        if "description" in prop
+    }
+    return Tool(
+        fn=fn,
+        name=entry["name"],
+        description=entry["description"],
+        args_description=arg_description,
+        tags=list(entry["tags"]),
+        parameters=schema,
+        fn_metadata=LazyFuncMetadata.of(fn, arg_description),
+        is_async=inspect.iscoroutinefunction(fn),
+    )
+
+
+def manifest_tools(app: BaseApplication) -> list[Tool]:
+    """The tools of ``app.list_tools()``, named and tagged as ``ToolManager``
+    registers them.
+
+    Schemas come from ``app.tool_schema`` (the manifest, or the tool's own
+    signature and docstring) when the app has one, and from the manifest
+    otherwise.
+    """
+    schema = getattr(app, "tool_schema", None) or load_manifest().get
+    tools = []
+    for fn in app.list_tools():
+        entry = schema(fn.__name__)
+        tool = Tool.from_function(fn) if entry is None else manifest_tool(fn, entry)
+        tool.name = f"{app.name}{TOOL_NAME_SEPARATOR}{tool.name}"
+        if app.name not in tool.tags:
+            tool.tags.append(app.name)
+        tools.append(tool)
+    return tools
+
+
+class ManifestMCPServer(BaseServer):
+    """``SingleMCPServer`` registering its app's tools with :func:`manifest_tools`.
+
+    Args:
+        app_instance: The application whose tools are served.
+        config: Server configuration; a local one named after the app by default.
+        **kwargs: Passed to ``FastMCP``.
+    """
+
+    def __init__(
+        self,
+        app_instance: BaseApplication,
+        config: ServerConfig | None = None,
+        **kwargs: Any,
+    ) -> None:
+        config = config or ServerConfig(
+            type="local",
+            name=f"{app_instance.name.title()} MCP Server for Local Development",
+            description=(
+                f"Minimal MCP server for the local {app_instance.name} application."
+            ),
+        )
+        super().__init__(config, **kwargs)
+        self._tool_manager.register_tools(
+            manifest_tools(app_instance), app_name=app_instance.name
+        )
@@ -0,0 +1,91 @@
+import inspect
+import os
+import re
+import types
+import typing
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+_TAGS = re.compile(r"^\s*Tags:\s*\n\s*(.+)$", re.MULTILINE)
+_ARG = re.compile(r"^\s*(\w+) \(([^)]*)\): ?(.*)$")
+_SECTIONS = ("Args:", "Returns:", "Raises:", "Tags:")
+_JSON_TYPES = {
+    str: "string",
+    bytes: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    dict: "object",
+    list: "array",
+}
+
+
+def docstring_tags(fn: Callable[..., Any]) -> list[str]:
+    """Read the ``Tags:`` section of a tool docstring without parsing the rest."""
+    match = _TAGS.search(fn.__doc__ or "")
+    if not match:
+        return []
+    return [tag.strip().lower() for tag in match.group(1).split(",") if tag.strip()]
+
+
+def parse_docstring(doc: str | None) -> tuple[str, dict[str, str]]:
+    """Split a Google-style tool docstring into its summary and argument descriptions."""
+    summary, args, section = "", {}, None
+    for line in inspect.cleandoc(doc or "").splitlines():
+        stripped = line.strip()
+        if stripped in _SECTIONS:
+            section = stripped
+        elif section is None and stripped and not summary:
+            summary = stripped
+        elif section == "Args:" and (match := _ARG.match(line)):
+            args[match.group(1)] = match.group(3)
+    return summary, args
+
+
+def annotation_schema(annotation: Any) -> dict[str, Any]:
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return {}
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        members = [a for a in typing.get_args(annotation) if a is not type(None)]
+        return annotation_schema(members[0]) if len(members) == 1 else {}
+    if origin is not None:
+        schema = {"type": _JSON_TYPES.get(origin)} if origin in _JSON_TYPES else {}
+        args = typing.get_args(annotation)
+        if origin is list and args:
+            schema["items"] = annotation_schema(args[0])
+        return schema
+    return {"type": _JSON_TYPES[annotation]} if annotation in _JSON_TYPES else {}
+
+
+def build_schema(fn: Callable[..., Any]) -> dict[str, Any]:
+    """Derive a tool's name, description, tags and JSON input schema."""
+    summary, descriptions = parse_docstring(fn.__doc__)
+    properties, required = {}, []
+    for name, param in inspect.signature(fn).parameters.items():
+        if name == "self" or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        prop = annotation_schema(param.annotation)
+        if name in descriptions:
+            prop["description"] = descriptions[name]
+        if param.default is inspect.Parameter.empty:
+            required.append(name)
+        else:
+            prop["default"] = param.default
+        properties[name] = prop
+    input_schema: dict[str, Any] = {"type": "object", "properties": properties}
+    if required:
+        input_schema["required"] = required
+    return {
+        "name": fn.__name__,
+        "description": summary,
+        "tags": docstring_tags(fn),
+        "inputSchema": input_schema,
+    }
+
+
+def default_cache_dir() -> Path:
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(root) / "universal_mcp_trello"
+
@@ -1,15 +1,73 @@
 
+import atexit
+import os
+
 from universal_mcp.integrations import ApiKeyIntegration
-from universal_mcp.servers import SingleMCPServer
 from universal_mcp.stores import EnvironmentStore
 
-from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.async_app import AsyncTrelloApp
+from universal_mcp_trello.attachments import AttachmentStore
+from universal_mcp_trello.exports import ExportRunner
+from universal_mcp_trello.metrics import Metrics
+from universal_mcp_trello.registration import ManifestMCPServer
+from universal_mcp_trello.schemas import default_cache_dir
+from universal_mcp_trello.store import BoardStore
+from universal_mcp_trello.tracing import configure, get_tracer
+from universal_mcp_trello.trimming import ResultTrimmer
 
 env_store = EnvironmentStore()
 integration_instance = ApiKeyIntegration(name="TRELLO_API_KEY", store=env_store)
-app_instance = TrelloApp(integration=integration_instance)
 
-mcp = SingleMCPServer(
+
+def _env_list(name: str) -> list[str] | None:
+    value = os.environ.get(name, "")
+    return [item.strip() for item in value.split(",") if item.strip()] or None
+
+
+# e.g. TRELLO_TOOL_TAGS=important to expose only the core tools, and
+# TRELLO_FIELDS_PROFILE=all to return full objects instead of compact ones.
+# TRELLO_MAX_RESULT_BYTES caps each tool result (0 for no cap); the rest is
+# fetched with get_more_results. Downloaded attachments are kept in the user
+# cache directory up to TRELLO_ATTACHMENT_CACHE_BYTES (1 GiB by default).
+# Set TRELLO_EXPORT_DIR to enable Workspace exports, saved to that directory;
+# TRELLO_EXPORT_STORE names a SQLite file the exported boards are loaded into.
+# TRELLO_METRICS_PORT serves Prometheus metrics at http://127.0.0.1:<port>/metrics.
+# TRELLO_TRACING=otlp sends OpenTelemetry traces to the collector named by the
+# OTEL_EXPORTER_OTLP_* variables (localhost:4318 by default); =console prints
+# them to stderr.
+export_dir = os.environ.get("TRELLO_EXPORT_DIR")
+export_store = os.environ.get("TRELLO_EXPORT_STORE")
+metrics_port = os.environ.get("TRELLO_METRICS_PORT")
+metrics = Metrics() if metrics_port else None
+if metrics is not None:
+    metrics.serve(int(metrics_port))
+tracing = os.environ.get("TRELLO_TRACING")
+tracer_provider = configure(tracing) if tracing else None
+if tracer_provider is not None:
+    # Flushes the spans still queued in the batch processor.
+    atexit.register(tracer_provider.shutdown)
+app_instance = AsyncTrelloApp(
+    integration=integration_instance,
+    tool_tags=_env_list("TRELLO_TOOL_TAGS"),
+    tool_names=_env_list("TRELLO_TOOLS"),
+    fields_profile=os.environ.get("TRELLO_FIELDS_PROFILE", "compact"),
+    result_trimmer=ResultTrimmer(
+        max_bytes=int(os.environ.get("TRELLO_MAX_RESULT_BYTES", "20000")) or None
+    ),
+    attachment_store=AttachmentStore(
+        default_cache_dir() / "attachments",
+        max_bytes=int(os.environ.get("TRELLO_ATTACHMENT_CACHE_BYTES", str(1 << 30))),
+    ),
+    export_runner=ExportRunner(
+        export_dir, store=BoardStore(export_store) if export_store else None
+    )
+    if export_dir
+    else None,
+    metrics=metrics,
+    tracer=get_tracer(tracer_provider) if tracer_provider is not None else None,
+)
+
+mcp = ManifestMCPServer(
     app_instance=app_instance,
 )
 
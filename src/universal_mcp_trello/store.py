@@ -0,0 +1,326 @@
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+# table -> (indexed columns, copied out of each object's JSON)
+_TABLES: dict[str, tuple[str, ...]] = {
+    "boards": ("name", "idOrganization", "closed", "dateLastActivity"),
+    "lists": ("idBoard", "name", "closed", "pos"),
+    "cards": ("idBoard", "idList", "name", "closed", "pos", "due", "dateLastActivity"),
+    "labels": ("idBoard", "name", "color"),
+    "members": ("username", "fullName"),
+    "checklists": ("idBoard", "idCard", "name"),
+    "custom_field_items": ("idModel", "idCustomField"),
+}
+# Parquet column types; the other indexed columns (and id, data) are strings.
+_PARQUET_TYPES = {"closed": "bool_", "pos": "float64"}
+_INDEXES = (
+    ("boards", "dateLastActivity"),
+    ("lists", "idBoard"),
+    ("cards", "idBoard"),
+    ("cards", "idList"),
+    ("cards", "due"),
+    ("cards", "dateLastActivity"),
+    ("labels", "idBoard"),
+    ("checklists", "idCard"),
+    ("custom_field_items", "idModel"),
+    ("card_members", "idMember"),
+    ("board_members", "idMember"),
+)
+
+
+def _row(table: str, obj: dict[str, Any], **extra: Any) -> tuple[Any, ...]:
+    values = [obj.get(column, extra.get(column)) for column in _TABLES[table]]
+    return (obj["id"], *values, json.dumps(obj))
+
+
+class BoardStore:
+    """SQLite database of mirrored boards, queryable without the API.
+
+    Boards, lists, cards, labels, members, checklists and custom-field items
+    are stored as their full JSON alongside indexed columns for the fields
+    reports filter on (``idBoard``, ``idList``, card members, ``due`` and
+    ``dateLastActivity``). It doubles as a :class:`~universal_mcp_trello.sync.SnapshotStore`,
+    so ``BoardSync`` can persist straight into it.
+
+    Args:
+        path: Database file; ``":memory:"`` for a throwaway store.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._db:
+            for table, columns in _TABLES.items():
+                cursor = ", cursor TEXT" if table == "boards" else ""
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, "
+                    f"{', '.join(columns)}, data TEXT NOT NULL{cursor})"
+                )
+            self._db.execute("CREATE TABLE IF NOT EXISTS card_members (idCard TEXT, idMember TEXT)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS board_members (idBoard TEXT, idMember TEXT)")
+            for table, column in _INDEXES:
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{column} ON {table} ({column})"
+                )
+
+    def save_board(
+        self,
+        board: dict[str, Any],
+        lists: Iterable[dict[str, Any]] = (),
+        cards: Iterable[dict[str, Any]] = (),
+        labels: Iterable[dict[str, Any]] = (),
+        members: Iterable[dict[str, Any]] = (),
+        checklists: Iterable[dict[str, Any]] = (),
+        cursor: str | None = None,
+    ) -> None:
+        """Replace everything stored for a board with a new snapshot.
+
+        Nested ``lists``/``cards``/``labels``/``members``/``checklists`` on the
+        board object are used when the matching argument is empty, and
+        checklists and custom-field items nested in cards are stored too.
+        """
+        board = dict(board)
+        nested = {
+            key: board.pop(key, None) or []
+            for key in ("lists", "cards", "labels", "members", "checklists")
+        }
+        lists, cards = list(lists) or nested["lists"], list(cards) or nested["cards"]
+        labels, members = list(labels) or nested["labels"], list(members) or nested["members"]
+        checklists = list(checklists) or nested["checklists"]
+        board_id = board["id"]
+        card_items = [item for card in cards for item in card.get("customFieldItems") or []]
+        checklists += [c for card in cards for c in card.get("checklists") or []]
+        with self._lock, self._db:
+            self._delete_board(board_id)
+            self._db.execute(
+                "INSERT INTO boards VALUES (?, ?, ?, ?, ?, ?, ?)", (*_row("boards", board), cursor)
+            )
+            self._insert("lists", lists, idBoard=board_id)
+            self._insert("cards", cards, idBoard=board_id)
+            self._insert("labels", labels, idBoard=board_id)
+            self._insert("checklists", checklists, idBoard=board_id)
+            self._insert("custom_field_items", card_items)
+            self._insert("members", members)
+            self._db.executemany(
+                "INSERT INTO board_members VALUES (?, ?)", [(board_id, m["id"]) for m in members]
+            )
+            self._db.executemany(
+                "INSERT INTO card_members VALUES (?, ?)",
+                [(card["id"], member) for card in cards for member in card.get("idMembers") or []],
+            )
+            self._prune_members()
+
+    def _insert(self, table: str, objects: list[dict[str, Any]], **extra: Any) -> None:
+        if not objects:
+            return
+        placeholders = ", ".join("?" * (len(_TABLES[table]) + 2))
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+            [_row(table, obj, **extra) for obj in objects],
+        )
+
+    def _delete_board(self, board_id: str) -> None:
+        self._db.execute(
+            "DELETE FROM card_members WHERE idCard IN (SELECT id FROM cards WHERE idBoard = ?)",
+            (board_id,),
+        )
+        self._db.execute(
+            "DELETE FROM custom_field_items WHERE idModel IN (SELECT id FROM cards WHERE idBoard = ?)",
+            (board_id,),
+        )
+        for table in ("lists", "cards", "labels", "checklists"):
+            self._db.execute(f"DELETE FROM {table} WHERE idBoard = ?", (board_id,))
+        self._db.execute("DELETE FROM board_members WHERE idBoard = ?", (board_id,))
+        self._db.execute("DELETE FROM boards WHERE id = ?", (board_id,))
+
+    def _prune_members(self) -> None:
+        # Members are shared between boards; drop those no board lists any more.
+        self._db.execute(
+            "DELETE FROM members WHERE id NOT IN (SELECT idMember FROM board_members)"
+        )
+
+    def delete_board(self, board_id: str) -> None:
+        with self._lock, self._db:
+            self._delete_board(board_id)
+            self._prune_members()
+
+    def load_snapshot(self, board_id: str) -> tuple[dict[str, Any], str] | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data, cursor FROM boards WHERE id = ?", (board_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        snapshot = {
+            "board": json.loads(row["data"]),
+            "lists": self.lists(board_id, include_closed=True),
+            "cards": self.cards(board_id=board_id, include_closed=True),
+            "labels": self.labels(board_id),
+        }
+        return snapshot, row["cursor"]
+
+    def save_snapshot(self, board_id: str, snapshot: dict[str, Any], cursor: str) -> None:
+        # Members come from the board object when the sync fetched them;
+        # otherwise the stored membership is kept rather than wiped.
+        members = () if snapshot["board"].get("members") else self.members(board_id)
+        self.save_board(
+            snapshot["board"],
+            snapshot.get("lists", ()),
+            snapshot.get("cards", ()),
+            snapshot.get("labels", ()),
+            members,
+            cursor=cursor,
+        )
+
+    def _select(self, sql: str, params: Iterable[Any] = ()) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute(sql, tuple(params)).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def board(self, board_id: str) -> dict[str, Any] | None:
+        boards = self._select("SELECT data FROM boards WHERE id = ?", (board_id,))
+        return boards[0] if boards else None
+
+    def boards(self) -> list[dict[str, Any]]:
+        return self._select("SELECT data FROM boards ORDER BY dateLastActivity DESC")
+
+    def lists(self, board_id: str, include_closed: bool = False) -> list[dict[str, Any]]:
+        closed = "" if include_closed else " AND NOT COALESCE(closed, 0)"
+        return self._select(
+            f"SELECT data FROM lists WHERE idBoard = ?{closed} ORDER BY pos", (board_id,)
+        )
+
+    def labels(self, board_id: str) -> list[dict[str, Any]]:
+        return self._select("SELECT data FROM labels WHERE idBoard = ?", (board_id,))
+
+    def members(self, board_id: str) -> list[dict[str, Any]]:
+        return self._select(
+            "SELECT data FROM members WHERE id IN"
+            " (SELECT idMember FROM board_members WHERE idBoard = ?)",
+            (board_id,),
+        )
+
+    def checklists(self, card_id: str) -> list[dict[str, Any]]:
+        return self._select("SELECT data FROM checklists WHERE idCard = ?", (card_id,))
+
+    def custom_field_items(self, card_id: str) -> list[dict[str, Any]]:
+        return self._select("SELECT data FROM custom_field_items WHERE idModel = ?", (card_id,))
+
+    def cards(
+        self,
+        board_id: str | None = None,
+        list_id: str | None = None,
+        member_id: str | None = None,
+        due_before: str | None = None,
+        active_since: str | None = None,
+        include_closed: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query stored cards across boards.
+
+        Args:
+            board_id: Only cards on this board.
+            list_id: Only cards in this list.
+            member_id: Only cards this member is assigned to.
+            due_before: Only cards due before this ISO-8601 timestamp.
+            active_since: Only cards active since this ISO-8601 timestamp.
+            include_closed: Include archived cards.
+            limit: Return at most this many cards, most recently active first.
+        """
+        clauses, params = [], []
+        for column, value in (("idBoard", board_id), ("idList", list_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if member_id is not None:
+            clauses.append("id IN (SELECT idCard FROM card_members WHERE idMember = ?)")
+            params.append(member_id)
+        if due_before is not None:
+            clauses.append("due IS NOT NULL AND due < ?")
+            params.append(due_before)
+        if active_since is not None:
+            clauses.append("dateLastActivity >= ?")
+            params.append(active_since)
+        if not include_closed:
+            clauses.append("NOT COALESCE(closed, 0)")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = " ORDER BY dateLastActivity DESC" if limit is not None else " ORDER BY pos"
+        if limit is not None:
+            order += f" LIMIT {int(limit)}"
+        return self._select(f"SELECT data FROM cards{where}{order}", params)
+
+    def iter_rows(self, table: str) -> Iterator[dict[str, Any]]:
+        """Yield every stored object in a table without loading them all at once."""
+        if table not in _TABLES:
+            raise ValueError(f"Unknown table '{table}'.")
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT rowid, data FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT 1000",
+                    (last_rowid,),
+                ).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1]["rowid"]
+            for row in rows:
+                yield json.loads(row["data"])
+
+    def export_parquet(self, directory: str | os.PathLike, batch_size: int = 10_000) -> list[Path]:
+        """Write each table to ``<directory>/<table>.parquet`` for columnar analysis.
+
+        Indexed columns become typed Parquet columns; the full object is kept
+        as a JSON string column. Each table has one fixed schema, so batches
+        whose values happen to be all null or all integers still match.
+        Requires the optional ``pyarrow`` dependency.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires pyarrow: pip install 'universal-mcp-trello[parquet]'"
+            ) from exc
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for table, columns in _TABLES.items():
+            names = ["id", *columns, "data"]
+            schema = pa.schema(
+                [(name, getattr(pa, _PARQUET_TYPES.get(name, "string"))()) for name in names]
+            )
+            path = directory / f"{table}.parquet"
+            with self._lock:
+                cursor = self._db.execute(f"SELECT {', '.join(names)} FROM {table}")
+                writer = None
+                while rows := cursor.fetchmany(batch_size):
+                    values = {name: [_parquet_value(name, row[name]) for row in rows] for name in names}
+                    batch = pa.table(values, schema=schema)
+                    if writer is None:
+                        writer = pq.ParquetWriter(path, schema)
+                    writer.write_table(batch)
+            if writer is not None:
+                writer.close()
+                written.append(path)
+        return written
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def _parquet_value(column: str, value: Any) -> Any:
+    # SQLite hands back booleans as 0/1 and may hold numbers in text columns.
+    if value is None:
+        return None
+    kind = _PARQUET_TYPES.get(column)
+    if kind == "bool_":
+        return bool(value)
+    if kind == "float64":
+        return float(value)
+    return value if isinstance(value, str) else str(value)
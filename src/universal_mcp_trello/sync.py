@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+import httpx
+
+from universal_mcp_trello.mirror import BoardMirror
+
+if TYPE_CHECKING:
+    from universal_mcp_trello.app import TrelloApp
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStore(Protocol):
+    """Persists a board snapshot together with the id of the last action in it."""
+
+    def load_snapshot(self, board_id: str) -> tuple[dict[str, Any], str] | None: ...
+
+    def save_snapshot(self, board_id: str, snapshot: dict[str, Any], cursor: str) -> None: ...
+
+
+class JsonSnapshotStore:
+    """Keeps one ``<board id>.json`` file per board in a directory."""
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load_snapshot(self, board_id: str) -> tuple[dict[str, Any], str] | None:
+        path = self.directory / f"{board_id}.json"
+        if not path.exists():
+            return None
+        state = json.loads(path.read_text())
+        return state["snapshot"], state["cursor"]
+
+    def save_snapshot(self, board_id: str, snapshot: dict[str, Any], cursor: str) -> None:
+        path = self.directory / f"{board_id}.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"cursor": cursor, "snapshot": snapshot}))
+        tmp.replace(path)
+
+
+@dataclass
+class SyncResult:
+    board_id: str
+    full: bool
+    applied: int
+    cursor: str | None
+
+
+class BoardSync:
+    """Keeps board snapshots current by replaying only the actions since the last sync.
+
+    The first sync of a board takes a full snapshot (board, lists, labels and
+    all cards) and records the newest action id as the cursor, or the board's
+    last activity date when it has no actions yet. Later syncs
+    fetch just the actions after the cursor and apply them to the snapshot,
+    so a poll costs O(changes) instead of O(board size). A full refetch is
+    done instead whenever the incremental path cannot be trusted: the cursor
+    is rejected by Trello, or more than ``max_actions`` changes piled up.
+
+    Args:
+        app: The app used to talk to Trello.
+        store: Where snapshots and cursors are persisted between runs.
+        mirror: Holds the live snapshots; a private one is created by default.
+        max_actions: Above this many pending actions, refetch instead.
+    """
+
+    def __init__(
+        self,
+        app: "TrelloApp",
+        store: SnapshotStore,
+        mirror: BoardMirror | None = None,
+        max_actions: int = 2000,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.mirror = mirror if mirror is not None else BoardMirror()
+        self.max_actions = max_actions
+        self._cursors: dict[str, str | None] = {}
+
+    def sync(self, board_id: str) -> SyncResult:
+        """Bring one board's snapshot up to date and persist it."""
+        if board_id not in self._cursors:
+            saved = self.store.load_snapshot(board_id)
+            if saved is None:
+                return self.full_sync(board_id)
+            snapshot, cursor = saved
+            self.mirror.load(
+                snapshot["board"], snapshot["lists"], snapshot["cards"], snapshot["labels"]
+            )
+            self._cursors[board_id] = cursor
+        cursor = self._cursors[board_id]
+        if cursor is None:
+            return self.full_sync(board_id)
+        try:
+            actions = self._actions_since(board_id, cursor)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code >= 500 or exc.response.status_code == 429:
+                raise
+            logger.info("Cursor %s for board %s rejected; refetching", cursor, board_id)
+            return self.full_sync(board_id)
+        if actions is None:
+            logger.info("Too many changes on board %s; refetching", board_id)
+            return self.full_sync(board_id)
+        for action in reversed(actions):
+            self.mirror.apply_action(action)
+        if actions:
+            cursor = actions[0]["id"]
+            self._save(board_id, cursor)
+        return SyncResult(board_id, False, len(actions), cursor)
+
+    def full_sync(self, board_id: str) -> SyncResult:
+        """Take a fresh snapshot of a board, discarding any saved one."""
+        # Read the cursor first: actions racing the snapshot are then replayed
+        # on the next sync, which is harmless because actions carry new values.
+        started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+        latest = self.app.get_boards_id_actions(board_id, limit=1) or []
+        board = self.app.get_boards_id(board_id, lists="all", labels="all", members="all")
+        # Trello's `since` takes a date too, so a board without actions still
+        # gets a cursor and the next sync stays incremental.
+        cursor = latest[0]["id"] if latest else board.get("dateLastActivity") or started
+        cards = self.app._get_json(f"{self.app.base_url}/boards/{board_id}/cards/all")
+        self.mirror.load(board, cards=cards or [])
+        self._save(board_id, cursor)
+        return SyncResult(board_id, True, 0, cursor)
+
+    def _actions_since(self, board_id: str, cursor: str) -> list[dict[str, Any]] | None:
+        actions = []
+        for action in self.app.iter_boards_id_actions(board_id, since=cursor):
+            if len(actions) >= self.max_actions:
+                return None
+            actions.append(action)
+        return actions
+
+    def _save(self, board_id: str, cursor: str | None) -> None:
+        self._cursors[board_id] = cursor
+        self.store.save_snapshot(board_id, self.mirror.snapshot(board_id), cursor)
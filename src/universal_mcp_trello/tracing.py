@@ -0,0 +1,124 @@
+"""OpenTelemetry spans for tool calls and the requests behind them.
+
+Pass ``tracer=get_tracer()`` to the app and each tool call returned by
+``list_tools()`` opens a ``tool <name>`` span. Inside it are child spans for
+cache lookups (``cache lookup``), GETs queued for a ``/batch`` call
+(``batch``), every HTTP attempt including 429 retries
+(``<METHOD> <endpoint>``, a client span) and response decoding
+(``decode``; for ``stream()`` and imported exports it covers the whole
+streamed read). Time in a tool span not covered by its children is spent in
+the app itself, and time outside it in the MCP server.
+
+Only ``opentelemetry-api`` is needed to create spans; :func:`configure`
+installs an SDK provider that exports them to the console or to an OTLP
+collector (``pip install 'universal-mcp-trello[tracing]'``).
+"""
+
+import contextlib
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+import httpx
+
+from universal_mcp_trello.metrics import body_sizes
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+TRACER_NAME = "universal_mcp_trello"
+
+
+def get_tracer(tracer_provider: Any = None) -> Any:
+    """The package's tracer from ``tracer_provider`` (the global one by default)."""
+    if trace is None:
+        raise ImportError(
+            "Tracing requires opentelemetry-api: "
+            "pip install 'universal-mcp-trello[tracing]'"
+        )
+    return trace.get_tracer(TRACER_NAME, tracer_provider=tracer_provider)
+
+
+def configure(exporter: str = "otlp", endpoint: str | None = None) -> Any:
+    """Create an SDK tracer provider exporting to ``console`` or ``otlp``.
+
+    The OTLP exporter sends over HTTP to ``endpoint``, or to the collector
+    named by the standard ``OTEL_EXPORTER_OTLP_*`` variables
+    (``http://localhost:4318`` by default). The console exporter writes to
+    stderr, as stdout carries the MCP stdio protocol. Returns the provider;
+    pass it to :func:`get_tracer`, and call its ``shutdown()`` to flush on
+    exit.
+    """
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+        )
+    except ImportError as exc:
+        raise ImportError(
+            "Exporting traces requires opentelemetry-sdk: "
+            "pip install 'universal-mcp-trello[tracing]'"
+        ) from exc
+    if exporter == "console":
+        span_exporter = ConsoleSpanExporter(out=sys.stderr)
+    elif exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        span_exporter = OTLPSpanExporter(endpoint=endpoint)
+    else:
+        raise ValueError(
+            f"Unknown trace exporter '{exporter}'; use 'console' or 'otlp'."
+        )
+    provider = TracerProvider(resource=Resource.create({"service.name": TRACER_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    return provider
+
+
+def span(
+    tracer: Any,
+    name: str,
+    attributes: Mapping[str, Any] | None = None,
+    client: bool = False,
+) -> contextlib.AbstractContextManager[Any]:
+    """Start a child span of the current one, or do nothing without a tracer."""
+    if tracer is None:
+        return contextlib.nullcontext()
+    kind = trace.SpanKind.CLIENT if client else trace.SpanKind.INTERNAL
+    return tracer.start_as_current_span(name, kind=kind, attributes=attributes)
+
+
+def start_span(
+    tracer: Any, name: str, attributes: Mapping[str, Any] | None = None
+) -> Any:
+    """Start a child span of the current one without making it current.
+
+    For generators, which would otherwise leave their span current in the
+    consumer between items. The caller must ``end()`` it. None without a
+    tracer.
+    """
+    if tracer is None:
+        return None
+    return tracer.start_span(name, attributes=attributes)
+
+
+def record_response(current: Any, response: httpx.Response) -> None:
+    """Set the status and sizes of ``response`` on a span; 4xx/5xx mark an error."""
+    sent, received = body_sizes(response)
+    current.set_attribute("http.response.status_code", response.status_code)
+    current.set_attribute("http.request.body.size", sent)
+    current.set_attribute("http.response.body.size", received)
+    if response.status_code >= 400:
+        current.set_attribute("error.type", str(response.status_code))
+        current.set_status(trace.Status(trace.StatusCode.ERROR))
+
+
+def record_error(current: Any, exc: BaseException) -> None:
+    """Mark a span started with :func:`start_span` as failed by ``exc``."""
+    current.record_exception(exc)
+    current.set_status(trace.Status(trace.StatusCode.ERROR, str(exc)))
@@ -0,0 +1,233 @@
+"""Shrinking oversized tool results before they are handed to a model.
+
+:class:`ResultTrimmer` leaves every result that fits its size limit alone.
+A larger one has null and empty values dropped, nested member, board and
+organization objects collapsed to their ids (except those the caller asked
+for), and long descriptions shortened. Lists that still do not fit are cut
+short; the rest is kept in memory behind a continuation handle that the
+``get_more_results`` tool resolves. A value too large on its own has its
+longest strings shortened, or is replaced by a ``{"_too_large": bytes}``
+marker.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from universal_mcp_trello.codec import dumps
+
+COLLAPSED_KEYS = frozenset(
+    {"member", "memberCreator", "members", "membersVoted", "board", "organization"}
+)
+TRUNCATED_KEYS = frozenset({"desc"})
+
+# Room left in each page for the envelope keys.
+_ENVELOPE = 100
+
+# Strings are not shortened below this many characters to make a value fit.
+_MIN_TEXT = 16
+
+
+class ResultTrimmer:
+    """Post-processes oversized tool results to keep them cheap to transmit and read.
+
+    Args:
+        drop_empty: Remove keys whose value is null or an empty string or collection.
+        collapse: Keys whose nested objects are replaced by their ids, unless
+            the caller asked for them or they are keys of the result itself.
+        max_text: Longest kept value for the keys in ``truncate``, in characters.
+        truncate: Keys whose string values are shortened to ``max_text``.
+        max_bytes: Largest serialised result, above which it is trimmed and
+            paged; None leaves every result unchanged.
+        max_pending: How many unfetched remainders are kept.
+        ttl: Seconds a remainder is kept for ``get_more_results``.
+    """
+
+    def __init__(
+        self,
+        drop_empty: bool = True,
+        collapse: frozenset[str] = COLLAPSED_KEYS,
+        max_text: int | None = 500,
+        truncate: frozenset[str] = TRUNCATED_KEYS,
+        max_bytes: int | None = 20_000,
+        max_pending: int = 64,
+        ttl: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.drop_empty = drop_empty
+        self.collapse = collapse
+        self.max_text = max_text
+        self.truncate = truncate
+        self.max_bytes = max_bytes
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self._clock = clock
+        self._pending: OrderedDict[str, tuple[float, list[Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, result: Any, requested: Iterable[str] = ()) -> Any:
+        """Trim and page ``result`` if it is larger than ``max_bytes``.
+
+        ``requested`` names the tool arguments the caller set; the objects
+        they ask for (``members="all"``, ``member_fields=...``) are kept.
+        """
+        if self.max_bytes is None or len(dumps(result)) <= self.max_bytes:
+            return result
+        return self.fit(self.trim(result, requested_keys(requested)))
+
+    def trim(self, value: Any, keep: frozenset[str] = frozenset()) -> Any:
+        """Apply the dropping, collapsing and truncation rules recursively.
+
+        Keys in ``keep`` are never collapsed, nor are the keys of ``value``
+        itself when it is an object (e.g. the ``members`` of a search).
+        """
+        return self._trim(value, self.collapse - keep, top=True)
+
+    def _trim(self, value: Any, collapse: frozenset[str], top: bool = False) -> Any:
+        if isinstance(value, list):
+            return [self._trim(item, collapse) for item in value]
+        if not isinstance(value, dict):
+            return value
+        trimmed = {}
+        for key, item in value.items():
+            if key in collapse and not top:
+                item = _ids(item)
+            elif key in self.truncate and isinstance(item, str):
+                item = _shorten(item, self.max_text)
+            else:
+                item = self._trim(item, collapse)
+            if self.drop_empty and (item is None or item in ("", [], {})):
+                continue
+            trimmed[key] = item
+        return trimmed
+
+    def fit(self, value: Any) -> Any:
+        """Cut ``value`` down to ``max_bytes``, leaving a continuation for the rest.
+
+        A list becomes ``{"items": [...], "_remaining": n, "_continuation": h}``;
+        for an object, its largest list is cut short and the same two keys
+        are added next to it. Values that still do not fit (an object with
+        no list, or an item larger than a page) are shrunk as described in
+        :meth:`shrink`.
+        """
+        if self.max_bytes is None or len(dumps(value)) <= self.max_bytes:
+            return value
+        if isinstance(value, list):
+            page, remaining, handle = self._split(value, self.max_bytes)
+            return {"items": page, "_remaining": remaining, "_continuation": handle}
+        lists = []
+        if isinstance(value, dict):
+            lists = [k for k, v in value.items() if isinstance(v, list)]
+        if not lists:
+            return self.shrink(value, self.max_bytes)
+        key = max(lists, key=lambda k: len(dumps(value[k])))
+        rest = {k: v for k, v in value.items() if k != key}
+        if len(dumps(rest)) > self.max_bytes // 2:
+            rest = self.shrink(rest, self.max_bytes // 2)
+        budget = self.max_bytes - len(dumps(rest))
+        page, remaining, handle = self._split(value[key], budget)
+        return {**rest, key: page, "_remaining": remaining, "_continuation": handle}
+
+    def _split(
+        self, items: list[Any], budget: int
+    ) -> tuple[list[Any], int, str | None]:
+        page, used = [], 2
+        for item in items:
+            size = len(dumps(item)) + 1
+            if used + size > budget - _ENVELOPE:
+                if page:
+                    break
+                item = self.shrink(item, budget - _ENVELOPE - used - 1)
+                size = len(dumps(item)) + 1
+            page.append(item)
+            used += size
+        rest = items[len(page) :]
+        return page, len(rest), self._remember(rest) if rest else None
+
+    def shrink(self, value: Any, limit: int) -> Any:
+        """``value`` cut down to serialise within ``limit`` bytes.
+
+        Its longest strings are shortened, down to a few characters each;
+        if that is not enough, ``{"_too_large": bytes}`` (plus the ``id``
+        of an object) replaces it.
+        """
+        size = len(dumps(value))
+        longest = _longest_string(value)
+        shrunk = value
+        while len(dumps(shrunk)) > limit and longest > _MIN_TEXT:
+            longest //= 2
+            shrunk = _cap_strings(value, max(longest, _MIN_TEXT))
+        if len(dumps(shrunk)) <= limit:
+            return shrunk
+        marker: dict[str, Any] = {"_too_large": size}
+        if isinstance(value, dict) and isinstance(value.get("id"), str):
+            marker["id"] = value["id"]
+        return marker
+
+    def _remember(self, items: list[Any]) -> str:
+        handle = secrets.token_urlsafe(12)
+        with self._lock:
+            self._pending[handle] = (self._clock() + self.ttl, items)
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+        return handle
+
+    def resume(self, handle: str) -> dict[str, Any]:
+        """The next part of a cut-short result.
+
+        Always ``{"items": [...], "_remaining": n, "_continuation": h}``, with
+        ``h`` None once nothing remains.
+        """
+        with self._lock:
+            expires_at, items = self._pending.pop(handle, (0.0, None))
+        if items is None or expires_at < self._clock():
+            raise ValueError(f"Unknown or expired continuation '{handle}'.")
+        page, remaining, handle = self._split(items, self.max_bytes)
+        return {"items": page, "_remaining": remaining, "_continuation": handle}
+
+
+def requested_keys(arguments: Iterable[str]) -> frozenset[str]:
+    """Result keys asked for by tool arguments, e.g. ``member_fields`` asks for
+    ``member`` and ``members``."""
+    keys = set()
+    for name in arguments:
+        stem = name.split("_")[0]
+        keys.update((stem, f"{stem}s", stem.removesuffix("s")))
+    return frozenset(keys)
+
+
+def _ids(value: Any) -> Any:
+    if isinstance(value, dict) and "id" in value:
+        return value["id"]
+    if isinstance(value, list):
+        return [_ids(item) for item in value]
+    return value
+
+
+def _longest_string(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, list):
+        return 0
+    return max(map(_longest_string, value), default=0)
+
+
+def _cap_strings(value: Any, limit: int) -> Any:
+    if isinstance(value, str):
+        return _shorten(value, limit)
+    if isinstance(value, list):
+        return [_cap_strings(item, limit) for item in value]
+    if isinstance(value, dict):
+        return {key: _cap_strings(item, limit) for key, item in value.items()}
+    return value
+
+
+def _shorten(text: str, limit: int | None) -> str:
+    if limit is None or len(text) <= limit:
+        return text
+    return f"{text[:limit]}… [{len(text) - limit} more characters]"
@@ -0,0 +1,127 @@
+"""Streaming multipart/form-data uploads.
+
+Upload tools (attachments, avatars, logos, board backgrounds and stickers)
+accept an open binary file (including an ``mmap``) or an in-memory buffer.
+Paths are only opened for ``TrelloApp.upload``, never for a tool call, whose
+arguments come from the agent. :func:`open_upload` turns any of these into a
+reader that httpx pulls
+from in :data:`CHUNK_SIZE` pieces while it sends the multipart body, so a
+file on disk is never loaded whole and memory stays flat whatever its size.
+When the size can be determined, the request carries a ``Content-Length``;
+otherwise httpx falls back to chunked transfer encoding.
+"""
+
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# httpx reads multipart file fields in pieces of this size.
+CHUNK_SIZE = 64 * 1024
+
+Progress = Callable[[int, int | None], None]
+
+
+class UploadReader:
+    """Read-only view of a file that reports progress as it is read.
+
+    Seeking is passed through, so when a request is retried (httpx rewinds
+    file fields before sending them) the reported count restarts from zero.
+
+    Args:
+        raw: The underlying binary file.
+        total: Its size in bytes, if known.
+        progress: Called as ``progress(sent, total)`` after each chunk.
+    """
+
+    def __init__(self, raw: Any, total: int | None, progress: Progress | None = None):
+        self.raw = raw
+        self.total = total
+        self.progress = progress
+        self.sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.raw.read(size)
+        if chunk:
+            self.sent += len(chunk)
+            if self.progress is not None:
+                self.progress(self.sent, self.total)
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self.raw.seek(offset, whence)  # mmap.seek() returns None before 3.13
+        self.sent = self.raw.tell()
+        return self.sent
+
+    def tell(self) -> int:
+        return self.raw.tell()
+
+
+class _BufferFile:
+    """Minimal binary file over a buffer; each read copies one chunk only."""
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size < 0 else min(self._pos + size, len(self._view))
+        chunk = bytes(self._view[self._pos : end])
+        self._pos = end
+        return chunk
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: len(self._view)}
+        self._pos = max(base[whence] + offset, 0)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def _size(raw: Any) -> int | None:
+    try:
+        position = raw.tell()
+        raw.seek(0, os.SEEK_END)
+        end = raw.tell()
+        raw.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end
+
+
+@contextmanager
+def open_upload(
+    source: Any, progress: Progress | None = None, allow_paths: bool = False
+) -> Iterator[tuple[str, UploadReader]]:
+    """Yield ``(filename, reader)`` for an httpx ``files=`` entry.
+
+    Args:
+        source: A path (``str`` or ``os.PathLike``), a binary file object
+            (anything with ``read()``, e.g. an open file or ``mmap``), or a
+            ``bytes``/``bytearray``/``memoryview`` buffer. Paths are opened
+            here and closed on exit; file objects are left open.
+        progress: Called as ``progress(sent, total)`` while the body is sent.
+        allow_paths: Accept a path for ``source``; without it a path raises
+            ``TypeError``, so tool arguments cannot read server files.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if not allow_paths:
+            raise TypeError(
+                "Upload tools take file contents, not a path; "
+                "use TrelloApp.upload() to send a file from disk."
+            )
+        with open(source, "rb") as raw:
+            yield os.path.basename(source), UploadReader(raw, _size(raw), progress)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        raw = _BufferFile(source)
+        yield "file", UploadReader(raw, _size(raw), progress)
+    elif hasattr(source, "read"):
+        name = getattr(source, "name", None)
+        filename = os.path.basename(name) if isinstance(name, str) else "file"
+        yield filename, UploadReader(source, _size(source), progress)
+    else:
+        raise TypeError(
+            f"Cannot upload {type(source).__name__}; "
+            "pass a path, a binary file or a bytes-like buffer."
+        )
@@ -0,0 +1,121 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from universal_mcp_trello.mirror import BoardMirror
+
+Scope = dict[str, Any]
+Receive = Callable[[], Awaitable[dict[str, Any]]]
+Send = Callable[[dict[str, Any]], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+def sign(secret: str, body: bytes, callback_url: str) -> str:
+    """Compute the ``X-Trello-Webhook`` signature Trello sends with a callback.
+
+    Trello signs the raw request body followed by the webhook's callback URL
+    with HMAC-SHA1, keyed by the application's OAuth secret.
+    """
+    digest = hmac.new(secret.encode(), body + callback_url.encode(), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode()
+
+
+def verify_signature(secret: str, body: bytes, callback_url: str, signature: str | None) -> bool:
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body, callback_url), signature)
+
+
+class WebhookReceiver:
+    """ASGI application that applies Trello webhook callbacks to a mirror.
+
+    Serve it with any ASGI server (e.g. ``uvicorn``) at the URL registered as
+    the webhook's ``callbackURL``. ``HEAD`` requests, which Trello sends to
+    validate a new webhook, are answered with 200. Signed ``POST`` callbacks
+    are verified and their action is applied to ``mirror``; unsigned or
+    tampered ones are rejected with 401. Actions the mirror cannot apply
+    (e.g. a card without an ``id``) are skipped but still acknowledged, since
+    Trello disables webhooks whose callbacks keep failing.
+
+    Args:
+        mirror: The mirror to keep up to date.
+        secret: The Trello application's OAuth secret, used to verify
+            signatures. Verification is skipped if it is None.
+        callback_url: The exact ``callbackURL`` the webhook was registered with.
+        on_action: Optional hook called with each verified action.
+    """
+
+    def __init__(
+        self,
+        mirror: BoardMirror,
+        secret: str | None,
+        callback_url: str,
+        on_action: Callable[[dict[str, Any]], None] | None = None,
+        max_body: int = 1024 * 1024,
+    ) -> None:
+        self.mirror = mirror
+        self.secret = secret
+        self.callback_url = callback_url
+        self.on_action = on_action
+        self.max_body = max_body
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            while (await receive())["type"] != "lifespan.shutdown":
+                await send({"type": "lifespan.startup.complete"})
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+        if scope["type"] != "http":
+            return
+        method = scope["method"]
+        if method in ("HEAD", "GET"):
+            await self._respond(send, 200)
+            return
+        if method != "POST":
+            await self._respond(send, 405)
+            return
+        body = await self._read_body(receive)
+        if body is None:
+            await self._respond(send, 413)
+            return
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        if self.secret is not None and not verify_signature(
+            self.secret, body, self.callback_url, headers.get("x-trello-webhook")
+        ):
+            await self._respond(send, 401)
+            return
+        try:
+            action = json.loads(body)["action"]
+        except (ValueError, KeyError, TypeError):
+            await self._respond(send, 400)
+            return
+        try:
+            self.mirror.apply_action(action)
+        except (KeyError, TypeError, AttributeError):
+            logger.warning("Skipping malformed webhook action: %.200r", action)
+            await self._respond(send, 200)
+            return
+        if self.on_action is not None:
+            self.on_action(action)
+        await self._respond(send, 200)
+
+    async def _read_body(self, receive: Receive) -> bytes | None:
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                return b"".join(chunks)
+
+    async def _respond(self, send: Send, status: int) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-length", b"0")]})
+        await send({"type": "http.response.body", "body": b""})
@@ -15,3 +15,9 @@ def app_instance():
 
 def test_application(app_instance):
     check_application_instance(app_instance, app_name="trello")
+
+def test_tool_filtering_by_tag_and_name():
+    mock_integration = MagicMock()
+    app = TrelloApp(integration=mock_integration, tool_tags=["important"], tool_names=["get_boards_id"])
+    names = {tool.__name__ for tool in app.list_tools()}
+    assert names == {"get_actions_id", "check_card_item", "get_search", "get_boards_id"}
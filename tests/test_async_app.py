@@ -0,0 +1,69 @@
+import asyncio
+import inspect
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_trello.async_app import AsyncTrelloApp
+
+
+@pytest.fixture
+def app_instance():
+    mock_integration = MagicMock()
+    mock_integration.get_credentials.return_value = {"access_token": "dummy_access_token"}
+    return AsyncTrelloApp(integration=mock_integration, max_concurrency=4)
+
+
+def test_tools_are_coroutines(app_instance):
+    tools = app_instance.list_tools()
+    assert tools
+    for tool in tools:
+        assert inspect.iscoroutinefunction(tool)
+        assert tool.__doc__ == tool.__wrapped__.__doc__
+        assert "self" not in inspect.signature(tool).parameters
+    assert [tool.__name__ for tool in tools] == [
+        tool.__name__ for tool in super(AsyncTrelloApp, app_instance).list_tools()
+    ]
+
+
+def test_tool_calls_run_concurrently(app_instance, monkeypatch):
+    response = MagicMock(status_code=200, content=b'{"id": "abc"}')
+    # Breaks, failing the calls, unless all four workers are in a call at once.
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get(url, params=None):
+        barrier.wait()
+        return response
+
+    monkeypatch.setattr(app_instance, "_get", get)
+    tool = next(t for t in app_instance.list_tools() if t.__name__ == "get_actions_id")
+
+    async def run():
+        return await asyncio.gather(*(tool(id=str(i)) for i in range(8)))
+
+    assert asyncio.run(run()) == [{"id": "abc"}] * 8
+
+
+def test_workers_share_one_client(app_instance, monkeypatch):
+    created = []
+
+    def slow_client(**kwargs):
+        time.sleep(0.01)
+        created.append(kwargs)
+        return MagicMock()
+
+    monkeypatch.setattr("universal_mcp_trello.async_app.httpx.Client", slow_client)
+    barrier = threading.Barrier(8)
+
+    def get():
+        barrier.wait()
+        return app_instance.client
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1
@@ -0,0 +1,178 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.attachments import AttachmentStore
+
+DATA = bytes(range(256)) * 4000
+FILE_URL = "https://trello.com/1/cards/c1/attachments/a1/download/spec.pdf"
+
+
+def file_server(requests, drop_after=None):
+    """Serves DATA with Range support; the first download drops after `drop_after`."""
+
+    def handler(request):
+        requests.append(request)
+        if "/download/" not in request.url.path:
+            return httpx.Response(
+                200, json={"id": "a1", "url": FILE_URL, "isUpload": True}
+            )
+        start = int(request.headers.get("range", "bytes=0-")[6:-1])
+        body = DATA[start:]
+
+        def chunks():
+            if drop_after is None or len(requests) > 2:
+                yield body
+                return
+            yield body[:drop_after]
+            raise httpx.ReadError("connection reset")
+
+        if not start:
+            return httpx.Response(200, content=chunks())
+        headers = {"Content-Range": f"bytes {start}-{len(DATA) - 1}/{len(DATA)}"}
+        return httpx.Response(206, content=chunks(), headers=headers)
+
+    return handler
+
+
+def make_app(handler, store=None, download_dir=None):
+    app = TrelloApp(
+        integration=MagicMock(), attachment_store=store, download_dir=download_dir
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+def test_resumes_dropped_download_with_range(tmp_path):
+    requests = []
+    app = make_app(file_server(requests, drop_after=100_000), download_dir=tmp_path)
+    dest = tmp_path / "spec.pdf"
+    result = app.download_attachment("c1", "a1", dest="spec.pdf")
+    assert result == {
+        "path": str(dest),
+        "bytes": len(DATA),
+        "sha256": None,
+        "cached": False,
+    }
+    assert dest.read_bytes() == DATA
+    assert not (tmp_path / "spec.pdf.part").exists()
+    assert [r.headers.get("range") for r in requests[1:]] == [None, "bytes=100000-"]
+
+    buffer = io.BytesIO()
+    app.download_attachment("c1", "a1", dest=buffer)
+    assert buffer.getvalue() == DATA
+
+
+def test_store_serves_repeat_downloads_without_requests(tmp_path):
+    requests = []
+    store = AttachmentStore(tmp_path / "store")
+    app = make_app(file_server(requests), store)
+    first = app.download_attachment("c1", "a1")
+    assert first["cached"] is False and first["bytes"] == len(DATA)
+    sent = len(requests)
+
+    buffer = io.BytesIO()
+    again = app.download_attachment("c1", "a1", dest=buffer)
+    assert again["cached"] is True and again["sha256"] == first["sha256"]
+    assert buffer.getvalue() == DATA
+    assert len(requests) == sent
+
+    app.download_attachment("c2", "a2")  # same content under another id
+    assert store.stats()["files"] == 1
+    with pytest.raises(ValueError, match="Pass 'dest'"):
+        make_app(file_server([])).download_attachment("c1", "a1")
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = AttachmentStore(tmp_path, max_bytes=250)
+    for name in "abc":
+        (tmp_path / name).write_bytes(name.encode() * 100)
+        store.put(name, tmp_path / name)
+        if name == "b":
+            assert store.get("a") is not None  # a is now more recent than b
+    assert store.get("b") is None
+    assert store.get("a").path.read_bytes() == b"a" * 100
+    assert store.stats()["bytes"] == 200
+
+
+@pytest.mark.parametrize("dest", ["../spec.pdf", "/tmp/spec.pdf", "a/../../spec.pdf"])
+def test_rejects_dest_outside_the_download_dir(tmp_path, dest):
+    requests = []
+    app = make_app(file_server(requests), download_dir=tmp_path / "downloads")
+    with pytest.raises(ValueError, match="file name|leave"):
+        app.download_attachment("c1", "a1", dest=dest)
+    assert requests == []
+
+
+def test_concurrent_downloads_of_one_attachment_share_a_request(tmp_path):
+    requests = []
+    release = threading.Event()
+    serve = file_server(requests)
+
+    def handler(request):
+        if "/download/" in request.url.path:
+            release.wait(5)
+        return serve(request)
+
+    app = make_app(handler, AttachmentStore(tmp_path / "store"))
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(app.download_attachment, "c1", "a1") for _ in range(4)]
+        while app._downloads.in_flight() == 0:
+            pass
+        release.set()
+        results = [f.result() for f in futures]
+    assert {r["sha256"] for r in results} == {results[0]["sha256"]}
+    assert len([r for r in requests if "/download/" in r.url.path]) == 1
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {"id": "a1", "url": "http://169.254.169.254/latest", "isUpload": False},
+        {"id": "a1", "url": "https://internal.example.com/x", "isUpload": True},
+        {"id": "a1", "url": "https://trello.com/1/boards/b1", "isUpload": True},
+    ],
+)
+def test_downloads_only_files_uploaded_to_trello(tmp_path, metadata):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=metadata)
+
+    app = make_app(handler, download_dir=tmp_path)
+    with pytest.raises(ValueError, match="link|not hosted|no download"):
+        app.download_attachment("c1", "a1", dest="x")
+    assert [r.url.host for r in requests] == ["api.trello.com"]
+
+
+def test_credentials_stay_on_trello_across_redirects():
+    stored = "https://files.example.com/spec.pdf?signature=s"
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.host == "api.trello.com":
+            return httpx.Response(
+                200, json={"id": "a1", "url": FILE_URL, "isUpload": True}
+            )
+        if request.url.host == "trello.com":
+            return httpx.Response(302, headers={"Location": stored})
+        return httpx.Response(200, content=iter([DATA]))
+
+    app = make_app(handler)
+    app._client.headers["Authorization"] = "OAuth secret"
+    buffer = io.BytesIO()
+    app.download_attachment("c1", "a1", dest=buffer)
+    assert buffer.getvalue() == DATA
+    hosts = [(r.url.host, r.headers.get("authorization")) for r in requests]
+    assert hosts == [
+        ("api.trello.com", "OAuth secret"),
+        ("trello.com", "OAuth secret"),
+        ("files.example.com", None),
+    ]
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.auditlog import AuditLogIngester
+
+
+class FakeAuditLog:
+    """Serves `entries` newest first, honouring `since`, `before` and `limit`."""
+
+    def __init__(self):
+        self.entries = []
+        self.requests = []
+
+    def add(self, *numbers):
+        self.entries[:0] = [{"id": f"{n:024x}", "type": "x"} for n in reversed(numbers)]
+
+    def __call__(self, url, params=None):
+        self.requests.append(dict(params))
+        page = [e for e in self.entries if e["id"] > params.get("since", "")]
+        page = [e for e in page if "before" not in params or e["id"] < params["before"]]
+        return page[: params["limit"]]
+
+
+@pytest.fixture
+def log():
+    return FakeAuditLog()
+
+
+@pytest.fixture
+def app(log, monkeypatch):
+    app = TrelloApp(integration=MagicMock())
+    monkeypatch.setattr(app, "_get_json", log)
+    return app
+
+
+@pytest.mark.parametrize("name", ["audit.jsonl", "audit.jsonl.gz"])
+def test_ingests_only_new_entries(app, log, tmp_path, name):
+    ingester = AuditLogIngester(app, "ent1", tmp_path / name, page_size=2)
+    log.add(1, 2, 3, 4, 5)
+    assert ingester.run().appended == 5
+    assert len(log.requests) == 3 and "since" not in log.requests[0]
+
+    log.requests.clear()
+    assert ingester.run().appended == 0
+    log.add(6, 7)
+    result = ingester.run()
+    assert (result.appended, result.cursor) == (2, f"{7:024x}")
+    assert log.requests[-1]["since"] == f"{5:024x}"
+    ids = [int(entry["id"], 16) for entry in ingester.entries()]
+    assert ids == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_recovers_from_interrupted_run(app, log, tmp_path):
+    path = tmp_path / "audit.jsonl"
+    ingester = AuditLogIngester(app, "ent1", path)
+    log.add(1, 2)
+    ingester.run()
+    with open(path, "ab") as f:
+        f.write(b'{"id": "partial"')  # appended, but the mark was never saved
+    log.add(3)
+    assert ingester.run().appended == 1
+    assert [int(e["id"], 16) for e in ingester.entries()] == [1, 2, 3]
+
+    ingester.state_path.unlink()  # the mark is rebuilt from the log itself
+    log.add(4)
+    assert ingester.run().appended == 1
+    assert [int(e["id"], 16) for e in ingester.entries()] == [1, 2, 3, 4]
+
+
+def test_stops_when_paging_is_ignored(app, log, tmp_path, monkeypatch):
+    log.add(1, 2, 3)
+    monkeypatch.setattr(app, "_get_json", lambda url, params=None: log.entries[:2])
+    ingester = AuditLogIngester(app, "ent1", tmp_path / "audit.jsonl", page_size=2)
+    assert ingester.run().appended == 2
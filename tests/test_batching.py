@@ -0,0 +1,69 @@
+import json
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.batching import GetBatcher, to_route
+
+BASE_URL = "https://api.trello.com/1"
+
+
+def test_to_route_encodes_commas():
+    route = to_route(BASE_URL, f"{BASE_URL}/cards/abc", {"fields": "name,desc", "badges": True})
+    assert route == "/cards/abc?fields=name%2Cdesc&badges=true"
+    assert to_route(BASE_URL, "https://example.com/cards/abc") is None
+    assert to_route(BASE_URL, f"{BASE_URL}/batch", {"urls": "/cards/a"}) is None
+
+
+def test_concurrent_gets_are_coalesced():
+    sent = []
+
+    def send(url, params):
+        sent.append((url, params))
+        routes = params["urls"].split(",")
+        body = [{"200": {"route": route}} if "missing" not in route else {"statusCode": 404, "message": "not found"} for route in routes]
+        return httpx.Response(200, content=json.dumps(body).encode(), request=httpx.Request("GET", url))
+
+    batcher = GetBatcher(send, BASE_URL, window=0.05)
+    results = {}
+
+    def worker(i):
+        card_id = "missing" if i == 3 else f"card{i}"
+        results[i] = batcher.submit(f"{BASE_URL}/cards/{card_id}")
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sent) == 2
+    assert all(url == f"{BASE_URL}/batch" for url, _ in sent)
+    assert results[0].json() == {"route": "/cards/card0"}
+    assert results[3].status_code == 404
+
+
+def test_batch_scope_covers_only_its_own_calls():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path == "/1/batch":
+            urls = request.url.params["urls"].split(",")
+            return httpx.Response(200, json=[{"200": {"id": url[-2:]}} for url in urls])
+        return httpx.Response(200, json={"id": request.url.path[-2:]})
+
+    app = TrelloApp(integration=MagicMock(), fields_profile="all", single_flight=False)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    results = {}
+    with app.batch() as batch:
+        futures = [batch.submit(app.get_cards_id, card) for card in ("c1", "c2")]
+        other = threading.Thread(target=lambda: results.setdefault("c3", app.get_cards_id("c3")))
+        other.start()
+        other.join()
+
+    assert sorted(future.result()["id"] for future in futures) == ["c1", "c2"]
+    assert results["c3"] == {"id": "c3"}
+    assert sorted(paths) == ["/1/batch", "/1/cards/c3"]
@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.bulk import MAX_WORKERS, BulkJournal, run_bulk
+
+
+def test_reports_each_outcome_and_resumes(tmp_path):
+    ops = [{"id": f"c{i}", "idList": "done"} for i in range(20)]
+    attempts = []
+
+    def apply(op):
+        attempts.append(op["id"])
+        if op["id"] in ("c3", "c7") and attempts.count(op["id"]) == 1:
+            raise RuntimeError("boom")
+
+    def steps(op):
+        return [("update", lambda: apply(op))]
+
+    journal_path = tmp_path / "journal.txt"
+    first = run_bulk(ops, steps, max_workers=4, journal=BulkJournal(journal_path))
+    assert (first["succeeded"], first["failed"]) == (18, 2)
+    assert [r["id"] for r in first["results"]] == [op["id"] for op in ops]
+    assert first["results"][3] == {"index": 3, "id": "c3", "ok": False, "error": "RuntimeError: boom"}
+    assert [op["id"] for op in first["retry"]] == ["c3", "c7"]
+
+    second = run_bulk(ops, steps, max_workers=4, journal=BulkJournal(journal_path))
+    assert (second["succeeded"], second["failed"], second["skipped"]) == (2, 0, 18)
+    assert len(attempts) == 22
+
+
+def test_bulk_update_cards_sends_field_label_and_member_requests(tmp_path):
+    sent = []
+
+    def handler(request):
+        sent.append((request.method, request.url.path, dict(request.url.params)))
+        return httpx.Response(200, json={})
+
+    app = TrelloApp(integration=MagicMock(), journal_dir=tmp_path, single_flight=False)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    ops = [{"id": "c1", "idList": "l2", "pos": "top", "addLabels": ["x1"], "removeLabels": ["x2"],
+            "addMembers": ["m1"], "removeMembers": ["m2"]}]
+    result = app.bulk_update_cards(ops, max_workers=1, journal="run.journal")
+
+    assert result["succeeded"] == 1
+    assert sent[0][:2] == ("PUT", "/1/cards/c1")
+    assert sent[0][2] == {"idList": "l2", "pos": "top"}
+    assert [entry[:2] for entry in sent[1:]] == [
+        ("POST", "/1/cards/c1/idLabels"),
+        ("DELETE", "/1/cards/c1/idLabels/x2"),
+        ("POST", "/1/cards/c1/idMembers"),
+        ("DELETE", "/1/cards/c1/idMembers/m2"),
+    ]
+    assert sent[1][2] == {"value": "x1"} and sent[3][2] == {"value": "m1"}
+    assert (tmp_path / "run.journal").exists()
+
+
+def test_resume_skips_the_steps_already_applied(tmp_path):
+    sent, fail = [], {"member": True}
+
+    def handler(request):
+        sent.append((request.method, request.url.path))
+        if request.url.path.endswith("/idMembers") and fail["member"]:
+            return httpx.Response(500)
+        return httpx.Response(200, json={})
+
+    app = TrelloApp(integration=MagicMock(), journal_dir=tmp_path, single_flight=False)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    ops = [{"id": "c1", "name": "x", "addLabels": ["x1"], "addMembers": ["m1"]}]
+    first = app.bulk_update_cards(ops, journal="run.journal")
+    assert first["failed"] == 1
+
+    fail["member"] = False
+    sent.clear()
+    second = app.bulk_update_cards(ops, journal="run.journal")
+    assert second["succeeded"] == 1
+    assert sent == [("POST", "/1/cards/c1/idMembers")]
+    assert app.bulk_update_cards(ops, journal="run.journal")["skipped"] == 1
+
+
+def test_workers_are_capped():
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def step():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+
+    ops = [{"id": f"c{i}"} for i in range(MAX_WORKERS * 3)]
+    result = run_bulk(ops, lambda op: [("update", step)], max_workers=1000)
+    assert result["succeeded"] == len(ops)
+    assert peak[0] <= MAX_WORKERS
+
+
+@pytest.mark.parametrize("journal", ["../escape", "/tmp/journal", "a/../../b"])
+def test_bulk_update_cards_rejects_journal_paths(tmp_path, journal):
+    app = TrelloApp(integration=MagicMock(), journal_dir=tmp_path)
+    with pytest.raises(ValueError):
+        app.bulk_update_cards([{"id": "c1", "name": "x"}], journal=journal)
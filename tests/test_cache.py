@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.cache import CacheEntry, MemoryCache, ResponseCache, SQLiteCache, TTLPolicy
+
+BASE_URL = "https://api.trello.com/1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_response(content=b"{}", headers=None):
+    return httpx.Response(200, headers=headers, content=content, request=httpx.Request("GET", BASE_URL))
+
+
+def test_key_normalises_params():
+    cache = ResponseCache()
+    assert cache.key("get", f"{BASE_URL}/boards/b", {"fields": "name", "cards": None, "lists": True}) == cache.key(
+        "GET", f"{BASE_URL}/boards/b", {"lists": True, "fields": "name"}
+    )
+
+
+def test_ttl_policy_prefers_metadata():
+    policy = TTLPolicy()
+    assert policy.ttl_for("/boards/b/labels") > policy.ttl_for("/boards/b") > policy.ttl_for("/cards/c")
+
+
+def test_entries_expire_and_keep_validators():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    url = f"{BASE_URL}/boards/b/labels"
+    key = cache.key("GET", url)
+    cache.store(key, url, make_response(b"[]", {"etag": 'W/"abc"'}))
+    entry, fresh = cache.lookup(key)
+    assert fresh and entry.content == b"[]"
+    clock.now += 3601
+    entry, fresh = cache.lookup(key)
+    assert not fresh
+    assert cache.validators(entry) == {"If-None-Match": 'W/"abc"'}
+    cache.refresh(key, url, entry)
+    assert cache.lookup(key)[1]
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    for key in "abc":
+        if key == "c":
+            cache.get("a")
+        cache.set(key, CacheEntry(200, {}, b"x", 0))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_sqlite_cache_round_trip(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=1)
+    cache.set("a", CacheEntry(200, {"etag": "1"}, b"{}", 5.0))
+    assert cache.get("a").etag == "1"
+    cache.set("b", CacheEntry(200, {}, b"[]", 5.0))
+    assert cache.get("a") is None
+    assert cache.get("b").content == b"[]"
+
+
+def test_invalidate_evicts_only_dependent_entries():
+    cache = ResponseCache()
+    card, other_card, board, label = "a" * 24, "b" * 24, "c" * 24, "d" * 24
+    cards_url = f"{BASE_URL}/boards/{board}/cards"
+    labels_url = f"{BASE_URL}/boards/{board}/labels"
+    card_url = f"{BASE_URL}/cards/{other_card}"
+    cache.store(cache.key("GET", cards_url), cards_url, make_response(f'[{{"id": "{card}"}}]'.encode()))
+    cache.store(cache.key("GET", labels_url), labels_url, make_response(f'[{{"id": "{label}"}}]'.encode()))
+    cache.store(cache.key("GET", card_url), card_url, make_response(f'{{"id": "{other_card}"}}'.encode()))
+
+    assert cache.invalidate({card}) == 1
+    assert cache.lookup(cache.key("GET", cards_url))[0] is None
+    assert cache.lookup(cache.key("GET", labels_url))[0] is not None
+    assert cache.lookup(cache.key("GET", card_url))[0] is not None
+
+
+def test_sqlite_index_survives_reopen(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SQLiteCache(path).set("k", CacheEntry(200, {}, b"{}", 5.0, ids=frozenset({"a" * 24})))
+    cache = SQLiteCache(path)
+    assert cache.keys_for({"a" * 24}) == {"k"}
+    cache.delete("k")
+    assert cache.keys_for({"a" * 24}) == set()
+
+
+def test_write_by_short_link_evicts_cached_board():
+    board = "c" * 24
+    names = iter(["Old", "New"])
+
+    def handler(request):
+        if request.method == "PUT":
+            return httpx.Response(200, json={"id": board, "name": "New"})
+        return httpx.Response(200, json={"id": board, "name": next(names)})
+
+    app = TrelloApp(integration=MagicMock(), cache=ResponseCache(), fields_profile="all")
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert app.get_boards_id("AbCdEfGh")["name"] == "Old"
+    assert app.get_boards_id("AbCdEfGh")["name"] == "Old"  # cached
+    app.put_boards_id("AbCdEfGh", name="New")
+    assert app.get_boards_id("AbCdEfGh")["name"] == "New"
@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.codec import DECODE_ERRORS, decode, decode_response, iter_array
+from universal_mcp_trello.models import Card
+
+CARDS = b'[{"id": "c1", "name": "One", "pos": 1, "badges": {"votes": 0}}, {"id": "c2", "closed": true}]'
+
+
+@pytest.mark.parametrize(
+    ("status", "content", "expected"),
+    [
+        (200, b'{"id": "a"}', {"id": "a"}),
+        (204, b"", None),
+        (200, b" \n", None),
+        (200, b"not json", None),
+    ],
+)
+def test_decode_response(status, content, expected):
+    assert decode_response(httpx.Response(status, content=content)) == expected
+
+
+def test_decode_response_raises_on_payload_not_matching_model():
+    assert decode_response(httpx.Response(200, content=b"<html>"), list[Card]) is None
+    with pytest.raises(DECODE_ERRORS):
+        decode_response(httpx.Response(200, content=b'{"id": "c1"}'), list[Card])
+    with pytest.raises(DECODE_ERRORS):
+        decode_response(httpx.Response(200, content=b'[{"name": "no id"}]'), list[Card])
+
+
+def test_decodes_into_models():
+    cards = decode(CARDS, list[Card])
+    assert cards == [Card(id="c1", name="One", pos=1), Card(id="c2", closed=True)]
+    assert not hasattr(cards[0], "__dict__")
+
+
+def test_call_typed(monkeypatch):
+    app = TrelloApp(integration=MagicMock(), fields_profile="all")
+    requests = []
+
+    def get(url, params=None):
+        requests.append((url, params))
+        return httpx.Response(200, content=CARDS, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(app, "_get", get)
+    cards = app.call_typed("get_lists_id_cards", list[Card], "l1")
+    assert [card.id for card in cards] == ["c1", "c2"]
+    assert requests == [("https://api.trello.com/1/lists/l1/cards", {})]
+    with pytest.raises(ValueError):
+        app.call_typed("bulk_update_cards", dict, ops=[])
+
+
+@pytest.mark.parametrize("size", [1, 3, 64])
+def test_iter_array_across_chunks(size):
+    raw = b'[{"id": "c1", "desc": "a ] , \\" tricky"}, 12.5, -3e2, [], null]'
+    chunks = [raw[i : i + size] for i in range(0, len(raw), size)]
+    assert list(iter_array(chunks)) == [{"id": "c1", "desc": 'a ] , " tricky'}, 12.5, -300.0, [], None]
+    assert list(iter_array([b'{"id": "b1"}'])) == [{"id": "b1"}]
+    with pytest.raises(ValueError):
+        list(iter_array([raw[:-5]]))
+
+
+def test_stream():
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200, content=iter([CARDS[:30], CARDS[30:]]))
+
+    app = TrelloApp(integration=MagicMock(), fields_profile="all")
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    cards = app.stream("get_boards_id_cards", "b1", model=Card)
+    assert [card.id for card in cards] == ["c1", "c2"]
+    assert seen == ["https://api.trello.com/1/boards/b1/cards"]
+    with pytest.raises(ValueError):
+        app.stream("put_cards_id", "c1", name="x")
@@ -0,0 +1,36 @@
+import gzip
+from unittest.mock import MagicMock
+
+import httpx
+
+from universal_mcp_trello.app import TrelloApp
+
+BODY = b"[" + b",".join(b'{"id": "c%d", "name": "Card"}' % i for i in range(200)) + b"]"
+GZIPPED = gzip.compress(BODY)
+
+
+def test_negotiates_and_measures_compression():
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["accept-encoding"])
+        # An iterable body is read by the client, like one from the network.
+        return httpx.Response(
+            200, content=iter([GZIPPED]), headers={"Content-Encoding": "gzip"}
+        )
+
+    app = TrelloApp(integration=MagicMock(), fields_profile="all")
+    app._client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=app._get_headers()
+    )
+    assert len(app.get_boards_id_cards("b1")) == 200
+    assert [card["id"] for card in app.stream("get_lists_id_cards", "l1")][-1] == "c199"
+
+    # httpx asks for the encodings it can decode; the app adds nothing.
+    assert len(seen) == 2 and all("gzip" in value for value in seen)
+    stats = app.transfer_stats.snapshot()
+    assert stats["responses"] == 2
+    assert stats["body_bytes"] == 2 * len(BODY)
+    assert stats["wire_bytes"] == 2 * len(GZIPPED)
+    assert stats["saved_bytes"] > 0 and stats["ratio"] < 0.5
+    assert stats["by_encoding"]["gzip"]["responses"] == 2
@@ -0,0 +1,79 @@
+import inspect
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.endpoints import ENDPOINTS, EndpointTool
+from universal_mcp_trello.projections import BOARD, CARD
+
+
+@pytest.fixture
+def app_instance():
+    return TrelloApp(integration=MagicMock(), fields_profile="all")
+
+
+@pytest.fixture
+def sent(app_instance, monkeypatch):
+    calls = []
+    response = MagicMock(status_code=200, content=b'{"ok": true}')
+
+    def record(method):
+        def send(url, data=None, params=None, **kwargs):
+            calls.append((method, url, data, params))
+            return response
+
+        return send
+
+    for method in ("_get", "_post", "_put", "_delete"):
+        monkeypatch.setattr(app_instance, method, record(method))
+    return calls
+
+
+def test_every_endpoint_builds_a_tool():
+    for endpoint in ENDPOINTS:
+        tool = getattr(TrelloApp, endpoint.name)
+        assert not isinstance(TrelloApp.__dict__[endpoint.name], EndpointTool)
+        assert tool.__name__ == endpoint.name
+        assert tool.__doc__ == endpoint.doc
+        names = list(inspect.signature(tool).parameters)
+        assert names == ["self", *(row[0] for row in endpoint.params)]
+        for placeholder in endpoint.route().path_params:
+            assert f"{{{placeholder}}}" in endpoint.path
+
+
+def test_builds_query_and_body(app_instance, sent):
+    assert app_instance.get_actions_id("a1", fields="all") == {"ok": True}
+    app_instance.put_boards_id("b1", name="Board", prefs_voting="members")
+    app_instance.create_reaction_to_action("a1", shortName="+1")
+    assert sent == [
+        ("_get", "https://api.trello.com/1/actions/a1", None, {"fields": "all"}),
+        ("_put", "https://api.trello.com/1/boards/b1", None, {"name": "Board", "prefs/voting": "members"}),
+        ("_post", "https://api.trello.com/1/actions/a1/reactions", {"shortName": "+1"}, {}),
+    ]
+
+
+def test_argument_errors(app_instance, sent):
+    with pytest.raises(ValueError, match="Missing required parameter 'id'"):
+        app_instance.get_actions_id(None)
+    with pytest.raises(TypeError, match="unexpected keyword argument 'nope'"):
+        app_instance.get_actions_id("a1", nope=1)
+    with pytest.raises(TypeError, match="multiple values for argument 'id'"):
+        app_instance.get_actions_id("a1", id="a2")
+    with pytest.raises(TypeError, match="missing required arguments: text"):
+        app_instance.put_actions_id("a1")
+    assert sent == []
+
+
+def test_fields_profile_fills_unset_fields(app_instance, sent):
+    app_instance.projections = TrelloApp(fields_profile="compact").projections
+    app_instance.get_lists_id_cards("l1")
+    app_instance.get_boards_id("b1", fields="all")
+    app_instance.get_members_id_boards("me", filter="open")
+    assert [params for _, _, _, params in sent] == [
+        {"fields": CARD},
+        {"fields": "all"},
+        {"filter": "open", "fields": BOARD, "organization_fields": "name,displayName"},
+    ]
+    with pytest.raises(ValueError, match="Unknown fields profile"):
+        TrelloApp(fields_profile="tiny")
@@ -0,0 +1,123 @@
+import io
+import json
+import zipfile
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.cache import ResponseCache
+from universal_mcp_trello.exports import ExportRunner, iter_boards
+from universal_mcp_trello.store import BoardStore
+
+EXPORT_URL = "https://trello-exports.example.com/e1.zip"
+
+
+def board(board_id, cards):
+    return {
+        "id": board_id,
+        "name": board_id,
+        "lists": [{"id": f"{board_id}-l", "name": "Todo"}],
+        "cards": [{"id": c, "idList": f"{board_id}-l", "name": c} for c in cards],
+    }
+
+
+def make_archive():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("b1.json", json.dumps(board("b1", ["c1", "c2"])))
+        boards = [board("b2", ["c3"]), board("b3", [])]
+        archive.writestr("more/boards.json", json.dumps(boards))
+        archive.writestr("readme.txt", "not a board")
+    return buffer.getvalue()
+
+
+def test_runs_export_in_background(tmp_path):
+    archive, polls = make_archive(), []
+
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "e1", "status": {"finished": False}})
+        if request.url.path.endswith("/exports"):
+            polls.append(request)
+            finished = len(polls) >= 2
+            stage = "Export_complete" if finished else "Export_in_progress"
+            status = {"finished": finished, "stage": stage}
+            url = EXPORT_URL if finished else None
+            export = {"id": "e1", "status": status, "exportUrl": url}
+            return httpx.Response(200, json=[export])
+        assert str(request.url) == EXPORT_URL
+        return httpx.Response(200, content=iter([archive]))
+
+    store = BoardStore()
+    runner = ExportRunner(tmp_path, store=store, initial_delay=0.001)
+    # Polling must not be answered by the cached first listing.
+    app = TrelloApp(
+        integration=MagicMock(), export_runner=runner, cache=ResponseCache()
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert app.get_organizations_id_exports("acme")[0]["status"]["finished"] is False
+
+    started = app.export_organization("acme")
+    assert started["id"] == "e1" and started["organization_id"] == "acme"
+    job = runner.wait("e1", timeout=10)
+    assert (job.status, job.polls, job.boards_imported) == ("done", 1, 3)
+    assert (tmp_path / "acme-e1.zip").read_bytes() == archive
+    assert app.get_export_job("e1")["bytes"] == len(archive)
+    assert [card["id"] for card in store.cards(board_id="b1")] == ["c1", "c2"]
+    assert [b["id"] for b in iter_boards(job.path)] == ["b1", "b2", "b3"]
+    runner.close()
+
+    with pytest.raises(ValueError, match="Unknown export"):
+        app.get_export_job("nope")
+    with pytest.raises(ValueError, match="export runner"):
+        TrelloApp(integration=MagicMock()).export_organization("acme")
+
+
+def test_export_tools_are_listed_only_with_a_runner(tmp_path):
+    export_tools = {"export_organization", "get_export_job"}
+    names = {tool.__name__ for tool in TrelloApp(integration=MagicMock()).list_tools()}
+    assert names.isdisjoint(export_tools) and "download_attachment" in names
+
+    app = TrelloApp(integration=MagicMock(), export_runner=ExportRunner(tmp_path))
+    assert export_tools <= {tool.__name__ for tool in app.list_tools()}
+    app.export_runner.close()
+
+
+def test_failed_export_is_reported(tmp_path):
+    def handler(request):
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "e2"})
+        status = {"finished": True, "stage": "Export_failed"}
+        return httpx.Response(200, json=[{"id": "e2", "status": status}])
+
+    runner = ExportRunner(tmp_path, initial_delay=0.001)
+    app = TrelloApp(integration=MagicMock(), export_runner=runner)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    app.export_organization("acme")
+    job = runner.wait("e2", timeout=10)
+    assert job.status == "failed" and "Export_failed" in job.error
+    runner.close()
+
+
+def test_forgets_oldest_finished_jobs(tmp_path):
+    started = []
+
+    def handler(request):
+        if request.method == "POST":
+            started.append(f"e{len(started) + 1}")
+            return httpx.Response(200, json={"id": started[-1]})
+        status = {"finished": True, "stage": "Export_failed"}
+        return httpx.Response(200, json=[{"id": e, "status": status} for e in started])
+
+    runner = ExportRunner(tmp_path, initial_delay=0.001, max_jobs=2)
+    app = TrelloApp(integration=MagicMock(), export_runner=runner)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    for _ in range(3):
+        runner.wait(app.export_organization("acme")["id"], timeout=10)
+    with pytest.raises(ValueError, match="Unknown export"):
+        runner.job("e1")
+    assert runner.job("e2").status == "failed"
+    assert runner.wait("e3").status == "failed"
+    runner.close()
@@ -0,0 +1,16 @@
+from unittest.mock import MagicMock
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.manifest import MANIFEST_PATH, build_manifest, dump_manifest, load_manifest
+
+
+def test_manifest_matches_app():
+    """Regenerate with `python -m universal_mcp_trello.manifest` if this fails."""
+    app = TrelloApp(integration=MagicMock())
+    assert MANIFEST_PATH.read_text() == dump_manifest(build_manifest(app._all_tools()))
+
+
+def test_schema_lookup_uses_manifest():
+    app = TrelloApp(integration=MagicMock(), tool_tags=["important"])
+    assert app.tool_schema("get_search") == load_manifest()["get_search"]
+    assert "get_search" in {tool.__name__ for tool in app.list_tools()}
@@ -0,0 +1,93 @@
+import urllib.request
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.metrics import Metrics, endpoint_template
+from universal_mcp_trello.ratelimit import RateLimiter
+
+CARD_ID = "5f1e2d3c4b5a69788796a5b4"
+
+
+def _app(handler, metrics):
+    app = TrelloApp(
+        integration=MagicMock(),
+        fields_profile="all",
+        single_flight=False,
+        rate_limiter=RateLimiter(sleep=lambda seconds: None),
+        metrics=metrics,
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app
+
+
+def _rows(snapshot, name):
+    return {tuple(row["labels"].values()): row for row in snapshot[name]}
+
+
+def test_records_tool_calls_requests_and_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"message": "not found"})
+        if len(calls) == 1:
+            return httpx.Response(429, json={"message": "slow down"})
+        return httpx.Response(200, content=iter([b'{"id": "c1"}']))
+
+    metrics = Metrics()
+    app = _app(handler, metrics)
+    tools = {tool.__name__: tool for tool in app.list_tools()}
+    assert tools["get_cards_id"](CARD_ID) == {"id": "c1"}
+    with pytest.raises(httpx.HTTPStatusError):
+        tools["get_cards_id"]("missing")
+
+    snapshot = metrics.snapshot()
+    tool_calls = _rows(snapshot, "trello_tool_calls_total")
+    assert tool_calls[("get_cards_id", "ok")]["value"] == 1
+    assert tool_calls[("get_cards_id", "error")]["value"] == 1
+    assert _rows(snapshot, "trello_tool_duration_seconds")[("get_cards_id",)]["count"] == 2
+
+    requests = _rows(snapshot, "trello_http_requests_total")
+    assert requests[("GET", "/cards/{id}", "429")]["value"] == 1
+    assert requests[("GET", "/cards/{id}", "200")]["value"] == 1
+    assert requests[("GET", "/cards/{id}", "404")]["value"] == 1
+    retries = _rows(snapshot, "trello_http_retries_total")
+    assert list(retries) == [("GET", "/cards/{id}")]
+    assert retries[("GET", "/cards/{id}")]["value"] == 1
+    received = _rows(snapshot, "trello_http_response_bytes_total")
+    assert received[("GET", "/cards/{id}")]["value"] > len(b'{"id": "c1"}')
+
+
+def test_renders_prometheus_text_and_serves_it():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe_tool("get_cards_id", 0.05, ok=True)
+    metrics.observe_tool("get_cards_id", 0.5, ok=False)
+    metrics.observe_request("PUT", "/cards/{id}", 200, 0.2, request_bytes=40)
+
+    text = metrics.render()
+    assert 'trello_tool_calls_total{tool="get_cards_id",outcome="ok"} 1' in text
+    assert 'trello_tool_duration_seconds_bucket{tool="get_cards_id",le="0.1"} 1' in text
+    assert 'trello_tool_duration_seconds_bucket{tool="get_cards_id",le="+Inf"} 2' in text
+    assert 'trello_tool_duration_seconds_count{tool="get_cards_id"} 2' in text
+    assert "# TYPE trello_http_request_duration_seconds histogram" in text
+    assert 'trello_http_request_bytes_total{method="PUT",endpoint="/cards/{id}"} 40' in text
+
+    server = metrics.serve(port=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url) as response:
+            assert response.read().decode() == metrics.render()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_endpoint_template_hides_ids():
+    assert endpoint_template(f"https://api.trello.com/1/cards/{CARD_ID}/actions") == (
+        "/cards/{id}/actions"
+    )
+    assert endpoint_template("https://api.trello.com/1/batch?urls=/cards/x") == "/batch"
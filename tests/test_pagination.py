@@ -0,0 +1,40 @@
+import pytest
+
+from universal_mcp_trello.pagination import by_cursor, by_page, paginate
+
+ACTIONS = [{"id": f"{i:04d}"} for i in range(2500, 0, -1)]
+
+
+def fetch_before(before, limit=1000):
+    older = [a for a in ACTIONS if before is None or a["id"] < before]
+    return older[:limit]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_cursor_pagination_walks_all_items(prefetch):
+    calls = []
+
+    def fetch(before):
+        calls.append(before)
+        return fetch_before(before)
+
+    assert list(paginate(fetch, None, by_cursor(1000), prefetch=prefetch)) == ACTIONS
+    assert calls == [None, "1501", "0501"]
+
+
+def test_page_pagination_stops_on_short_page_or_last_page():
+    pages = {0: [1, 2], 1: [3, 4], 2: [5]}
+    assert list(paginate(lambda n: pages.get(n), 0, by_page(2))) == [1, 2, 3, 4, 5]
+    assert list(paginate(lambda n: pages.get(n), 0, by_page(2, last_page=0))) == [1, 2]
+
+
+def test_pagination_is_lazy():
+    calls = []
+
+    def fetch(page):
+        calls.append(page)
+        return [page] * 10
+
+    items = paginate(fetch, 0, by_page(10))
+    assert next(items) == 0
+    assert calls == [0]
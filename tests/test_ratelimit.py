@@ -0,0 +1,83 @@
+import httpx
+import pytest
+
+from universal_mcp_trello.ratelimit import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_response(status_code, headers=None):
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", "https://api.trello.com/1/x"))
+
+
+def test_bucket_allows_burst_then_sustained_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(10, 10.0, clock)
+    assert all(bucket.try_acquire() == 0 for _ in range(10))
+    assert bucket.try_acquire() == pytest.approx(1.0)
+    clock.sleep(1.0)
+    assert bucket.try_acquire() == 0
+
+
+def test_limiter_queues_instead_of_failing():
+    clock = FakeClock()
+    limiter = RateLimiter(token_limit=5, key_limit=100, interval=1.0, clock=clock, sleep=clock.sleep)
+    for _ in range(15):
+        limiter.call(lambda: make_response(200))
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_limiter_retries_429_and_reads_headers():
+    clock = FakeClock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    throttled = make_response(429, {"retry-after": "3"})
+    responses = iter([
+        throttled,
+        make_response(200, {"x-rate-limit-api-token-remaining": "0", "x-rate-limit-api-token-max": "100", "x-rate-limit-api-token-interval-ms": "10000"}),
+    ])
+    assert limiter.call(lambda: next(responses)).status_code == 200
+    assert clock.now == pytest.approx(3.0)
+    assert throttled.is_closed  # a dropped streamed response releases its connection
+    assert limiter.token_bucket.try_acquire() == pytest.approx(0.1)
+
+
+def test_limiter_gives_up_after_max_retries():
+    clock = FakeClock()
+    limiter = RateLimiter(max_retries=2, clock=clock, sleep=clock.sleep)
+
+    def send():
+        response = make_response(429)
+        response.raise_for_status()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        limiter.call(send)
+
+
+def test_bucket_grants_token_refilled_by_float_accumulation():
+    clock = FakeClock()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        assert len(sleeps) < 5, "acquire() is spinning"
+        clock.sleep(seconds)
+
+    limiter = RateLimiter(token_limit=10, key_limit=100, interval=10.0, clock=clock, sleep=sleep)
+    while limiter.token_bucket.try_acquire() == 0:
+        pass
+    # Ten refills of 0.1 tokens add up to 0.9999999999999999, not 1.0.
+    for _ in range(10):
+        clock.now += 0.1
+        limiter.token_bucket._refill()
+    assert limiter.token_bucket._tokens < 1
+    limiter.acquire()
+    assert sleeps == []
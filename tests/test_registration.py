@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("universal_mcp.tools")
+
+from universal_mcp.tools import ToolManager  # noqa: E402
+
+from universal_mcp_trello.app import TrelloApp  # noqa: E402
+from universal_mcp_trello.async_app import AsyncTrelloApp  # noqa: E402
+from universal_mcp_trello.registration import manifest_tools  # noqa: E402
+from universal_mcp_trello.schemas import build_schema  # noqa: E402
+
+
+def test_manifest_tools_match_introspected_tools():
+    app = TrelloApp(integration=MagicMock())
+    introspected = ToolManager()
+    introspected.register_tools_from_app(app, tags=["all"])
+    tools = manifest_tools(app)
+    assert [tool.name for tool in tools] == [
+        tool.name for tool in introspected.get_tools_by_app("trello")
+    ]
+    for tool in tools:
+        expected = introspected.get_tool(tool.name)
+        assert tool.description == expected.description
+        assert tool.tags == [tag.lower() for tag in expected.tags]
+        assert tool.is_async == expected.is_async
+        assert tool.parameters.get("required", []) == expected.parameters.get(
+            "required", []
+        )
+        assert tool.parameters["properties"].keys() == expected.parameters[
+            "properties"
+        ].keys()
+
+
+def test_tools_missing_from_the_manifest_are_built_lazily(monkeypatch):
+    monkeypatch.setattr("universal_mcp_trello.app.load_manifest", dict)
+    app = TrelloApp(integration=MagicMock(), tool_names=["get_actions_id"])
+    (tool,) = manifest_tools(app)
+    assert tool.name == "trello_get_actions_id"
+    assert tool.parameters == build_schema(app.get_actions_id)["inputSchema"]
+    assert "arg_model" not in tool.fn_metadata.__dict__
+
+
+def test_arguments_are_validated_on_first_call(monkeypatch):
+    app = AsyncTrelloApp(integration=MagicMock(), tool_names=["get_actions_id"])
+    response = MagicMock(status_code=200, content=b'{"id": "abc"}')
+    monkeypatch.setattr(app, "_get", lambda url, params=None: response)
+    (tool,) = manifest_tools(app)
+    assert "arg_model" not in tool.fn_metadata.__dict__
+
+    assert asyncio.run(tool.run({"id": "abc"})) == {"id": "abc"}
+    assert "arg_model" in tool.fn_metadata.__dict__
+    with pytest.raises(Exception, match="id"):
+        asyncio.run(tool.run({}))
+    app.close()
@@ -0,0 +1,37 @@
+from typing import Any, List, Optional
+
+from universal_mcp_trello.schemas import build_schema, docstring_tags
+
+
+def get_thing(id: str, fields: Optional[List[str]] = None, limit: Optional[int] = 50, extra: Any = None) -> dict[str, Any]:
+    """
+    Get a Thing
+
+    Args:
+        id (string): The ID of the thing
+        fields (array): Which fields to return
+
+    Returns:
+        dict[str, Any]: Success
+
+    Tags:
+        things, Important
+    """
+
+
+def test_build_schema():
+    schema = build_schema(get_thing)
+    assert schema["name"] == "get_thing"
+    assert schema["description"] == "Get a Thing"
+    assert schema["tags"] == docstring_tags(get_thing) == ["things", "important"]
+    assert schema["inputSchema"] == {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "description": "The ID of the thing"},
+            "fields": {"type": "array", "items": {"type": "string"}, "description": "Which fields to return", "default": None},
+            "limit": {"type": "integer", "default": 50},
+            "extra": {"default": None},
+        },
+        "required": ["id"],
+    }
+
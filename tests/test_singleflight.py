@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+from universal_mcp_trello.singleflight import SingleFlight
+
+
+def test_concurrent_duplicates_share_one_call():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"id": "board"}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("GET /boards/b", fetch)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("GET /boards/b", fetch))) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"id": "board"}] * 6
+    assert flight.in_flight() == 0
+    assert flight.do("GET /boards/b", lambda: "fresh") == "fresh"
+
+
+def test_errors_are_shared_and_not_cached():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("k", fail)
+    assert flight.do("k", lambda: 1) == 1
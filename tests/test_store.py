@@ -0,0 +1,76 @@
+import pytest
+
+from universal_mcp_trello.store import BoardStore
+
+BOARD = {
+    "id": "b1",
+    "name": "Ops",
+    "dateLastActivity": "2026-10-01T00:00:00.000Z",
+    "lists": [{"id": "l1", "name": "Todo", "pos": 1, "closed": False}],
+    "labels": [{"id": "x1", "name": "Bug", "color": "red"}],
+    "members": [{"id": "m1", "username": "ada", "fullName": "Ada"}],
+}
+CARDS = [
+    {"id": "c1", "idList": "l1", "name": "Fix", "pos": 1, "closed": False, "idMembers": ["m1"], "due": "2026-10-10T00:00:00.000Z", "dateLastActivity": "2026-10-02T00:00:00.000Z",
+     "checklists": [{"id": "k1", "idCard": "c1", "name": "Steps"}], "customFieldItems": [{"id": "f1", "idModel": "c1", "idCustomField": "cf1"}]},
+    {"id": "c2", "idList": "l1", "name": "Plan", "pos": 2, "closed": False, "idMembers": [], "dateLastActivity": "2026-09-01T00:00:00.000Z"},
+    {"id": "c3", "idList": "l1", "name": "Old", "pos": 3, "closed": True, "idMembers": ["m1"]},
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BoardStore(tmp_path / "boards.db")
+    store.save_board(BOARD, cards=CARDS, cursor="a1")
+    return store
+
+
+def test_queries_use_indexed_columns(store):
+    assert [c["id"] for c in store.cards(board_id="b1")] == ["c1", "c2"]
+    assert [c["id"] for c in store.cards(member_id="m1")] == ["c1"]
+    assert [c["id"] for c in store.cards(member_id="m1", include_closed=True)] == ["c1", "c3"]
+    assert [c["id"] for c in store.cards(due_before="2026-11-01")] == ["c1"]
+    assert [c["id"] for c in store.cards(active_since="2026-10-01")] == ["c1"]
+    assert store.members("b1")[0]["username"] == "ada"
+    assert store.checklists("c1")[0]["name"] == "Steps"
+    assert store.custom_field_items("c1")[0]["idCustomField"] == "cf1"
+
+
+def test_survives_reopen_and_resave(store, tmp_path):
+    store.close()
+    reopened = BoardStore(tmp_path / "boards.db")
+    snapshot, cursor = reopened.load_snapshot("b1")
+    assert cursor == "a1"
+    assert len(snapshot["cards"]) == 3
+    reopened.save_snapshot("b1", {**snapshot, "cards": snapshot["cards"][:1]}, "a2")
+    assert [c["id"] for c in reopened.cards(include_closed=True)] == ["c1"]
+    assert reopened.load_snapshot("b1")[1] == "a2"
+
+
+def test_parquet_export_keeps_one_schema_across_batches(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    store = BoardStore()
+    # The first batch has only null due dates and integer positions.
+    cards = [{"id": f"c{i}", "idList": "l1", "pos": i, "closed": False} for i in range(3)]
+    cards += [{"id": "c9", "idList": "l1", "pos": 2.5, "due": "2026-10-10T00:00:00.000Z", "closed": True}]
+    store.save_board({"id": "b1", "name": "Ops"}, cards=cards)
+
+    paths = store.export_parquet(tmp_path, batch_size=3)
+    table = pq.read_table(tmp_path / "cards.parquet")
+    assert tmp_path / "cards.parquet" in paths
+    assert table.num_rows == 4
+    assert str(table.schema.field("due").type) == "string"
+    assert str(table.schema.field("pos").type) == "double"
+    assert table.column("due").to_pylist()[-1] == "2026-10-10T00:00:00.000Z"
+    assert table.column("closed").to_pylist() == [False, False, False, True]
+
+
+def test_snapshot_replaces_board_members(store):
+    snapshot, cursor = store.load_snapshot("b1")
+    store.save_snapshot("b1", snapshot, "a2")
+    assert [m["id"] for m in store.members("b1")] == ["m1"]  # kept without member data
+
+    snapshot["board"]["members"] = [{"id": "m2", "username": "bob", "fullName": "Bob"}]
+    store.save_snapshot("b1", snapshot, "a3")
+    assert [m["id"] for m in store.members("b1")] == ["m2"]
+    assert [row["id"] for row in store.iter_rows("members")] == ["m2"]
@@ -0,0 +1,86 @@
+import httpx
+import pytest
+
+from universal_mcp_trello.sync import BoardSync, JsonSnapshotStore
+
+
+class FakeApp:
+    base_url = "https://api.trello.com/1"
+
+    def __init__(self):
+        self.board = {"id": "b1", "name": "Ops", "lists": [{"id": "l1", "pos": 1}, {"id": "l2", "pos": 2}], "labels": []}
+        self.cards = [{"id": "c1", "idList": "l1", "name": "Deploy", "pos": 1, "closed": False}]
+        self.actions = [{"id": "a1", "type": "createCard", "data": {"board": {"id": "b1"}, "card": {"id": "c1"}}}]
+        self.full_fetches = 0
+        self.reject_cursor = False
+
+    def get_boards_id_actions(self, boardId, limit=None):
+        return self.actions[-1:][::-1]
+
+    def get_boards_id(self, id, lists=None, labels=None, members=None):
+        self.full_fetches += 1
+        return self.board
+
+    def _get_json(self, url, params=None):
+        return self.cards
+
+    def iter_boards_id_actions(self, boardId, since=None):
+        if self.reject_cursor:
+            request = httpx.Request("GET", self.base_url)
+            raise httpx.HTTPStatusError("bad cursor", request=request, response=httpx.Response(400, request=request))
+        ids = [a["id"] for a in self.actions]
+        if since not in ids:  # a date cursor; every fake action is newer
+            return iter(self.actions[::-1])
+        return iter(self.actions[ids.index(since) + 1 :][::-1])
+
+    def act(self, action_id, kind, **data):
+        self.actions.append({"id": action_id, "type": kind, "data": {"board": {"id": "b1"}, **data}})
+
+
+@pytest.fixture
+def app():
+    return FakeApp()
+
+
+def test_incremental_sync_applies_only_new_actions(app, tmp_path):
+    sync = BoardSync(app, JsonSnapshotStore(tmp_path))
+    assert sync.sync("b1").full
+
+    app.act("a2", "updateCard", card={"id": "c1", "name": "Deploy v2"})
+    app.act("a3", "updateCard", card={"id": "c1"}, listBefore={"id": "l1"}, listAfter={"id": "l2"})
+    result = sync.sync("b1")
+    assert (result.full, result.applied, result.cursor) == (False, 2, "a3")
+    assert sync.mirror.cards["c1"]["name"] == "Deploy v2"
+    assert sync.mirror.cards["c1"]["idList"] == "l2"
+    assert app.full_fetches == 1
+
+    # A new process resumes from the persisted snapshot and cursor.
+    app.act("a4", "updateCard", card={"id": "c1", "closed": True})
+    resumed = BoardSync(app, JsonSnapshotStore(tmp_path))
+    assert resumed.sync("b1").applied == 1
+    assert resumed.mirror.board_cards("b1") == []
+    assert app.full_fetches == 1
+
+
+def test_falls_back_to_full_sync_on_gaps(app, tmp_path):
+    sync = BoardSync(app, JsonSnapshotStore(tmp_path), max_actions=1)
+    sync.sync("b1")
+    app.act("a2", "updateCard", card={"id": "c1", "name": "x"})
+    app.act("a3", "updateCard", card={"id": "c1", "name": "y"})
+    assert sync.sync("b1").full
+
+    app.reject_cursor = True
+    assert sync.sync("b1").full
+    assert app.full_fetches == 3
+
+
+def test_board_without_actions_gets_a_date_cursor(app, tmp_path):
+    app.actions = []
+    app.board["dateLastActivity"] = "2026-10-01T12:00:00.000Z"
+    sync = BoardSync(app, JsonSnapshotStore(tmp_path))
+    assert sync.sync("b1").cursor == "2026-10-01T12:00:00.000Z"
+
+    app.act("a1", "updateCard", card={"id": "c1", "name": "Deploy v2"})
+    result = sync.sync("b1")
+    assert (result.full, result.applied, result.cursor) == (False, 1, "a1")
+    assert app.full_fetches == 1
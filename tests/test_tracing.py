@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+from universal_mcp_trello.app import TrelloApp  # noqa: E402
+from universal_mcp_trello.cache import ResponseCache  # noqa: E402
+from universal_mcp_trello.ratelimit import RateLimiter  # noqa: E402
+from universal_mcp_trello.tracing import configure, get_tracer  # noqa: E402
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+def _app(exporter, handler, **kwargs):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    app = TrelloApp(
+        integration=MagicMock(),
+        fields_profile="all",
+        rate_limiter=RateLimiter(sleep=lambda seconds: None),
+        tracer=get_tracer(provider),
+        **kwargs,
+    )
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return {tool.__name__: tool for tool in app.list_tools()}, app
+
+
+def test_tool_span_contains_cache_http_and_decode_spans(exporter):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429)
+        return httpx.Response(200, content=iter([b'{"id": "c1"}']))
+
+    tools, _ = _app(exporter, handler, cache=ResponseCache())
+    assert tools["get_cards_id"]("c1") == {"id": "c1"}
+    assert tools["get_cards_id"]("c1") == {"id": "c1"}  # served from the cache
+
+    spans = exporter.get_finished_spans()
+    first = [s for s in spans if s.context.trace_id == spans[0].context.trace_id]
+    by_name = {}
+    for s in first:
+        by_name.setdefault(s.name, []).append(s)
+    (tool,) = by_name["tool get_cards_id"]
+    assert tool.attributes["trello.tool"] == "get_cards_id"
+    assert by_name["cache lookup"][0].attributes["trello.cache.result"] == "miss"
+    retried, sent = by_name["GET /cards/{id}"]
+    assert retried.attributes["http.response.status_code"] == 429
+    assert retried.status.status_code is StatusCode.ERROR
+    assert sent.attributes["http.response.status_code"] == 200
+    assert sent.attributes["http.request.resend_count"] == 1
+    assert sent.attributes["http.response.body.size"] == len(b'{"id": "c1"}')
+    assert all(s.parent.span_id == tool.context.span_id for s in first if s is not tool)
+    assert "decode" in by_name
+
+    second = [s for s in spans if s not in first]
+    assert {s.name for s in second} == {"tool get_cards_id", "cache lookup", "decode"}
+    lookup = next(s for s in second if s.name == "cache lookup")
+    assert lookup.attributes["trello.cache.result"] == "hit"
+
+
+def test_batched_gets_nest_under_their_tool_spans(exporter):
+    def handler(request):
+        assert request.url.path == "/1/batch"
+        urls = request.url.params["urls"].split(",")
+        return httpx.Response(200, json=[{"200": {"id": url[-2:]}} for url in urls])
+
+    tools, app = _app(exporter, handler, single_flight=False)
+    with app.batch() as batch:
+        futures = [batch.submit(tools["get_cards_id"], card) for card in ("c1", "c2")]
+    assert sorted(f.result()["id"] for f in futures) == ["c1", "c2"]
+
+    spans = exporter.get_finished_spans()
+    tools_by_id = {s.context.span_id: s for s in spans if s.name == "tool get_cards_id"}
+    batched = [s for s in spans if s.name == "batch"]
+    assert len(batched) == 2
+    assert {s.parent.span_id for s in batched} == set(tools_by_id)
+    assert {s.attributes["trello.endpoint"] for s in batched} == {"/cards/{id}"}
+    (sent,) = [s for s in spans if s.name == "GET /batch"]
+    assert sent.attributes["http.response.status_code"] == 200
+
+
+def test_failed_tool_span_records_the_error(exporter):
+    tools, _ = _app(exporter, lambda request: httpx.Response(404))
+    with pytest.raises(httpx.HTTPStatusError):
+        tools["get_cards_id"]("missing")
+    tool = next(s for s in exporter.get_finished_spans() if s.name.startswith("tool"))
+    assert tool.status.status_code is StatusCode.ERROR
+    assert tool.events[0].name == "exception"
+
+
+def test_streamed_reads_get_a_decode_span(exporter):
+    body = b'[{"id": "a1"}, {"id": "a2"}]'
+    tools, app = _app(exporter, lambda request: httpx.Response(200, content=body))
+    assert [a["id"] for a in app.stream("get_boards_id_actions", "b1")] == ["a1", "a2"]
+    (decode,) = [s for s in exporter.get_finished_spans() if s.name == "decode"]
+    assert decode.attributes["trello.decode.items"] == 2
+
+    tools, app = _app(exporter, lambda request: httpx.Response(200, content=b"[{"))
+    with pytest.raises(ValueError):
+        list(app.stream("get_boards_id_actions", "b1"))
+    failed = [s for s in exporter.get_finished_spans() if s.name == "decode"][-1]
+    assert failed.status.status_code is StatusCode.ERROR
+
+
+def test_console_exporter_keeps_stdout_clear(capsys):
+    provider = configure("console")
+    with get_tracer(provider).start_as_current_span("tool get_cards_id"):
+        pass
+    provider.shutdown()
+    out, err = capsys.readouterr()
+    assert out == "" and "tool get_cards_id" in err
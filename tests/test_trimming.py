@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.codec import dumps
+from universal_mcp_trello.trimming import ResultTrimmer
+
+
+def test_trim_drops_collapses_and_shortens():
+    action = {
+        "id": "a1",
+        "memberCreator": {"id": "m1", "fullName": "Ada"},
+        "data": {"board": {"id": "b1", "name": "Road"}, "card": {"id": "c1", "desc": ""}},
+        "members": [{"id": "m1"}, {"id": "m2"}],
+        "idLabels": [],
+        "due": None,
+        "desc": "x" * 12,
+    }
+    assert ResultTrimmer(max_text=5).trim([action]) == [
+        {
+            "id": "a1",
+            "memberCreator": "m1",
+            "data": {"board": "b1", "card": {"id": "c1"}},
+            "members": ["m1", "m2"],
+            "desc": "xxxxx… [7 more characters]",
+        }
+    ]
+
+
+def test_fit_pages_large_results():
+    cards = [{"id": f"c{i}", "name": "n" * 50} for i in range(40)]
+    trimmer = ResultTrimmer(max_bytes=1000)
+    first = trimmer(cards)
+    assert len(dumps(first)) <= 1000
+    assert first["_remaining"] == 40 - len(first["items"])
+    seen = list(first["items"])
+    page = first
+    while page["_continuation"]:
+        page = trimmer.resume(page["_continuation"])
+        assert set(page) == {"items", "_remaining", "_continuation"}
+        seen += page["items"]
+    assert seen == cards and page["_remaining"] == 0
+    with pytest.raises(ValueError, match="Unknown or expired"):
+        trimmer.resume(first["_continuation"])
+
+    found = trimmer({"options": {"terms": []}, "cards": cards, "boards": [{"id": "b"}]})
+    assert found["boards"] == [{"id": "b"}]
+    assert found["_remaining"] == 40 - len(found["cards"])
+
+
+def test_list_tools_trims_results(monkeypatch):
+    app = TrelloApp(integration=MagicMock(), result_trimmer=ResultTrimmer(max_bytes=400))
+    cards = [{"id": f"c{i}", "desc": "", "name": "n" * 50} for i in range(10)]
+    monkeypatch.setattr(app, "_call_endpoint", lambda route, values, model=None: cards)
+    tools = {tool.__name__: tool for tool in app.list_tools()}
+    page = tools["get_lists_id_cards"]("l1")
+    assert "desc" not in page["items"][0]
+    rest = tools["get_more_results"](page["_continuation"])
+    assert rest["items"][0]["id"] == f"c{len(page['items'])}"
+    assert app.get_lists_id_cards("l1") is cards
+    assert "get_more_results" not in [t.__name__ for t in TrelloApp().list_tools()]
+
+
+def test_fit_enforces_the_cap_on_items_too_large_for_a_page():
+    trimmer = ResultTrimmer(max_bytes=500, max_text=None)
+    big = {"id": "c1", "name": "n" * 2000, "desc": "d" * 2000}
+    other = {"id": "c2", "name": "m" * 300}
+    page = trimmer([big, other])
+    assert len(dumps(page)) <= 500
+    (first,) = page["items"]
+    assert first["id"] == "c1" and first["name"].startswith("n" * 16)
+    assert "more characters]" in first["desc"]
+    assert trimmer.resume(page["_continuation"])["items"] == [other]
+
+    single = trimmer({"id": "c1", "desc": "d" * 2000})
+    assert len(dumps(single)) <= 500 and single["desc"].startswith("ddd")
+
+    huge = {"id": "c1", **{f"k{i}": i for i in range(200)}}
+    assert trimmer(huge) == {"_too_large": len(dumps(huge)), "id": "c1"}
+
+
+def test_leaves_results_within_the_limit_and_requested_fields_alone():
+    board = {
+        "id": "b1",
+        "options": {},
+        "members": [{"id": "m1", "fullName": "Ada"}],
+        "organization": {"id": "o1", "name": "Acme"},
+    }
+    trimmer = ResultTrimmer(max_bytes=10_000)
+    assert trimmer(board) is board
+
+    cards = [
+        {"id": f"c{i}", "board": {"id": "b1"}, "members": [{"id": "m1"}]}
+        for i in range(3)
+    ]
+    big = {**board, "cards": cards, "desc": "d" * 2000}
+    small = ResultTrimmer(max_bytes=1000, max_text=10)
+    fitted = small(big)
+    assert fitted["members"] == board["members"]  # a key of the result itself
+    assert fitted["cards"][0]["board"] == "b1"
+    assert fitted["cards"][0]["members"] == ["m1"]
+    assert "options" not in fitted
+
+    kept = small(big, requested=["board_fields"])
+    assert kept["cards"][0]["board"] == {"id": "b1"}
+
+
+def test_list_tools_keeps_the_objects_a_call_asked_for(monkeypatch):
+    app = TrelloApp(integration=MagicMock(), result_trimmer=ResultTrimmer(max_bytes=600))
+    ada = {"id": "m1", "fullName": "Ada"}
+    cards = [
+        {"id": f"c{i}", "name": "n" * 40, "board": {"id": "b1"}, "members": [ada]}
+        for i in range(20)
+    ]
+    board = {"id": "b1", "members": [ada], "cards": cards}
+    monkeypatch.setattr(app, "_call_endpoint", lambda route, values, model=None: board)
+    tools = {tool.__name__: tool for tool in app.list_tools()}
+    page = tools["get_boards_id"]("b1", cards="all", members="all")
+    assert page["members"] == [ada]
+    assert page["cards"][0]["members"] == [ada]
+    assert page["cards"][0]["board"] == "b1"
@@ -0,0 +1,105 @@
+import io
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from universal_mcp.applications import APIApplication
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.uploads import CHUNK_SIZE, open_upload
+
+DATA = bytes(range(256)) * 1000  # a few chunks
+
+
+@pytest.fixture
+def app_and_requests():
+    requests = []
+
+    def handler(request):
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, json={"id": "att1"})
+
+    app = TrelloApp(integration=MagicMock(), fields_profile="all")
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return app, requests
+
+
+def test_uploads_path_as_multipart_with_progress(app_and_requests, tmp_path):
+    app, requests = app_and_requests
+    path = tmp_path / "report.pdf"
+    path.write_bytes(DATA)
+    progress = []
+    result = app.upload(
+        "post_cards_id_attachments",
+        "c1",
+        name="Report",
+        file=str(path),
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+    assert result == {"id": "att1"}
+    [request] = requests
+    assert request.url.params["name"] == "Report"
+    assert "file" not in request.url.params
+    assert request.headers["content-type"].startswith("multipart/form-data")
+    assert int(request.headers["content-length"]) == len(request.content)
+    assert b'filename="report.pdf"' in request.content and DATA in request.content
+    assert progress[-1] == (len(DATA), len(DATA))
+    assert all(b - a <= CHUNK_SIZE for (a, _), (b, _) in zip([(0, 0)] + progress, progress))
+
+
+def test_uploads_buffers_and_file_objects(app_and_requests):
+    app, requests = app_and_requests
+    app.membersidavatar("me", memoryview(DATA))
+    app.post_organizations_id_logo("o1", file=io.BufferedReader(io.BytesIO(DATA)))
+    assert all(DATA in request.content for request in requests)
+    app.post_cards_id_attachments("c1", url="https://example.com/a")
+    assert requests[-1].url.params["url"] == "https://example.com/a"
+    assert requests[-1].content == b""
+
+    with pytest.raises(TypeError, match="not a path"):
+        app.post_cards_id_attachments("c1", file="/etc/passwd")
+    with pytest.raises(TypeError, match="Cannot upload int"):
+        app.membersidavatar("me", 42)
+    with pytest.raises(ValueError, match="does not upload"):
+        app.upload("get_cards_id", "c1")
+
+
+def test_unsized_sources_have_no_total():
+    class Pipe(io.RawIOBase):
+        def readable(self):
+            return True
+
+        def readinto(self, b):
+            return 0
+
+    with open_upload(Pipe()) as (filename, reader):
+        assert (filename, reader.total) == ("file", None)
+
+
+def test_multipart_uploads_carry_their_boundary_with_app_headers():
+    # The real base class sends a JSON Content-Type with every request.
+    base_headers = {"Authorization": "Bearer k", "Content-Type": "application/json"}
+    requests = []
+
+    def handler(request):
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, json={"id": "att1"})
+
+    with patch.object(APIApplication, "_get_headers", return_value=base_headers):
+        app = TrelloApp(integration=MagicMock(), fields_profile="all")
+        headers = app._get_headers()
+        app._client = httpx.Client(
+            transport=httpx.MockTransport(handler), headers=headers
+        )
+        app.post_cards_id_attachments("c1", file=DATA)
+    assert "content-type" not in {key.lower() for key in headers}
+    assert base_headers["Content-Type"] == "application/json"
+    [upload] = requests
+    content_type = upload.headers["content-type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    boundary = content_type.split("boundary=")[1].encode()
+    assert upload.content.startswith(b"--" + boundary) and DATA in upload.content
+    assert upload.headers["authorization"] == "Bearer k"
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from universal_mcp_trello.app import TrelloApp
+from universal_mcp_trello.mirror import BoardMirror
+from universal_mcp_trello.webhooks import WebhookReceiver, sign
+
+SECRET = "app-secret"
+CALLBACK_URL = "https://example.com/trello/webhook"
+BOARD = {"id": "b1", "name": "Roadmap"}
+LISTS = [{"id": "l1", "pos": 1}, {"id": "l2", "pos": 2}]
+CARDS = [
+    {"id": "c1", "idList": "l1", "pos": 1, "name": "One", "closed": False, "idLabels": []},
+    {"id": "c2", "idList": "l1", "pos": 2, "name": "Two", "closed": False, "idLabels": []},
+]
+
+# Payloads as Trello posts them to the callback URL.
+RECORDED = [
+    {"action": {"id": "a1", "type": "updateCard", "data": {"board": {"id": "b1"}, "card": {"id": "c1", "idList": "l2"}, "listBefore": {"id": "l1"}, "listAfter": {"id": "l2"}}}},
+    {"action": {"id": "a2", "type": "createCard", "data": {"board": {"id": "b1"}, "list": {"id": "l1"}, "card": {"id": "c3", "name": "Three"}}}},
+    {"action": {"id": "a3", "type": "updateCard", "data": {"board": {"id": "b1"}, "card": {"id": "c2", "closed": True}, "old": {"closed": False}}}},
+    {"action": {"id": "a4", "type": "addLabelToCard", "data": {"board": {"id": "b1"}, "card": {"id": "c1"}, "label": {"id": "x1", "name": "Bug"}}}},
+]
+
+
+def post(app, body, signature=None, method="POST"):
+    """Stand-in for Trello: deliver one callback to the ASGI app."""
+    headers = [(b"content-type", b"application/json")]
+    if signature:
+        headers.append((b"x-trello-webhook", signature.encode()))
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app({"type": "http", "method": method, "headers": headers}, receive, send))
+    return sent[0]["status"]
+
+
+@pytest.fixture
+def mirror():
+    mirror = BoardMirror()
+    mirror.load(BOARD, lists=LISTS, cards=CARDS)
+    return mirror
+
+
+def test_recorded_payloads_update_mirror(mirror):
+    receiver = WebhookReceiver(mirror, SECRET, CALLBACK_URL)
+    assert post(receiver, b"", method="HEAD") == 200
+    for payload in RECORDED:
+        body = json.dumps(payload).encode()
+        assert post(receiver, body, sign(SECRET, body, CALLBACK_URL)) == 200
+
+    assert [c["id"] for c in mirror.list_cards("l1")] == ["c3"]
+    assert [c["id"] for c in mirror.list_cards("l2")] == ["c1"]
+    assert [c["id"] for c in mirror.board_cards("b1")] == ["c3", "c1"]
+    assert mirror.cards["c1"]["idLabels"] == ["x1"]
+
+
+def test_bad_signature_is_rejected(mirror):
+    receiver = WebhookReceiver(mirror, SECRET, CALLBACK_URL)
+    body = json.dumps(RECORDED[0]).encode()
+    assert post(receiver, body, sign("wrong", body, CALLBACK_URL)) == 401
+    assert post(receiver, body) == 401
+    assert mirror.cards["c1"]["idList"] == "l1"
+
+
+def test_replayed_action_is_ignored(mirror):
+    assert mirror.apply_action(RECORDED[3]["action"])
+    assert not mirror.apply_action(RECORDED[3]["action"])
+    assert mirror.cards["c1"]["idLabels"] == ["x1"]
+
+
+def test_malformed_action_is_skipped_and_acknowledged(mirror):
+    seen = []
+    receiver = WebhookReceiver(mirror, None, CALLBACK_URL, on_action=seen.append)
+    action = {"id": "a9", "type": "createCard", "data": {"board": {"id": "b1"}, "card": {"name": "No id"}}}
+    assert post(receiver, json.dumps({"action": action}).encode()) == 200
+    assert seen == []
+    assert len(mirror.cards) == 2
+
+
+def test_app_answers_only_default_reads_from_mirror(mirror):
+    fetched = []
+
+    def handler(request):
+        fetched.append(dict(request.url.params))
+        return httpx.Response(200, json=[])
+
+    app = TrelloApp(integration=MagicMock(), mirror=mirror)
+    app._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert app.get_lists_id_cards("l1") == [dict(card, idBoard="b1") for card in CARDS]
+    app.projections = {"get_lists_id_cards": {"fields": "name"}}
+    assert app.get_lists_id_cards("l1") == [{"id": "c1", "name": "One"}, {"id": "c2", "name": "Two"}]
+    assert fetched == []
+
+    app.projections = {"get_lists_id_cards": {"filter": "closed"}}
+    assert app.get_lists_id_cards("l1") == []
+    assert fetched == [{"filter": "closed"}]